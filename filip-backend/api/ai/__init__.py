@@ -1,6 +1,7 @@
-from .skill_gap_graph import LLMUsage, run_skill_gap_pipeline
+from .skill_gap_graph import LLMUsage, run_skill_gap_pipeline, stream_skill_gap_pipeline
 
 __all__ = [
     "LLMUsage",
     "run_skill_gap_pipeline",
+    "stream_skill_gap_pipeline",
 ]
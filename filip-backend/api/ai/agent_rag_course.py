@@ -1,5 +1,4 @@
 import datetime
-import json
 import re
 import logging
 import asyncio
@@ -8,9 +7,12 @@ import time
 
 from langchain.agents import AgentType, Tool, initialize_agent
 from langchain.chains import RetrievalQA
-from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
-from langchain_postgres.vectorstores import PGVector
 
+from api.ai.course_filters import CourseFilters
+from api.ai.vector_stores import get_course_store
+from api.services.course_enrichment import get_course_enrichments, lookup_enrichment
+from api.utils.embedding import get_request_embeddings
+from api.utils.llm_clients import get_chat_llm
 from filip import settings
 
 # Import validation system
@@ -28,31 +30,17 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
-def get_retriever():
-    # First try to connect to existing collection
-    vectorstore = PGVector.from_existing_index(
-        embedding=AzureOpenAIEmbeddings(
-            openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-            model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-        ),
-        connection=settings.PGVECTOR_CONNECTION,
-        collection_name="course",
-    )
-    
+def get_retriever(filters: Optional[CourseFilters] = None):
+    # Shared, long-lived course store (PGVector or the memory-mapped index),
+    # or a SQL-filtered search over UdemyCourse when filters are given
+    vectorstore = get_course_store(filters)
+
     return vectorstore.as_retriever(search_type="similarity", search_kwargs={"k": 5})
 
 
-def build_rag_chain():
-    retriever = get_retriever()
-    llm = AzureChatOpenAI(
-        model=settings.AZURE_OPENAI_CHAT_MODEL,
-        openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-        api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-        temperature=0,
-    )
+def build_rag_chain(filters: Optional[CourseFilters] = None):
+    retriever = get_retriever(filters)
+    llm = get_chat_llm()
     return RetrievalQA.from_chain_type(
         llm=llm, retriever=retriever, return_source_documents=True
     )
@@ -73,38 +61,25 @@ def extract_learning_path_name(text: str) -> str:
     return "Custom Learning Path"
 
 
-def get_course_tool() -> Tool:
-    rag_chain = build_rag_chain()
+def get_course_tool(filters: Optional[CourseFilters] = None) -> Tool:
+    rag_chain = build_rag_chain(filters)
 
     def structured_course_lookup(input: str) -> dict:
         result = rag_chain.invoke({"query": input})
+        source_documents = result.get("source_documents", [])
+
+        # Highlights and related topics are precomputed per course (enrich_courses);
+        # the LLM is only called for courses that are missing or stale.
+        enrichments = get_course_enrichments(
+            course_ids=[str(doc.metadata.get("course_id", "")) for doc in source_documents],
+            urls=[doc.metadata.get("url", "") for doc in source_documents],
+        )
+
         courses = []
-        for doc in result.get("source_documents", []):
+        for doc in source_documents:
             md = doc.metadata
             url = md.get("url", "")
-            # Ask the LLM to extract details from the URL
-            prompt = (
-                f"Visit the following course page:\n{url}\n\n"
-                "Extract and return these fields in JSON format:\n"
-                "1. 'course_highlights': A bullet list from the 'What you'll learn' section\n"
-                "2. 'related_topics': Broader topics or categories this course relates to\n\n"
-                "Respond in this format: "
-                '{"course_highlights": [...], "related_topics": [...]}'
-            )
-            scraper = AzureChatOpenAI(
-                model=settings.AZURE_OPENAI_CHAT_MODEL,
-                openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-                api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-                temperature=0,
-            )
-            scraped = scraper.invoke(prompt).content
-            try:
-                if isinstance(scraped, str):
-                    scraped_json = json.loads(scraped)
-            except Exception as e:
-                print(f"Error: {e}")
-                scraped_json = {"course_highlights": [], "related_topics": []}
+            enrichment = lookup_enrichment(enrichments, str(md.get("course_id", "")), url)
 
             courses.append(
                 {
@@ -114,11 +89,13 @@ def get_course_tool() -> Tool:
                     "course_description": doc.page_content,
                     "course_title": md.get("title", ""),
                     "course_duration": md.get("duration", ""),
+                    "course_duration_hours": md.get("duration_hours"),
+                    "course_question_count": md.get("question_count"),
                     "course_instructor": md.get("instructors", ""),
                     "course_price": md.get("price", ""),
                     "course_url": url,
-                    "course_skills": scraped_json["related_topics"],
-                    "course_highlights": scraped_json["course_highlights"],
+                    "course_skills": list(enrichment["related_topics"]),
+                    "course_highlights": list(enrichment["highlights"]),
                     "course_provider": md.get("provider", "Udemy"),
                     "course_students": md.get("students", 0),
                 }
@@ -138,26 +115,22 @@ def get_course_tool() -> Tool:
     )
 
 
-def get_agent():
-    tools = [get_course_tool()]
-    llm = AzureChatOpenAI(
-        model=settings.AZURE_OPENAI_CHAT_MODEL,
-        openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-        api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-        temperature=0,
-    )
+def get_agent(filters: Optional[CourseFilters] = None):
+    tools = [get_course_tool(filters)]
+    llm = get_chat_llm()
     return initialize_agent(
         tools, llm, agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION, verbose=True
     )
 
 
-def get_recommendations_for_skills(skills: list[dict]) -> dict:
+def get_recommendations_for_skills(skills: list[dict],
+                                   filters: Optional[CourseFilters] = None) -> dict:
     """
     Legacy course recommendation function without validation
     
     Args:
         skills: List of skill dictionaries with name/level information
+        filters: Level/duration/price/provider constraints applied in SQL
         
     Returns:
         Dictionary containing recommendations and courses
@@ -165,7 +138,7 @@ def get_recommendations_for_skills(skills: list[dict]) -> dict:
     try:
         logger.info(f"Getting legacy course recommendations for {len(skills)} skills")
         
-        agent = get_agent()
+        agent = get_agent(filters)
         combined_query_parts = []
         skill_names = []
 
@@ -230,7 +203,8 @@ def get_recommendations_for_skills(skills: list[dict]) -> dict:
 
 def get_validated_recommendations_for_skills(skills: list[dict], 
                                            use_enhanced_validation: bool = True,
-                                           validation_config: dict = None) -> dict:
+                                           validation_config: dict = None,
+                                           filters: Optional[CourseFilters] = None) -> dict:
     """
     Get course recommendations with comprehensive validation system
     
@@ -238,13 +212,14 @@ def get_validated_recommendations_for_skills(skills: list[dict],
         skills: List of skill dictionaries with name/level information
         use_enhanced_validation: Whether to use the enhanced validation agent
         validation_config: Custom validation configuration
+        filters: Level/duration/price/provider constraints applied in SQL
         
     Returns:
         Dictionary containing recommendations, courses, and validation results
     """
     if not VALIDATION_AVAILABLE:
         logger.warning("Validation system not available, using legacy recommendations")
-        return get_recommendations_for_skills(skills)
+        return get_recommendations_for_skills(skills, filters)
     
     try:
         start_time = time.time()
@@ -260,29 +235,20 @@ def get_validated_recommendations_for_skills(skills: list[dict],
             "api_version": settings.AZURE_OPENAI_API_VERSION
         }
         
-        # Get vector store
-        vectorstore = PGVector.from_existing_index(
-            embedding=AzureOpenAIEmbeddings(
-                openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-                api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-                model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-            ),
-            connection=settings.PGVECTOR_CONNECTION,
-            collection_name="course",
-        )
+        # Get shared vector store (filtered in SQL when filters are given)
+        vectorstore = get_course_store(filters)
         
         if use_enhanced_validation:
             # Use enhanced validation system
-            return _run_enhanced_validation(skills, azure_config, vectorstore, validation_config)
+            return _run_enhanced_validation(skills, azure_config, vectorstore, validation_config, filters)
         else:
             # Use simple validation system
-            return _run_simple_validation(skills, azure_config, vectorstore, validation_config)
+            return _run_simple_validation(skills, azure_config, vectorstore, validation_config, filters)
             
     except Exception as e:
         logger.error(f"Validated recommendations failed: {str(e)}")
         # Fallback to legacy system
-        result = get_recommendations_for_skills(skills)
+        result = get_recommendations_for_skills(skills, filters)
         result["validation"] = {
             "is_valid": False,
             "overall_score": 0.0,
@@ -296,7 +262,8 @@ def get_validated_recommendations_for_skills(skills: list[dict],
 
 
 def _run_enhanced_validation(skills: list[dict], azure_config: dict, 
-                           vectorstore, validation_config: dict = None) -> dict:
+                           vectorstore, validation_config: dict = None,
+                           filters: Optional[CourseFilters] = None) -> dict:
     """Run enhanced validation with regeneration capabilities"""
     try:
         # Determine validation mode
@@ -354,20 +321,21 @@ def _run_enhanced_validation(skills: list[dict], azure_config: dict,
         else:
             # Enhanced validation failed, fallback to simple
             logger.warning("Enhanced validation failed, falling back to simple validation")
-            return _run_simple_validation(skills, azure_config, vectorstore, validation_config)
+            return _run_simple_validation(skills, azure_config, vectorstore, validation_config, filters)
             
     except Exception as e:
         logger.error(f"Enhanced validation failed: {str(e)}")
         # Fallback to simple validation
-        return _run_simple_validation(skills, azure_config, vectorstore, validation_config)
+        return _run_simple_validation(skills, azure_config, vectorstore, validation_config, filters)
 
 
 def _run_simple_validation(skills: list[dict], azure_config: dict, 
-                         vectorstore, validation_config: dict = None) -> dict:
+                         vectorstore, validation_config: dict = None,
+                         filters: Optional[CourseFilters] = None) -> dict:
     """Run simple validation without regeneration"""
     try:
         # Get basic recommendations first
-        agent = get_agent()
+        agent = get_agent(filters)
         combined_query_parts = []
         skill_names = []
 
@@ -425,7 +393,7 @@ def _run_simple_validation(skills: list[dict], azure_config: dict,
     except Exception as e:
         logger.error(f"Simple validation failed: {str(e)}")
         # Final fallback to legacy system
-        result = get_recommendations_for_skills(skills)
+        result = get_recommendations_for_skills(skills, filters)
         result["validation"] = {
             "is_valid": False,
             "overall_score": 0.0,
@@ -443,24 +411,11 @@ def _simple_validate_response(query: str, response: str, azure_config: dict,
     """Simple validation without async operations"""
     try:
         # Initialize components
-        embeddings = AzureOpenAIEmbeddings(
-            openai_api_version=azure_config["api_version"],
-            azure_endpoint=azure_config["azure_endpoint"],
-            api_key=azure_config["embeddings_api_key"],
-            model=azure_config["embeddings_deployment"],
-        )
-        
-        llm = AzureChatOpenAI(
-            model=azure_config["deployment_name"],
-            openai_api_version=azure_config["api_version"],
-            azure_endpoint=azure_config["azure_endpoint"],
-            api_key=azure_config["api_key"],
-            temperature=0,
-        )
+        embeddings = get_request_embeddings(azure_config["embeddings_deployment"])
+        llm = get_chat_llm(deployment=azure_config["deployment_name"])
         
-        # Get embeddings for semantic similarity
-        query_embedding = embeddings.embed_query(query)
-        response_embedding = embeddings.embed_query(response)
+        # Get embeddings for semantic similarity in one call
+        query_embedding, response_embedding = embeddings.embed_documents([query, response])
         
         # Calculate cosine similarity
         def cosine_similarity(vec1, vec2):
@@ -1,11 +1,10 @@
 import json
+import logging
 
 import numpy as np
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.tools import tool
-from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
-from langchain_postgres.vectorstores import PGVector
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.prebuilt import create_react_agent
 from sklearn.metrics.pairwise import cosine_similarity
@@ -20,8 +19,15 @@ from typing_extensions import (
     cast,
 )
 
+from api.ai.vector_stores import JOBPOST_COLLECTION, get_vector_store, search_by_query
+from api.ai.role_profiles import find_role_profile
+from api.ai.skill_canonicalization import canonicalize_skills
+from api.ai.skill_graph import skill_graph
 from api.types import SkillGap
-from filip import settings
+from api.utils.embedding import get_request_embeddings
+from api.utils.llm_clients import get_chat_llm
+
+logger = logging.getLogger(__name__)
 
 
 def _skills_to_str(current_skills: List[Dict[str, str]]) -> str:
@@ -33,29 +39,41 @@ def _skills_to_str(current_skills: List[Dict[str, str]]) -> str:
 @tool
 def fetch_similar_role_skills(
     target_goal: Annotated[str, "Job title or free-form role description."], k: int = 10
-) -> List[str]:
+) -> List[Dict[str, Any]]:
     """
     Step 1 of 4: Fetch required skills for the target role.
     This is the first step in the skill gap analysis.
 
     Given a free-text job title or description (e.g. "Senior Backend Engineer"),
-    return a list of skills (name only).
+    return a list of skills. Skills from a role profile also carry `share`
+    (fraction of the role's job posts listing the skill) and `support`
+    (number of those posts).
+
+    Output format:
+    [
+        { "name": "Docker", "share": 0.63, "support": 120 }
+    ]
     """
-    # Initialize Azure OpenAI embeddings & vector store over your existing 'jobpost' collection
-    embedder = AzureOpenAIEmbeddings(
-        api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-        api_version=settings.AZURE_OPENAI_API_VERSION,
-        model=settings.AZURE_OPENAI_EMBEDDING_MODEL
-    )
-    vectorstore = PGVector.from_existing_index(
-        connection=settings.PGVECTOR_CONNECTION,
-        embedding=embedder,
-        collection_name="jobpost",
-    )
-    # Embed query and perform similarity search
-    query_emb = embedder.embed_query(target_goal)
-    results = vectorstore.similarity_search_by_vector(query_emb, k=k)
+    embeddings = get_request_embeddings()
+
+    # Prebuilt role profiles (build_role_profiles): skills of the nearest role,
+    # ranked by the share of its job posts that list them
+    profile = find_role_profile(target_goal, embeddings)
+    if profile is not None:
+        role, skills = profile
+        logger.info(
+            f"Using role profile '{role.title}' ({role.post_count} posts, "
+            f"similarity {role.similarity:.2f}) for '{target_goal}'"
+        )
+        return [
+            {"name": skill.name, "share": skill.share, "support": skill.support}
+            for skill in skills
+        ]
+
+    # Shared vector store over the existing 'jobpost' collection; the goal is
+    # embedded through the request memo so it is computed at most once
+    vectorstore = get_vector_store(JOBPOST_COLLECTION)
+    results = search_by_query(vectorstore, target_goal, k=k, embeddings=embeddings)
 
     # Return skills from the top match
     if not results:
@@ -63,12 +81,28 @@ def fetch_similar_role_skills(
     top = results[0]
     skills = top.metadata.get("skills", [])
 
-    return skills
+    return [{"name": skill} for skill in skills]
+
+
+def _role_skill_line(skill: Union[str, Dict[str, Any]]) -> str:
+    """Prompt line for one role skill, with how often the role's job posts list it"""
+    if isinstance(skill, str):
+        return f"- {skill}"
+    line = f"- {skill['name']}"
+    if skill.get("share") is not None:
+        line += f" (in {skill['share']:.0%} of the role's job posts"
+        if skill.get("support"):
+            line += f", {skill['support']} posts"
+        line += ")"
+    return line
 
 
 @tool
 def enrich_skills_with_level(
-    skills: Annotated[List[str], "List of skill names without level"],
+    skills: Annotated[
+        List[Union[str, Dict[str, Any]]],
+        "Skills without level: names, or the objects returned by fetch_similar_role_skills",
+    ],
     target_goal: Annotated[str, "The job title or role these skills should support"],
 ) -> List[Dict[str, str]]:
     """
@@ -84,18 +118,14 @@ def enrich_skills_with_level(
         { "name": "Git", "level": "intermediate" }
     ]
     """
-    llm = AzureChatOpenAI(
-        api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-        api_version=settings.AZURE_OPENAI_API_VERSION,
-        model=settings.AZURE_OPENAI_CHAT_MODEL,
-        temperature=0
-    )
-    skills_list_text = "\n".join(f"- {skill}" for skill in skills)
+    llm = get_chat_llm()
+    skills_list_text = "\n".join(_role_skill_line(skill) for skill in skills)
 
     prompt = (
         f"You are reviewing a list of technical skills for the role: '{target_goal}'.\n"
         "These skills were retrieved from a database and may include outdated, irrelevant, or incorrect items.\n"
+        "Where given, the percentage is the share of job posts for this role that list the skill: "
+        "keep widely listed skills and expect rarely listed ones to be optional or noise.\n"
         "Your task is to filter out irrelevant or invalid skills, and assign each valid skill a skill level:\n"
         "  - beginner\n"
         "  - intermediate\n"
@@ -140,20 +170,17 @@ def compute_missing(
     """
     threshold: float = 0.9
     level_rank = {"beginner": 0, "intermediate": 1, "advanced": 2}
-    embedder = AzureOpenAIEmbeddings(
-        api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-        api_version=settings.AZURE_OPENAI_API_VERSION,
-        model=settings.AZURE_OPENAI_EMBEDDING_MODEL
-    )
+    embedder = get_request_embeddings()
 
     current_names = [s["name"] for s in current_skills]
     current_levels = {s["name"]: s["level"] for s in current_skills}
     target_names = [t["name"] for t in target_skills]
 
-    cur_emb = np.array(embedder.embed_documents(current_names))
-    tgt_emb = np.array(embedder.embed_documents(target_names))
-    sim_matrix = cosine_similarity(tgt_emb, cur_emb)
+    # Stored Skill vectors; only names never seen before are embedded
+    canonical = canonicalize_skills(current_names + target_names, embeddings=embedder)
+    current_ids = [skill.skill_id for skill in canonical[: len(current_names)]]
+    target_ids = [skill.skill_id for skill in canonical[len(current_names) :]]
+    sim_matrix = None
 
     missing_skills: List[Any] = []
     best_similarities: List[float] = []
@@ -162,8 +189,18 @@ def compute_missing(
         target_name = target_skill["name"]
         required_level = target_skill.get("level", "intermediate")
 
-        best_match_idx = np.argmax(sim_matrix[i])
-        similarity = sim_matrix[i][best_match_idx]
+        # Precomputed neighbours first; the matrix only for skills they can't answer
+        match = skill_graph.best_match(target_ids[i], current_ids)
+        if match is not None:
+            best_match_idx, similarity = match
+        else:
+            if sim_matrix is None:
+                vectors = [skill.embedding for skill in canonical]
+                cur_emb = np.array(vectors[: len(current_names)])
+                tgt_emb = np.array(vectors[len(current_names) :])
+                sim_matrix = cosine_similarity(tgt_emb, cur_emb)
+            best_match_idx = np.argmax(sim_matrix[i])
+            similarity = sim_matrix[i][best_match_idx]
         best_similarities.append(similarity)
 
         if similarity < threshold:
@@ -216,13 +253,7 @@ def recommend_skills(
 
     The final list will be sorted by priority: High → Medium → Low.
     """
-    llm = AzureChatOpenAI(
-        api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-        api_version=settings.AZURE_OPENAI_API_VERSION,
-        model=settings.AZURE_OPENAI_CHAT_MODEL,
-        temperature=0
-    )
+    llm = get_chat_llm()
 
     messages = [
         SystemMessage(
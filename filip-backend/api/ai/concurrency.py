@@ -0,0 +1,100 @@
+"""
+Structured concurrency helpers for the AI pipeline
+
+Small asyncio primitives for fanning out independent LLM/IO calls with a
+concurrency cap, keeping results in input order.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+from filip import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_detached_executor: Optional[ThreadPoolExecutor] = None
+_detached_lock = threading.Lock()
+
+
+def _get_detached_executor() -> ThreadPoolExecutor:
+    global _detached_executor
+    if _detached_executor is None:
+        with _detached_lock:
+            if _detached_executor is None:
+                _detached_executor = ThreadPoolExecutor(
+                    max_workers=settings.DETACHED_CALL_WORKERS,
+                    thread_name_prefix="detached-call",
+                )
+    return _detached_executor
+
+
+async def run_detached(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Like asyncio.to_thread, but on a shared pool that asyncio.run() does not join
+
+    Use it for blocking calls that may be abandoned by a timeout: cancelling
+    the awaiting task cannot stop the thread, and asyncio.run() waits for
+    every default-executor thread before returning, so a timed-out call on
+    asyncio.to_thread still holds the request for its full duration. Here the
+    call finishes in the background instead.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_get_detached_executor(), call)
+
+
+async def bounded_gather(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    limit: Optional[int] = None,
+    fallback: Optional[Callable[[int, BaseException], T]] = None,
+) -> List[T]:
+    """
+    Run awaitables concurrently with at most `limit` in flight
+
+    Factories are called lazily, only once a slot is free, so no coroutine
+    is created (and no request started) beyond the cap.
+
+    Args:
+        factories: Zero-argument callables returning the awaitables to run
+        limit: Maximum number running at once; None or < 1 means unbounded
+        fallback: Called with (index, exception) when an item fails; its
+            return value takes that item's place. Without it the first
+            failure is raised after all items finish.
+
+    Returns:
+        Results in the same order as `factories`
+    """
+    factories = list(factories)
+    semaphore = asyncio.Semaphore(limit) if limit and limit > 0 else None
+
+    async def run(factory: Callable[[], Awaitable[T]]) -> T:
+        if semaphore is None:
+            return await factory()
+        async with semaphore:
+            return await factory()
+
+    results: List[Any] = await asyncio.gather(
+        *(run(factory) for factory in factories), return_exceptions=True
+    )
+
+    first_error: Optional[BaseException] = None
+    for index, result in enumerate(results):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, BaseException):
+            if fallback is not None:
+                logger.warning(f"Concurrent task {index} failed, using fallback: {result}")
+                results[index] = fallback(index, result)
+            elif first_error is None:
+                first_error = result
+
+    if first_error is not None:
+        raise first_error
+    return results
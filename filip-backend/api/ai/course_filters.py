@@ -0,0 +1,160 @@
+"""
+Structured course filters pushed down into SQL.
+
+Level, duration, price and provider used to be left to the LLM ("prioritize
+appropriate level, and shorter durations") after retrieval. CourseFilters
+restricts the candidate set with the indexed typed columns on UdemyCourse
+inside the same query that orders by embedding distance, so only matching
+courses are ranked and passed to the prompt.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db.models import QuerySet
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+from pgvector.django import CosineDistance
+
+from api.ai.course_index import course_document
+from api.models.udemy import UdemyCourse
+from api.utils.course_metadata import COURSE_LEVELS
+from api.utils.llm_clients import get_embeddings
+from api.utils.vector_search import hnsw_ef_search
+
+
+@dataclass(frozen=True)
+class CourseFilters:
+    """Hard constraints on retrieved courses; unset fields do not filter"""
+    levels: Tuple[str, ...] = ()
+    max_duration_hours: Optional[float] = None
+    max_price_vnd: Optional[int] = None
+    provider: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["CourseFilters"]:
+        """
+        Build filters from request data (see CourseFiltersSerializer).
+
+        Returns:
+            CourseFilters, or None when nothing would be filtered
+        """
+        if not data:
+            return None
+        filters = cls(
+            levels=tuple(COURSE_LEVELS.get(level, level) for level in data.get("levels") or ()),
+            max_duration_hours=data.get("max_duration_hours"),
+            max_price_vnd=data.get("max_price_vnd"),
+            provider=data.get("provider") or None,
+        )
+        return filters if filters.is_active() else None
+
+    def is_active(self) -> bool:
+        return bool(
+            self.levels
+            or self.max_duration_hours is not None
+            or self.max_price_vnd is not None
+            or self.provider
+        )
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """Restrict a UdemyCourse queryset to matching courses"""
+        if self.levels:
+            queryset = queryset.filter(level__in=self.levels)
+        if self.max_duration_hours is not None:
+            queryset = queryset.filter(duration_hours__lte=self.max_duration_hours)
+        if self.max_price_vnd is not None:
+            queryset = queryset.filter(price_vnd__lte=self.max_price_vnd)
+        if self.provider:
+            queryset = queryset.filter(provider__iexact=self.provider)
+        return queryset
+
+    def sql(self, alias: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        The same constraints as a raw SQL condition on api_udemycourse.
+
+        Args:
+            alias: Table alias the condition refers to
+
+        Returns:
+            (condition, named parameters); the condition is "TRUE" when inactive
+        """
+        conditions: List[str] = []
+        params: Dict[str, Any] = {}
+        if self.levels:
+            conditions.append(f"{alias}.level = ANY(%(filter_levels)s)")
+            params["filter_levels"] = list(self.levels)
+        if self.max_duration_hours is not None:
+            conditions.append(f"{alias}.duration_hours <= %(filter_max_duration_hours)s")
+            params["filter_max_duration_hours"] = self.max_duration_hours
+        if self.max_price_vnd is not None:
+            conditions.append(f"{alias}.price_vnd <= %(filter_max_price_vnd)s")
+            params["filter_max_price_vnd"] = self.max_price_vnd
+        if self.provider:
+            conditions.append(f"lower({alias}.provider) = lower(%(filter_provider)s)")
+            params["filter_provider"] = self.provider
+        return " AND ".join(conditions) or "TRUE", params
+
+
+def search_courses_by_vector(
+    query_vector: List[float], k: int = 4, filters: Optional[CourseFilters] = None
+) -> List[Tuple[Document, float]]:
+    """
+    Cosine search on UdemyCourse.embedding restricted by filters.
+
+    Returns:
+        (document, cosine distance) pairs, closest first
+    """
+    queryset = UdemyCourse.objects.exclude(embedding=None)
+    if filters:
+        queryset = filters.apply(queryset)
+    # HNSW drops non-matching rows after the graph scan, so a filtered query
+    # needs a wider candidate list to still return k rows
+    with hnsw_ef_search(k=k, filtered=filters is not None and filters.is_active()):
+        courses = list(
+            queryset.annotate(distance=CosineDistance("embedding", query_vector))
+            .order_by("distance")[:k]
+        )
+    return [(course_document(course), float(course.distance)) for course in courses]
+
+
+class FilteredCourseStore(VectorStore):
+    """Read-only VectorStore over UdemyCourse rows with CourseFilters applied in SQL."""
+
+    def __init__(self, filters: Optional[CourseFilters] = None,
+                 embeddings: Optional[Embeddings] = None):
+        self.filters = filters
+        self._embeddings = embeddings or get_embeddings()
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embeddings
+
+    def add_texts(self, texts: Iterable[str], metadatas: Optional[List[dict]] = None,
+                  **kwargs: Any) -> List[str]:
+        raise NotImplementedError("Filtered course search reads UdemyCourse rows directly")
+
+    @classmethod
+    def from_texts(cls, texts: List[str], embedding: Embeddings,
+                   metadatas: Optional[List[dict]] = None, **kwargs: Any) -> "FilteredCourseStore":
+        raise NotImplementedError("Filtered course search reads UdemyCourse rows directly")
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        return search_courses_by_vector(embedding, k=k, filters=self.filters)
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4,
+                                    **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k)]
+
+    def similarity_search_with_score(self, query: str, k: int = 4,
+                                     **kwargs: Any) -> List[Tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(self.embeddings.embed_query(query), k)
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k)]
+
+    def _select_relevance_score_fn(self):
+        return self._cosine_relevance_score_fn
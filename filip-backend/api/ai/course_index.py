@@ -0,0 +1,249 @@
+"""
+In-memory course embedding index.
+
+The Udemy catalog is small enough (~7k x 1536 float32, ~45 MB) to search
+exhaustively with one matrix-vector product. build_course_index() writes the
+L2-normalised vectors as a .npy file plus course ids and documents; each
+worker memory-maps the vectors read-only, so the pages are shared through
+the OS page cache. Every build bumps a catalog generation number in the
+CURRENT file, and searchers reload when it changes.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from api.models.udemy import UdemyCourse
+from api.utils.llm_clients import get_embeddings
+from filip import settings
+
+logger = logging.getLogger(__name__)
+
+CURRENT_FILE = "CURRENT"
+
+
+def course_text(course: UdemyCourse) -> str:
+    """Text embedded for a course (same as embed_udemy_courses)."""
+    return (
+        f"Course title: {course.title} "
+        f"Instructors: {course.instructors} "
+        f"Level: {course.level} "
+        f"Duration: {course.duration} "
+        f"Price (VND): {course.price} "
+        f"Course description: {course.description} "
+        f"Link: {course.url}"
+    )
+
+
+def course_document(course: UdemyCourse) -> Document:
+    """LangChain document stored for a course in the "course" collection."""
+    return Document(
+        page_content=course_text(course),
+        metadata={
+            "course_id": course.id,
+            "title": course.title,
+            "instructors": course.instructors,
+            "level": course.level,
+            "duration": course.duration,
+            "price": course.price,
+            "url": course.url,
+            "duration_hours": course.duration_hours,
+            "question_count": course.question_count,
+            "price_vnd": course.price_vnd,
+            "provider": course.provider,
+        },
+    )
+
+
+def _paths(directory: Path, generation: int) -> Tuple[Path, Path, Path]:
+    return (
+        directory / f"vectors-{generation}.npy",
+        directory / f"ids-{generation}.npy",
+        directory / f"docs-{generation}.json",
+    )
+
+
+def read_generation(directory: Optional[str] = None) -> Optional[int]:
+    """Current catalog generation, or None if no index was built."""
+    try:
+        return int((Path(directory or settings.COURSE_INDEX_DIR) / CURRENT_FILE).read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def build_course_index(
+    directory: Optional[str] = None, batch_size: int = 500, keep: int = 2
+) -> Tuple[int, int]:
+    """
+    Write a new index generation from UdemyCourse embeddings and publish it.
+
+    Args:
+        directory: Output directory, defaults to COURSE_INDEX_DIR
+        batch_size: Rows fetched per query
+        keep: Number of generations kept on disk (older ones are deleted)
+
+    Returns:
+        (generation, number of courses indexed)
+    """
+    out = Path(directory or settings.COURSE_INDEX_DIR)
+    out.mkdir(parents=True, exist_ok=True)
+    generation = (read_generation(str(out)) or 0) + 1
+    vectors_path, ids_path, docs_path = _paths(out, generation)
+
+    queryset = UdemyCourse.objects.filter(embedding__isnull=False).order_by("id")
+
+    vectors = np.zeros((0, settings.EMBEDDING_DIMENSIONS), dtype=np.float32)
+    chunks: List[np.ndarray] = []
+    ids: List[str] = []
+    docs: List[dict] = []
+    for course in queryset.iterator(chunk_size=batch_size):
+        chunks.append(np.asarray(course.embedding, dtype=np.float32))
+        ids.append(course.id)
+        document = course_document(course)
+        docs.append({"page_content": document.page_content, "metadata": document.metadata})
+
+    if chunks:
+        vectors = np.vstack(chunks)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms == 0, 1.0, norms)
+    np.save(vectors_path, vectors)
+    np.save(ids_path, np.array(ids, dtype=str))
+    docs_path.write_text(json.dumps(docs))
+
+    # Publish atomically; searchers pick the new generation up on their next query
+    tmp = out / f"{CURRENT_FILE}.tmp"
+    tmp.write_text(str(generation))
+    os.replace(tmp, out / CURRENT_FILE)
+
+    for old in range(1, generation - keep + 1):
+        for path in _paths(out, old):
+            path.unlink(missing_ok=True)
+
+    logger.info(f"Built course index generation {generation} with {len(ids)} courses")
+    return generation, len(ids)
+
+
+class MemoryCourseIndex:
+    """Read-only, memory-mapped course index that follows the catalog generation."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory or settings.COURSE_INDEX_DIR)
+        self.generation: Optional[int] = None
+        # (vectors, ids, docs) swapped as one tuple so searches never mix generations
+        self._data: Optional[Tuple[np.ndarray, np.ndarray, List[dict]]] = None
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        return read_generation(str(self.directory)) is not None
+
+    def _ensure_loaded(self):
+        generation = read_generation(str(self.directory))
+        if generation is None:
+            raise RuntimeError(f"No course index in {self.directory}; run build_course_index")
+        if generation == self.generation:
+            return
+        with self._lock:
+            if generation == self.generation:
+                return
+            vectors_path, ids_path, docs_path = _paths(self.directory, generation)
+            self._data = (
+                np.load(vectors_path, mmap_mode="r"),
+                np.load(ids_path),
+                json.loads(docs_path.read_text()),
+            )
+            self.generation = generation
+            logger.info(
+                f"Loaded course index generation {generation} ({len(self._data[2])} courses)"
+            )
+
+    def search(self, vector: List[float], k: int = 4) -> List[Tuple[Document, float]]:
+        """
+        Exact cosine search.
+
+        Returns:
+            (document, cosine distance) pairs, closest first
+        """
+        self._ensure_loaded()
+        if self._data is None:
+            return []
+        vectors, _, docs = self._data
+        if not docs:
+            return []
+
+        query = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+        similarities = vectors @ query
+
+        k = min(k, len(docs))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [
+            (
+                Document(
+                    page_content=docs[i]["page_content"],
+                    metadata=dict(docs[i]["metadata"]),
+                ),
+                float(1.0 - similarities[i]),
+            )
+            for i in top
+        ]
+
+
+class MemoryCourseVectorStore(VectorStore):
+    """Read-only VectorStore over MemoryCourseIndex, a drop-in for the course PGVector store."""
+
+    def __init__(self, index: MemoryCourseIndex, embeddings: Optional[Embeddings] = None):
+        self.index = index
+        self._embeddings = embeddings or get_embeddings()
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embeddings
+
+    def add_texts(self, texts: Iterable[str], metadatas: Optional[List[dict]] = None,
+                  **kwargs: Any) -> List[str]:
+        raise NotImplementedError("The memory course index is rebuilt with build_course_index")
+
+    @classmethod
+    def from_texts(cls, texts: List[str], embedding: Embeddings,
+                   metadatas: Optional[List[dict]] = None, **kwargs: Any) -> "MemoryCourseVectorStore":
+        raise NotImplementedError("The memory course index is rebuilt with build_course_index")
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, filter: Optional[dict] = None, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        if filter:
+            raise ValueError("Metadata filters are not supported by the memory course index")
+        return self.index.search(embedding, k=k)
+
+    def similarity_search_by_vector(
+        self, embedding: List[float], k: int = 4, filter: Optional[dict] = None, **kwargs: Any
+    ) -> List[Document]:
+        return [
+            doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k, filter)
+        ]
+
+    def similarity_search_with_score(
+        self, query: str, k: int = 4, filter: Optional[dict] = None, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(
+            self.embeddings.embed_query(query), k, filter
+        )
+
+    def similarity_search(
+        self, query: str, k: int = 4, filter: Optional[dict] = None, **kwargs: Any
+    ) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter)]
+
+    def _select_relevance_score_fn(self):
+        return self._cosine_relevance_score_fn
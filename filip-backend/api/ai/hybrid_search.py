@@ -0,0 +1,198 @@
+"""
+Hybrid lexical + vector course retrieval.
+
+Dense similarity alone misses exact terms such as "Terraform" or "CKA". The
+hybrid search runs a full-text query on UdemyCourse.search_vector (GIN) and
+an ANN query on UdemyCourse.embedding (HNSW) in one SQL statement and merges
+the two rankings with reciprocal rank fusion (RRF):
+
+    score(d) = sum over rankings of 1 / (rrf_k + rank(d))
+"""
+
+import logging
+from typing import Any, Iterable, List, Optional, Tuple
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from api.ai.course_filters import CourseFilters, search_courses_by_vector
+from api.ai.course_index import course_document
+from api.models.udemy import UdemyCourse
+from api.utils.llm_clients import get_embeddings
+from api.utils.vector_search import hnsw_ef_search, vector_type
+
+logger = logging.getLogger(__name__)
+
+# Standard RRF damping constant; higher flattens the contribution of top ranks
+RRF_K = 60
+
+# The lexical query ORs the query's lexemes: a long natural-language query
+# should match courses containing any of its terms, ranked by ts_rank_cd.
+# {filters} is a CourseFilters condition on alias c, applied to both rankings;
+# {vector_type} is the embedding column type (VECTOR_STORAGE).
+HYBRID_SQL = """
+WITH query AS (
+    SELECT NULLIF(
+        replace(plainto_tsquery('english', %(text)s)::text, '&', '|'), ''
+    )::tsquery AS tsq
+),
+vector_hits AS (
+    SELECT id, row_number() OVER (ORDER BY distance) AS rank
+    FROM (
+        SELECT c.id, c.embedding <=> %(vector)s::{vector_type} AS distance
+        FROM api_udemycourse c
+        WHERE c.embedding IS NOT NULL AND {filters}
+        ORDER BY distance
+        LIMIT %(candidates)s
+    ) nearest
+),
+lexical_hits AS (
+    SELECT id, row_number() OVER (ORDER BY score DESC) AS rank
+    FROM (
+        SELECT c.id, ts_rank_cd(c.search_vector, query.tsq) AS score
+        FROM api_udemycourse c, query
+        WHERE query.tsq IS NOT NULL AND c.search_vector @@ query.tsq AND {filters}
+        ORDER BY score DESC
+        LIMIT %(candidates)s
+    ) matches
+)
+SELECT c.*,
+       COALESCE(1.0 / (%(rrf_k)s + v.rank), 0)
+       + COALESCE(1.0 / (%(rrf_k)s + l.rank), 0) AS rrf_score,
+       v.rank AS vector_rank,
+       l.rank AS lexical_rank
+FROM vector_hits v
+FULL OUTER JOIN lexical_hits l ON v.id = l.id
+JOIN api_udemycourse c ON c.id = COALESCE(v.id, l.id)
+ORDER BY rrf_score DESC
+LIMIT %(k)s
+"""
+
+
+def _vector_literal(vector: List[float]) -> str:
+    return "[" + ",".join(str(float(x)) for x in vector) + "]"
+
+
+def hybrid_course_search(
+    query: str,
+    k: int = 5,
+    query_vector: Optional[List[float]] = None,
+    embeddings: Optional[Embeddings] = None,
+    lexical_query: Optional[str] = None,
+    candidates: int = 50,
+    rrf_k: int = RRF_K,
+    filters: Optional[CourseFilters] = None,
+) -> List[Tuple[Document, float]]:
+    """
+    Search courses with full-text and vector ranking fused by RRF.
+
+    Args:
+        query: Query text, embedded unless query_vector is given
+        k: Number of courses to return
+        query_vector: Precomputed embedding of the query
+        embeddings: Embeddings used for the query, defaults to the shared client
+        lexical_query: Text for the full-text side, defaults to query
+            (e.g. just the skill names)
+        candidates: Rows taken from each ranking before fusion
+        rrf_k: RRF damping constant
+        filters: Constraints applied to both rankings before fusion
+
+    Returns:
+        (document, RRF score) pairs, best first; metadata also carries
+        vector_rank and lexical_rank (None when absent from that ranking)
+    """
+    if query_vector is None:
+        query_vector = (embeddings or get_embeddings()).embed_query(query)
+
+    filters = filters or CourseFilters()
+    condition, params = filters.sql("c")
+    params.update({
+        "text": lexical_query or query,
+        "vector": _vector_literal(query_vector),
+        "candidates": max(candidates, k),
+        "rrf_k": rrf_k,
+        "k": k,
+    })
+    with hnsw_ef_search(k=params["candidates"], filtered=filters.is_active()):
+        courses = list(UdemyCourse.objects.raw(HYBRID_SQL.format(filters=condition, vector_type=vector_type()), params))
+
+    results = []
+    for course in courses:
+        document = course_document(course)
+        document.metadata["vector_rank"] = course.vector_rank
+        document.metadata["lexical_rank"] = course.lexical_rank
+        results.append((document, float(course.rrf_score)))
+    return results
+
+
+class HybridCourseStore(VectorStore):
+    """Read-only VectorStore running hybrid_course_search, a drop-in for the course PGVector store."""
+
+    # Fused results need less over-fetching than pure vector search (see RecommendationContext)
+    retrieval_overfetch = 1.5
+
+    def __init__(self, embeddings: Optional[Embeddings] = None, candidates: int = 50,
+                 filters: Optional[CourseFilters] = None):
+        self._embeddings = embeddings or get_embeddings()
+        self.candidates = candidates
+        self.filters = filters
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embeddings
+
+    def add_texts(self, texts: Iterable[str], metadatas: Optional[List[dict]] = None,
+                  **kwargs: Any) -> List[str]:
+        raise NotImplementedError("Hybrid search reads UdemyCourse rows directly")
+
+    @classmethod
+    def from_texts(cls, texts: List[str], embedding: Embeddings,
+                   metadatas: Optional[List[dict]] = None, **kwargs: Any) -> "HybridCourseStore":
+        raise NotImplementedError("Hybrid search reads UdemyCourse rows directly")
+
+    def _check_filter(self, filter: Optional[dict]):
+        if filter:
+            raise ValueError(
+                "Metadata filters are not supported by the hybrid course search; use CourseFilters"
+            )
+
+    def hybrid_search(self, query: str, k: int = 4,
+                      query_vector: Optional[List[float]] = None,
+                      embeddings: Optional[Embeddings] = None,
+                      filter: Optional[dict] = None,
+                      lexical_query: Optional[str] = None,
+                      **kwargs: Any) -> List[Document]:
+        """Entry point used by search_by_query, which has both the text and the vector"""
+        self._check_filter(filter)
+        return [
+            doc for doc, _ in hybrid_course_search(
+                query, k=k, query_vector=query_vector,
+                embeddings=embeddings or self.embeddings, lexical_query=lexical_query,
+                candidates=self.candidates, filters=self.filters
+            )
+        ]
+
+    def similarity_search_with_score(self, query: str, k: int = 4,
+                                     filter: Optional[dict] = None,
+                                     **kwargs: Any) -> List[Tuple[Document, float]]:
+        self._check_filter(filter)
+        return hybrid_course_search(
+            query, k=k, embeddings=self.embeddings, candidates=self.candidates,
+            filters=self.filters
+        )
+
+    def similarity_search(self, query: str, k: int = 4, filter: Optional[dict] = None,
+                          **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter)]
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4,
+                                    filter: Optional[dict] = None,
+                                    **kwargs: Any) -> List[Document]:
+        self._check_filter(filter)
+        # Without the query text only the vector side can run
+        return [doc for doc, _ in search_courses_by_vector(embedding, k=k, filters=self.filters)]
+
+    def _select_relevance_score_fn(self):
+        # RRF scores are already "higher is better"
+        return lambda score: score
@@ -0,0 +1,58 @@
+"""
+Request-scoped Recommendation Context
+
+Carries one recommendation request's retrieval results and embeddings
+through generation, validation and regeneration, so the vector store is
+searched once and each distinct text embedded once per request instead of
+once per stage.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from langchain.schema import Document
+from langchain_postgres.vectorstores import PGVector
+
+from api.ai.vector_stores import search_by_query
+from api.utils.embedding import EmbeddingMemo
+
+
+@dataclass
+class RecommendationContext:
+    """State shared by every stage of a single recommendation request"""
+    query: str
+    user_skills: List[str]
+    target_skills: List[str]
+    max_results: int = 5
+    domain: str = "courses"
+    embeddings: EmbeddingMemo = field(default_factory=EmbeddingMemo)
+
+    # Filled lazily and reused by later stages / regeneration attempts
+    context_docs: Optional[List[Document]] = None
+    courses: Optional[List[Dict[str, Any]]] = None
+    retrievals: int = 0
+
+    async def retrieve(self, vector_store: PGVector) -> List[Document]:
+        """
+        Search the vector store for this request's query, at most once
+
+        Args:
+            vector_store: Store to search on the first call
+
+        Returns:
+            The retrieved documents, shared by all later callers
+        """
+        if self.context_docs is None:
+            # Pure vector search over-fetches 2x for the generator to choose from;
+            # stores with a sharper ranking (hybrid RRF) declare a smaller factor
+            overfetch = getattr(vector_store, "retrieval_overfetch", 2)
+            self.context_docs = await asyncio.to_thread(
+                search_by_query,
+                vector_store,
+                self.query,
+                k=max(1, round(self.max_results * overfetch)),
+                embeddings=self.embeddings,
+            )
+            self.retrievals += 1
+        return self.context_docs
@@ -14,9 +14,16 @@ from enum import Enum
 import time
 import json
 
-from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
+from langchain_core.embeddings import Embeddings
+from langchain_openai import AzureChatOpenAI
 from langchain_postgres.vectorstores import PGVector
 from langchain.schema import Document
+from pydantic import BaseModel, Field
+
+from api.ai.concurrency import run_detached
+from api.ai.vector_stores import search_by_query
+from api.ai.validation_cache import ValidationCache, validation_cache
+from api.ai.validation_config import validation_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +56,18 @@ class ValidationResult:
             "suggestions": self.suggestions,
             "metadata": self.metadata or {}
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValidationResult":
+        """Rebuild a result from its to_dict() form"""
+        return cls(
+            is_valid=data["is_valid"],
+            score=data["score"],
+            confidence_level=ConfidenceLevel(data["confidence_level"]),
+            reasons=list(data.get("reasons", [])),
+            suggestions=list(data.get("suggestions", [])),
+            metadata=dict(data.get("metadata") or {})
+        )
 
 
 class BaseValidator:
@@ -77,7 +96,7 @@ class BaseValidator:
 class SemanticRelevanceValidator(BaseValidator):
     """Validates semantic similarity between query and response"""
     
-    def __init__(self, embeddings_model: AzureOpenAIEmbeddings):
+    def __init__(self, embeddings_model: Embeddings):
         super().__init__("SemanticRelevance")
         self.embeddings = embeddings_model
     
@@ -86,12 +105,11 @@ class SemanticRelevanceValidator(BaseValidator):
         try:
             start_time = time.time()
             
-            # Get embeddings for query and response
-            query_embedding = await asyncio.to_thread(
-                self.embeddings.embed_query, query
-            )
-            response_embedding = await asyncio.to_thread(
-                self.embeddings.embed_query, response
+            # Request-scoped embeddings (e.g. an EmbeddingMemo) reuse the
+            # query vector computed for retrieval
+            embeddings = kwargs.get("embeddings") or self.embeddings
+            query_embedding, response_embedding = await run_detached(
+                embeddings.embed_documents, [query, response]
             )
             
             # Calculate cosine similarity
@@ -182,17 +200,9 @@ class ContextualAccuracyValidator(BaseValidator):
         try:
             start_time = time.time()
             
-            # Get context documents if not provided
-            if context_docs is None:
-                context_docs = await asyncio.to_thread(
-                    self.vector_store.similarity_search, query, k=5
-                )
-            
-            # Prepare context text
-            context_text = "\n\n".join([
-                f"Source {i+1}: {doc.page_content}" 
-                for i, doc in enumerate(context_docs[:3])
-            ])
+            context_docs = await self._get_context_docs(
+                query, context_docs, kwargs.get("embeddings")
+            )
             
             # Create validation prompt
             validation_prompt = f"""
@@ -203,7 +213,7 @@ class ContextualAccuracyValidator(BaseValidator):
             Response to evaluate: {response}
             
             Context from knowledge base:
-            {context_text}
+            {self._format_context(context_docs)}
             
             Rate the accuracy from 0.0 to 1.0 based on:
             1. Factual correctness against the context
@@ -219,37 +229,17 @@ class ContextualAccuracyValidator(BaseValidator):
             """
             
             # Get LLM assessment
-            llm_response = await asyncio.to_thread(
+            llm_response = await run_detached(
                 self.llm.invoke, validation_prompt
             )
             
             # Parse LLM response
             assessment = self._parse_llm_response(llm_response.content)
-            accuracy_score = assessment.get("accuracy_score", 0.5)
-            factual_issues = assessment.get("factual_issues", [])
-            
-            # Determine validation result
-            is_valid = accuracy_score >= 0.60
-            confidence_level = self._calculate_confidence_level(accuracy_score)
-            
-            # Generate reasons and suggestions
-            reasons = self._generate_reasons(accuracy_score, factual_issues, confidence_level)
-            suggestions = self._generate_suggestions(accuracy_score, factual_issues)
-            
-            duration = time.time() - start_time
-            
-            return ValidationResult(
-                is_valid=is_valid,
-                score=accuracy_score,
-                confidence_level=confidence_level,
-                reasons=reasons,
-                suggestions=suggestions,
-                metadata={
-                    "validator": self.name,
-                    "duration_seconds": duration,
-                    "factual_issues": factual_issues,
-                    "context_docs_count": len(context_docs)
-                }
+            return self._build_result(
+                accuracy_score=assessment.get("accuracy_score", 0.5),
+                factual_issues=assessment.get("factual_issues", []),
+                context_docs_count=len(context_docs),
+                start_time=start_time
             )
             
         except Exception as e:
@@ -263,6 +253,49 @@ class ContextualAccuracyValidator(BaseValidator):
                 metadata={"error": str(e)}
             )
     
+    async def _get_context_docs(self, query: str, context_docs: List[Document] = None,
+                                embeddings: Optional[Embeddings] = None) -> List[Document]:
+        """Use the provided context documents, or fetch them from the vector store"""
+        if context_docs is None:
+            context_docs = await run_detached(
+                search_by_query, self.vector_store, query, k=5, embeddings=embeddings
+            )
+        return context_docs
+    
+    def _format_context(self, context_docs: List[Document]) -> str:
+        """Format the top context documents for a validation prompt"""
+        return "\n\n".join([
+            f"Source {i+1}: {doc.page_content}" 
+            for i, doc in enumerate(context_docs[:3])
+        ])
+    
+    def _build_result(self, accuracy_score: float, factual_issues: List[str],
+                      context_docs_count: int, start_time: float) -> ValidationResult:
+        """Turn an accuracy assessment into a ValidationResult"""
+        # Determine validation result
+        is_valid = accuracy_score >= 0.60
+        confidence_level = self._calculate_confidence_level(accuracy_score)
+        
+        # Generate reasons and suggestions
+        reasons = self._generate_reasons(accuracy_score, factual_issues, confidence_level)
+        suggestions = self._generate_suggestions(accuracy_score, factual_issues)
+        
+        duration = time.time() - start_time
+        
+        return ValidationResult(
+            is_valid=is_valid,
+            score=accuracy_score,
+            confidence_level=confidence_level,
+            reasons=reasons,
+            suggestions=suggestions,
+            metadata={
+                "validator": self.name,
+                "duration_seconds": duration,
+                "factual_issues": factual_issues,
+                "context_docs_count": context_docs_count
+            }
+        )
+    
     def _parse_llm_response(self, response: str) -> Dict[str, Any]:
         """Parse LLM JSON response safely"""
         try:
@@ -339,39 +372,10 @@ class DomainSpecificValidator(BaseValidator):
         try:
             start_time = time.time()
             
-            # Keyword-based assessment
-            keyword_score = self._assess_keyword_presence(response, domain)
-            
             # LLM-based domain assessment
             llm_score = await self._assess_domain_appropriateness(query, response, domain)
             
-            # Combined score
-            overall_score = (keyword_score * 0.3 + llm_score * 0.7)
-            
-            # Determine validation result
-            is_valid = overall_score >= 0.65
-            confidence_level = self._calculate_confidence_level(overall_score)
-            
-            # Generate reasons and suggestions
-            reasons = self._generate_reasons(overall_score, keyword_score, llm_score, domain, confidence_level)
-            suggestions = self._generate_suggestions(overall_score, domain)
-            
-            duration = time.time() - start_time
-            
-            return ValidationResult(
-                is_valid=is_valid,
-                score=overall_score,
-                confidence_level=confidence_level,
-                reasons=reasons,
-                suggestions=suggestions,
-                metadata={
-                    "validator": self.name,
-                    "duration_seconds": duration,
-                    "domain": domain,
-                    "keyword_score": keyword_score,
-                    "llm_score": llm_score
-                }
-            )
+            return self._build_result(response, domain, llm_score, start_time)
             
         except Exception as e:
             self.logger.error(f"Domain validation failed: {str(e)}")
@@ -384,6 +388,40 @@ class DomainSpecificValidator(BaseValidator):
                 metadata={"error": str(e)}
             )
     
+    def _build_result(self, response: str, domain: str, llm_score: float,
+                      start_time: float) -> ValidationResult:
+        """Combine the LLM domain score with keyword presence into a ValidationResult"""
+        # Keyword-based assessment
+        keyword_score = self._assess_keyword_presence(response, domain)
+        
+        # Combined score
+        overall_score = (keyword_score * 0.3 + llm_score * 0.7)
+        
+        # Determine validation result
+        is_valid = overall_score >= 0.65
+        confidence_level = self._calculate_confidence_level(overall_score)
+        
+        # Generate reasons and suggestions
+        reasons = self._generate_reasons(overall_score, keyword_score, llm_score, domain, confidence_level)
+        suggestions = self._generate_suggestions(overall_score, domain)
+        
+        duration = time.time() - start_time
+        
+        return ValidationResult(
+            is_valid=is_valid,
+            score=overall_score,
+            confidence_level=confidence_level,
+            reasons=reasons,
+            suggestions=suggestions,
+            metadata={
+                "validator": self.name,
+                "duration_seconds": duration,
+                "domain": domain,
+                "keyword_score": keyword_score,
+                "llm_score": llm_score
+            }
+        )
+    
     def _assess_keyword_presence(self, response: str, domain: str) -> float:
         """Assess presence of domain-specific keywords"""
         keywords = self.domain_keywords.get(domain, [])
@@ -413,7 +451,7 @@ class DomainSpecificValidator(BaseValidator):
             Respond with only a number between 0.0 and 1.0.
             """
             
-            llm_response = await asyncio.to_thread(self.llm.invoke, prompt)
+            llm_response = await run_detached(self.llm.invoke, prompt)
             score_text = llm_response.content.strip()
             
             try:
@@ -469,45 +507,9 @@ class QualityAssessmentValidator(BaseValidator):
             completeness_score = await self._assess_completeness(query, response)
             clarity_score = await self._assess_clarity(response)
             actionability_score = await self._assess_actionability(query, response)
-            length_score = self._assess_length_appropriateness(response)
-            
-            # Weighted average
-            overall_score = (
-                completeness_score * 0.35 +
-                clarity_score * 0.25 +
-                actionability_score * 0.25 +
-                length_score * 0.15
-            )
-            
-            # Determine validation result
-            is_valid = overall_score >= 0.65
-            confidence_level = self._calculate_confidence_level(overall_score)
             
-            # Generate reasons and suggestions
-            reasons = self._generate_reasons(
-                overall_score, completeness_score, clarity_score, 
-                actionability_score, length_score, confidence_level
-            )
-            suggestions = self._generate_suggestions(
-                completeness_score, clarity_score, actionability_score, length_score
-            )
-            
-            duration = time.time() - start_time
-            
-            return ValidationResult(
-                is_valid=is_valid,
-                score=overall_score,
-                confidence_level=confidence_level,
-                reasons=reasons,
-                suggestions=suggestions,
-                metadata={
-                    "validator": self.name,
-                    "duration_seconds": duration,
-                    "completeness_score": completeness_score,
-                    "clarity_score": clarity_score,
-                    "actionability_score": actionability_score,
-                    "length_score": length_score
-                }
+            return self._build_result(
+                response, completeness_score, clarity_score, actionability_score, start_time
             )
             
         except Exception as e:
@@ -521,6 +523,50 @@ class QualityAssessmentValidator(BaseValidator):
                 metadata={"error": str(e)}
             )
     
+    def _build_result(self, response: str, completeness_score: float, clarity_score: float,
+                      actionability_score: float, start_time: float) -> ValidationResult:
+        """Weight the quality dimensions into a ValidationResult"""
+        length_score = self._assess_length_appropriateness(response)
+        
+        # Weighted average
+        overall_score = (
+            completeness_score * 0.35 +
+            clarity_score * 0.25 +
+            actionability_score * 0.25 +
+            length_score * 0.15
+        )
+        
+        # Determine validation result
+        is_valid = overall_score >= 0.65
+        confidence_level = self._calculate_confidence_level(overall_score)
+        
+        # Generate reasons and suggestions
+        reasons = self._generate_reasons(
+            overall_score, completeness_score, clarity_score, 
+            actionability_score, length_score, confidence_level
+        )
+        suggestions = self._generate_suggestions(
+            completeness_score, clarity_score, actionability_score, length_score
+        )
+        
+        duration = time.time() - start_time
+        
+        return ValidationResult(
+            is_valid=is_valid,
+            score=overall_score,
+            confidence_level=confidence_level,
+            reasons=reasons,
+            suggestions=suggestions,
+            metadata={
+                "validator": self.name,
+                "duration_seconds": duration,
+                "completeness_score": completeness_score,
+                "clarity_score": clarity_score,
+                "actionability_score": actionability_score,
+                "length_score": length_score
+            }
+        )
+    
     async def _assess_completeness(self, query: str, response: str) -> float:
         """Assess if response completely addresses the query"""
         try:
@@ -538,7 +584,7 @@ class QualityAssessmentValidator(BaseValidator):
             Respond with only a number between 0.0 and 1.0.
             """
             
-            llm_response = await asyncio.to_thread(self.llm.invoke, prompt)
+            llm_response = await run_detached(self.llm.invoke, prompt)
             try:
                 return max(0.0, min(1.0, float(llm_response.content.strip())))
             except ValueError:
@@ -562,7 +608,7 @@ class QualityAssessmentValidator(BaseValidator):
             Respond with only a number between 0.0 and 1.0.
             """
             
-            llm_response = await asyncio.to_thread(self.llm.invoke, prompt)
+            llm_response = await run_detached(self.llm.invoke, prompt)
             try:
                 return max(0.0, min(1.0, float(llm_response.content.strip())))
             except ValueError:
@@ -587,7 +633,7 @@ class QualityAssessmentValidator(BaseValidator):
             Respond with only a number between 0.0 and 1.0.
             """
             
-            llm_response = await asyncio.to_thread(self.llm.invoke, prompt)
+            llm_response = await run_detached(self.llm.invoke, prompt)
             try:
                 return max(0.0, min(1.0, float(llm_response.content.strip())))
             except ValueError:
@@ -649,26 +695,185 @@ class QualityAssessmentValidator(BaseValidator):
         return suggestions
 
 
+class RubricAssessment(BaseModel):
+    """Structured output of the consolidated rubric call"""
+    accuracy_score: float = Field(description="Factual accuracy against the context, 0.0 to 1.0")
+    consistency_rating: float = Field(description="Consistency with the knowledge base, 0.0 to 1.0")
+    factual_issues: List[str] = Field(default_factory=list, description="Any factual problems found")
+    domain_score: float = Field(description="Appropriateness for the domain, 0.0 to 1.0")
+    completeness_score: float = Field(description="How completely the query is addressed, 0.0 to 1.0")
+    clarity_score: float = Field(description="Clarity and organization, 0.0 to 1.0")
+    actionability_score: float = Field(description="How actionable the guidance is, 0.0 to 1.0")
+
+
+class RubricValidator(BaseValidator):
+    """
+    Scores the contextual, domain and quality rubrics in a single LLM call.
+    
+    The multi-call path spends five chat completions per validation pass
+    (one contextual, one domain, three quality). This validator asks for all
+    rubric dimensions at once through structured output, then builds the
+    per-validator results with the same scoring, thresholds, reasons and
+    suggestions as the individual validators, so individual_results keeps
+    its shape.
+    """
+    
+    DIMENSIONS = ("contextual", "domain", "quality")
+    
+    def __init__(self, llm: AzureChatOpenAI,
+                 contextual_validator: ContextualAccuracyValidator,
+                 domain_validator: DomainSpecificValidator,
+                 quality_validator: QualityAssessmentValidator):
+        super().__init__("Rubric")
+        self.structured_llm = llm.with_structured_output(RubricAssessment, include_raw=True)
+        self.contextual_validator = contextual_validator
+        self.domain_validator = domain_validator
+        self.quality_validator = quality_validator
+    
+    async def validate_all(self, query: str, response: str, domain: str = "courses",
+                           context_docs: List[Document] = None,
+                           embeddings: Optional[Embeddings] = None) -> Dict[str, ValidationResult]:
+        """
+        Score every rubric dimension with one structured-output call
+        
+        Args:
+            query: Original user query
+            response: Generated response to validate
+            domain: Domain context (courses, skills, general)
+            context_docs: Context documents from vector search
+            embeddings: Request-scoped embeddings for a fallback context search
+        
+        Returns:
+            ValidationResults keyed by contextual, domain and quality
+        """
+        try:
+            start_time = time.time()
+            
+            context_docs = await self.contextual_validator._get_context_docs(
+                query, context_docs, embeddings
+            )
+            prompt = f"""
+            Evaluate the following response to a user query in the {domain} domain.
+            
+            Query: {query}
+            
+            Response to evaluate: {response}
+            
+            Context from knowledge base:
+            {self.contextual_validator._format_context(context_docs)}
+            
+            Score each dimension from 0.0 to 1.0:
+            - accuracy_score: factual correctness against the context, absence of contradictions
+            - consistency_rating: consistency with the knowledge base information
+            - factual_issues: list any factual problems (empty if none)
+            - domain_score: appropriate {domain} terminology, relevance to the {domain} context, professional tone
+            - completeness_score: does it answer all parts of the query, is anything important missing
+            - clarity_score: clear language, logical structure, well-organized explanations
+            - actionability_score: specific recommendations and clear next steps the user can take
+            """
+            
+            output = await run_detached(self.structured_llm.invoke, prompt)
+            assessment = output.get("parsed")
+            if assessment is None:
+                raise ValueError(f"Unparseable rubric output: {output.get('parsing_error')}")
+            
+            raw = output.get("raw")
+            usage = dict(getattr(raw, "usage_metadata", None) or {})
+            
+            results = {
+                "contextual": self.contextual_validator._build_result(
+                    accuracy_score=self._clamp(assessment.accuracy_score),
+                    factual_issues=assessment.factual_issues,
+                    context_docs_count=len(context_docs),
+                    start_time=start_time
+                ),
+                "domain": self.domain_validator._build_result(
+                    response, domain, self._clamp(assessment.domain_score), start_time
+                ),
+                "quality": self.quality_validator._build_result(
+                    response,
+                    self._clamp(assessment.completeness_score),
+                    self._clamp(assessment.clarity_score),
+                    self._clamp(assessment.actionability_score),
+                    start_time
+                ),
+            }
+            for result in results.values():
+                result.metadata["rubric_call"] = True
+                result.metadata["token_usage"] = usage
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Rubric validation failed: {str(e)}")
+            return {
+                name: ValidationResult(
+                    is_valid=False,
+                    score=0.0,
+                    confidence_level=ConfidenceLevel.FAILED,
+                    reasons=[f"{name.capitalize()} validation error: {str(e)}"],
+                    suggestions=["Check LLM and vector store configuration"],
+                    metadata={"error": str(e), "rubric_call": True}
+                )
+                for name in self.DIMENSIONS
+            }
+    
+    @staticmethod
+    def _clamp(score: float) -> float:
+        return max(0.0, min(1.0, float(score)))
+
+
 class ResponseValidator:
     """Main validator orchestrating all validation components"""
     
-    def __init__(self, embeddings_model: AzureOpenAIEmbeddings, 
-                 llm: AzureChatOpenAI, vector_store: PGVector):
+    DEFAULT_WEIGHTS = {
+        "semantic": 0.25,
+        "contextual": 0.30,
+        "domain": 0.20,
+        "quality": 0.25
+    }
+    
+    def __init__(self, embeddings_model: Embeddings, 
+                 llm: AzureChatOpenAI, vector_store: PGVector,
+                 timeout_seconds: Optional[float] = None,
+                 parallel: bool = True,
+                 use_rubric: bool = False,
+                 cache_ttl_seconds: Optional[int] = None,
+                 validation_mode: str = "default"):
+        """
+        Args:
+            embeddings_model: Embeddings used for semantic relevance
+            llm: Chat model used by the LLM-based validators
+            vector_store: Vector store for contextual accuracy checks
+            timeout_seconds: Per-validator time budget; None disables it
+            parallel: Run the validators concurrently instead of one by one
+            use_rubric: Score contextual, domain and quality in one LLM call
+            cache_ttl_seconds: How long to cache results; None disables caching
+            validation_mode: Validation mode name, part of the cache key
+        """
         self.embeddings = embeddings_model
         self.llm = llm
         self.vector_store = vector_store
+        self.timeout_seconds = timeout_seconds
+        self.parallel = parallel
+        self.use_rubric = use_rubric
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.validation_mode = validation_mode
         
         # Initialize validators
         self.semantic_validator = SemanticRelevanceValidator(embeddings_model)
         self.contextual_validator = ContextualAccuracyValidator(llm, vector_store)
         self.domain_validator = DomainSpecificValidator(llm)
         self.quality_validator = QualityAssessmentValidator(llm)
+        self.rubric_validator = RubricValidator(
+            llm, self.contextual_validator, self.domain_validator, self.quality_validator
+        )
         
         self.logger = logging.getLogger(__name__)
     
     async def validate_response(self, query: str, response: str, domain: str = "courses", 
                               context_docs: List[Document] = None, 
-                              weights: Dict[str, float] = None) -> Dict[str, Any]:
+                              weights: Dict[str, float] = None,
+                              embeddings: Optional[Embeddings] = None) -> Dict[str, Any]:
         """
         Perform comprehensive validation of a response
         
@@ -678,6 +883,8 @@ class ResponseValidator:
             domain: Domain context (courses, skills, general)
             context_docs: Context documents from vector search
             weights: Custom weights for different validators
+            embeddings: Request-scoped embeddings (e.g. an EmbeddingMemo) so
+                texts already embedded for retrieval are not embedded again
         
         Returns:
             Comprehensive validation results
@@ -686,99 +893,326 @@ class ResponseValidator:
         
         # Default weights
         if weights is None:
-            weights = {
-                "semantic": 0.25,
-                "contextual": 0.30,
-                "domain": 0.20,
-                "quality": 0.25
-            }
+            weights = dict(self.DEFAULT_WEIGHTS)
+        
+        cache_key = None
+        if self.cache_ttl_seconds:
+            cache_key = ValidationCache.make_key(
+                query, response, domain, weights, self._cache_mode()
+            )
+            cached = await asyncio.to_thread(validation_cache.get, cache_key)
+            if cached is not None:
+                validation_metrics.record_cache_hit()
+                cached["validation_metadata"]["cache_hit"] = True
+                return cached
+            validation_metrics.record_cache_miss()
         
         try:
-            # Run all validators in parallel
-            semantic_task = self.semantic_validator.validate(query, response)
-            contextual_task = self.contextual_validator.validate(
-                query, response, context_docs=context_docs
+            named_results = await self._run_validators(
+                query, response, domain, context_docs, embeddings
             )
-            domain_task = self.domain_validator.validate(query, response, domain=domain)
-            quality_task = self.quality_validator.validate(query, response)
-            
-            # Await all results
-            semantic_result = await semantic_task
-            contextual_result = await contextual_task
-            domain_result = await domain_task
-            quality_result = await quality_task
-            
-            # Calculate overall score
-            overall_score = (
-                semantic_result.score * weights["semantic"] +
-                contextual_result.score * weights["contextual"] +
-                domain_result.score * weights["domain"] +
-                quality_result.score * weights["quality"]
+            result = self._aggregate_results(
+                named_results, query, response, domain, weights, start_time
             )
             
-            # Determine overall validation status
-            is_valid = overall_score >= 0.60
-            overall_confidence = self._calculate_overall_confidence(overall_score)
-            
-            # Collect all reasons and suggestions
-            all_reasons = []
-            all_suggestions = []
-            failed_validations = []
-            
-            for name, result in [
-                ("semantic", semantic_result),
-                ("contextual", contextual_result),
-                ("domain", domain_result),
-                ("quality", quality_result)
-            ]:
-                all_reasons.extend(result.reasons)
-                all_suggestions.extend(result.suggestions)
-                if not result.is_valid:
-                    failed_validations.append(name)
-            
-            # Remove duplicates while preserving order
-            all_suggestions = list(dict.fromkeys(all_suggestions))
+            # Partial (timed-out) results and validator errors (e.g. a 429)
+            # are transient and must not be replayed to the retry
+            if cache_key and self._is_cacheable(result):
+                await asyncio.to_thread(
+                    validation_cache.set, cache_key, result, self.cache_ttl_seconds
+                )
             
-            duration = time.time() - start_time
+            return result
             
-            return {
-                "is_valid": is_valid,
-                "overall_score": overall_score,
-                "confidence_level": overall_confidence.value,
-                "failed_validations": failed_validations,
-                "reasons": all_reasons,
-                "suggestions": all_suggestions,
-                "individual_results": {
-                    "semantic": semantic_result.to_dict(),
-                    "contextual": contextual_result.to_dict(),
-                    "domain": domain_result.to_dict(),
-                    "quality": quality_result.to_dict()
-                },
-                "validation_metadata": {
-                    "query_length": len(query),
-                    "response_length": len(response),
-                    "domain": domain,
-                    "weights": weights,
-                    "duration_seconds": duration,
-                    "timestamp": time.time()
-                }
+        except Exception as e:
+            self.logger.error(f"Validation orchestration failed: {str(e)}")
+            return self._error_result(e, start_time)
+    
+    async def revalidate_response(self, query: str, response: str,
+                                  previous_result: Dict[str, Any],
+                                  domain: str = "courses",
+                                  context_docs: List[Document] = None,
+                                  weights: Dict[str, float] = None,
+                                  embeddings: Optional[Embeddings] = None) -> Dict[str, Any]:
+        """
+        Validate a regenerated response, re-running only the validators that
+        failed or timed out on the previous attempt
+        
+        Results of validators that passed are carried over from previous_result.
+        Falls back to a full validation when there is nothing to carry over.
+        
+        Args:
+            query: Original user query
+            response: Regenerated response to validate
+            previous_result: validate_response/revalidate_response output for
+                the previous attempt
+            domain: Domain context (courses, skills, general)
+            context_docs: Context documents from vector search
+            weights: Custom weights for different validators
+            embeddings: Request-scoped embeddings (e.g. an EmbeddingMemo)
+        
+        Returns:
+            Comprehensive validation results for the new response
+        """
+        previous = previous_result.get("individual_results") or {}
+        rerun = list(dict.fromkeys(
+            previous_result.get("failed_validations", []) +
+            previous_result.get("timed_out_validations", [])
+        ))
+        if not previous or not rerun or "all" in rerun:
+            return await self.validate_response(
+                query, response, domain=domain, context_docs=context_docs,
+                weights=weights, embeddings=embeddings
+            )
+        
+        start_time = time.time()
+        if weights is None:
+            weights = dict(self.DEFAULT_WEIGHTS)
+        
+        try:
+            named_results = {
+                name: ValidationResult.from_dict(result)
+                for name, result in previous.items()
             }
+            named_results.update(await self._run_validators(
+                query, response, domain, context_docs, embeddings, names=rerun
+            ))
+            result = self._aggregate_results(
+                named_results, query, response, domain, weights, start_time
+            )
+            result["validation_metadata"]["revalidated"] = rerun
+            return result
             
         except Exception as e:
-            self.logger.error(f"Validation orchestration failed: {str(e)}")
-            return {
-                "is_valid": False,
-                "overall_score": 0.0,
-                "confidence_level": ConfidenceLevel.FAILED.value,
-                "failed_validations": ["all"],
-                "reasons": [f"Validation system error: {str(e)}"],
-                "suggestions": ["Check validation system configuration"],
-                "individual_results": {},
-                "validation_metadata": {
-                    "error": str(e),
-                    "duration_seconds": time.time() - start_time
-                }
+            self.logger.error(f"Revalidation failed: {str(e)}")
+            return self._error_result(e, start_time)
+    
+    async def _run_validators(self, query: str, response: str, domain: str,
+                              context_docs: List[Document] = None,
+                              embeddings: Optional[Embeddings] = None,
+                              names: Optional[List[str]] = None) -> Dict[str, ValidationResult]:
+        """Run the configured validators, or only those in `names`"""
+        if self.use_rubric:
+            return await self._run_rubric_validators(
+                query, response, domain, context_docs, embeddings, names
+            )
+        return await self._run_individual_validators(
+            query, response, domain, context_docs, embeddings, names
+        )
+    
+    def _aggregate_results(self, named_results: Dict[str, ValidationResult],
+                           query: str, response: str, domain: str,
+                           weights: Dict[str, float], start_time: float) -> Dict[str, Any]:
+        """Combine per-validator results into the overall validation result"""
+        # Timed-out validators are left out and the remaining weights renormalized;
+        # validators missing from custom weights count for nothing
+        timed_out = [
+            name for name, result in named_results.items()
+            if (result.metadata or {}).get("timed_out")
+        ]
+        completed_weight = sum(
+            weights.get(name, 0.0) for name in named_results if name not in timed_out
+        )
+        overall_score = (
+            sum(
+                result.score * weights.get(name, 0.0)
+                for name, result in named_results.items()
+                if name not in timed_out
+            ) / completed_weight
+            if completed_weight > 0 else 0.0
+        )
+        
+        # Determine overall validation status
+        is_valid = overall_score >= 0.60
+        overall_confidence = self._calculate_overall_confidence(overall_score)
+        
+        # Collect all reasons and suggestions
+        all_reasons = []
+        all_suggestions = []
+        failed_validations = []
+        
+        for name, result in named_results.items():
+            all_reasons.extend(result.reasons)
+            all_suggestions.extend(result.suggestions)
+            if not result.is_valid and name not in timed_out:
+                failed_validations.append(name)
+        
+        # Remove duplicates while preserving order
+        all_suggestions = list(dict.fromkeys(all_suggestions))
+        
+        duration = time.time() - start_time
+        
+        return {
+            "is_valid": is_valid,
+            "overall_score": overall_score,
+            "confidence_level": overall_confidence.value,
+            "failed_validations": failed_validations,
+            "timed_out_validations": timed_out,
+            "reasons": all_reasons,
+            "suggestions": all_suggestions,
+            "individual_results": {
+                name: result.to_dict() for name, result in named_results.items()
+            },
+            "validation_metadata": {
+                "query_length": len(query),
+                "response_length": len(response),
+                "domain": domain,
+                "weights": weights,
+                "rubric_mode": self.use_rubric,
+                "partial": bool(timed_out),
+                "parallel": self.parallel,
+                "timeout_seconds": self.timeout_seconds,
+                "cache_hit": False,
+                "duration_seconds": duration,
+                "timestamp": time.time()
+            }
+        }
+    
+    def _error_result(self, error: Exception, start_time: float) -> Dict[str, Any]:
+        """Failed result returned when orchestration itself raises"""
+        return {
+            "is_valid": False,
+            "overall_score": 0.0,
+            "confidence_level": ConfidenceLevel.FAILED.value,
+            "failed_validations": ["all"],
+            "reasons": [f"Validation system error: {str(error)}"],
+            "suggestions": ["Check validation system configuration"],
+            "individual_results": {},
+            "validation_metadata": {
+                "error": str(error),
+                "duration_seconds": time.time() - start_time
+            }
+        }
+    
+    @staticmethod
+    def _is_cacheable(result: Dict[str, Any]) -> bool:
+        """Only complete results where every validator ran without an error"""
+        if result["timed_out_validations"]:
+            return False
+        return not any(
+            "error" in (individual.get("metadata") or {})
+            for individual in result["individual_results"].values()
+        )
+    
+    def _cache_mode(self) -> str:
+        """Mode component of the cache key; rubric and multi-call results differ"""
+        return f"{self.validation_mode}:{'rubric' if self.use_rubric else 'multi_call'}"
+    
+    async def _run_individual_validators(self, query: str, response: str, domain: str,
+                                         context_docs: List[Document] = None,
+                                         embeddings: Optional[Embeddings] = None,
+                                         names: Optional[List[str]] = None) -> Dict[str, ValidationResult]:
+        """Run the four validators (or those in `names`), concurrently or one by one, each bounded by the timeout"""
+        validator_calls = {
+            "semantic": lambda: self.semantic_validator.validate(
+                query, response, embeddings=embeddings
+            ),
+            "contextual": lambda: self.contextual_validator.validate(
+                query, response, context_docs=context_docs, embeddings=embeddings
+            ),
+            "domain": lambda: self.domain_validator.validate(query, response, domain=domain),
+            "quality": lambda: self.quality_validator.validate(query, response),
+        }
+        if names is not None:
+            validator_calls = {
+                name: call for name, call in validator_calls.items() if name in names
+            }
+        
+        if self.parallel:
+            results = await asyncio.gather(*(
+                self._run_with_timeout(name, call())
+                for name, call in validator_calls.items()
+            ))
+        else:
+            results = [
+                await self._run_with_timeout(name, call())
+                for name, call in validator_calls.items()
+            ]
+        return dict(zip(validator_calls.keys(), results))
+    
+    async def _run_rubric_validators(self, query: str, response: str, domain: str,
+                                     context_docs: List[Document] = None,
+                                     embeddings: Optional[Embeddings] = None,
+                                     names: Optional[List[str]] = None) -> Dict[str, ValidationResult]:
+        """
+        Run semantic validation alongside the single consolidated rubric call
+        
+        With `names`, semantic runs only if listed and the rubric call only if
+        one of its dimensions is; a rubric call always returns all three.
+        """
+        calls = {}
+        if names is None or "semantic" in names:
+            calls["semantic"] = self._run_with_timeout(
+                "semantic", self.semantic_validator.validate(query, response, embeddings=embeddings)
+            )
+        if names is None or any(name in names for name in RubricValidator.DIMENSIONS):
+            calls["rubric"] = self._run_rubric_with_timeout(
+                self.rubric_validator.validate_all(
+                    query, response, domain=domain, context_docs=context_docs,
+                    embeddings=embeddings
+                )
+            )
+        
+        if self.parallel:
+            outputs = dict(zip(calls.keys(), await asyncio.gather(*calls.values())))
+        else:
+            outputs = {key: await call for key, call in calls.items()}
+        
+        results = {}
+        if "semantic" in outputs:
+            results["semantic"] = outputs["semantic"]
+        results.update(outputs.get("rubric", {}))
+        return results
+    
+    async def _run_with_timeout(self, name: str, validation) -> ValidationResult:
+        """
+        Await a validator coroutine within the configured time budget
+        
+        Args:
+            name: Validator key (semantic, contextual, domain, quality)
+            validation: The validator's validate() coroutine
+        
+        Returns:
+            The validator's result, or a result marked timed_out if it ran too long
+        """
+        if not self.timeout_seconds:
+            return await validation
+        
+        try:
+            return await asyncio.wait_for(validation, timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                f"{name} validation timed out after {self.timeout_seconds}s"
+            )
+            return self._timed_out_result(name)
+    
+    async def _run_rubric_with_timeout(self, validation) -> Dict[str, ValidationResult]:
+        """Await the rubric call within the time budget; a timeout marks every rubric dimension"""
+        if not self.timeout_seconds:
+            return await validation
+        
+        try:
+            return await asyncio.wait_for(validation, timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                f"Rubric validation timed out after {self.timeout_seconds}s"
+            )
+            return {name: self._timed_out_result(name) for name in RubricValidator.DIMENSIONS}
+    
+    def _timed_out_result(self, name: str) -> ValidationResult:
+        """Partial result for a validator that exceeded its time budget"""
+        return ValidationResult(
+            is_valid=False,
+            score=0.0,
+            confidence_level=ConfidenceLevel.FAILED,
+            reasons=[f"{name.capitalize()} validation timed out after {self.timeout_seconds}s"],
+            suggestions=[],
+            metadata={
+                "validator": name,
+                "timed_out": True,
+                "duration_seconds": float(self.timeout_seconds)
             }
+        )
     
     def _calculate_overall_confidence(self, score: float) -> ConfidenceLevel:
         """Calculate overall confidence level"""
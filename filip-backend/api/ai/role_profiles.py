@@ -0,0 +1,216 @@
+import logging
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from django.db import transaction
+from langchain_core.embeddings import Embeddings
+from pgvector.django import CosineDistance
+
+from api.models import JobPost, RoleProfile, RoleProfileSkill
+from api.utils.vector_search import hnsw_ef_search
+from filip import settings
+
+logger = logging.getLogger(__name__)
+
+# Skills returned per role by the lookup
+ROLE_PROFILE_MAX_SKILLS = 20
+
+
+def normalize_title(title: str) -> str:
+    """Lower-case a job title and drop punctuation so variants group together."""
+    return re.sub(r"\s+", " ", re.sub(r"[^\w+#./ ]", " ", title.lower())).strip()
+
+
+def _unit(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def cluster_job_posts(
+    posts: List[Tuple[str, str]], embeddings: np.ndarray, threshold: float = 0.9
+) -> List[List[int]]:
+    """
+    Group job posts into roles.
+
+    Posts sharing a normalised (category, title) form a seed. Seeds are then
+    taken largest first and merged into the most similar existing cluster
+    when their centroids have cosine similarity >= threshold.
+
+    Args:
+        posts: (category, job_title) per post
+        embeddings: Unit-length post embeddings, one row per post
+        threshold: Minimum centroid similarity for merging seeds
+
+    Returns:
+        Clusters as lists of indexes into posts
+    """
+    seeds: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+    for i, (category, title) in enumerate(posts):
+        seeds[(category, normalize_title(title))].append(i)
+
+    ordered = sorted(seeds.values(), key=len, reverse=True)
+
+    clusters: List[List[int]] = []
+    sums: List[np.ndarray] = []
+    for members in ordered:
+        seed_sum = embeddings[members].sum(axis=0)
+        if clusters:
+            similarities = _unit(np.vstack(sums)) @ _unit(seed_sum)
+            best = int(np.argmax(similarities))
+            if similarities[best] >= threshold:
+                clusters[best].extend(members)
+                sums[best] = sums[best] + seed_sum
+                continue
+        clusters.append(list(members))
+        sums.append(seed_sum)
+    return clusters
+
+
+def skill_frequencies(skill_lists: List[List[str]]) -> List[Tuple[str, int]]:
+    """
+    Count in how many posts each skill appears, case-insensitively.
+
+    Returns:
+        (skill name in its most common spelling, support) pairs, most frequent first
+    """
+    support: Counter = Counter()
+    spellings: Dict[str, Counter] = defaultdict(Counter)
+    for skills in skill_lists:
+        seen = set()
+        for skill in skills:
+            name = skill.strip()
+            key = name.lower()
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            support[key] += 1
+            spellings[key][name] += 1
+    return [
+        (spellings[key].most_common(1)[0][0], count)
+        for key, count in sorted(support.items(), key=lambda item: (-item[1], item[0]))
+    ]
+
+
+def build_role_profiles(
+    threshold: float = 0.9,
+    min_posts: int = 3,
+    min_share: float = 0.05,
+    max_skills: int = 50,
+) -> Tuple[int, int]:
+    """
+    Rebuild every RoleProfile from the embedded JobPost rows.
+
+    Args:
+        threshold: Centroid similarity for merging title groups into one role
+        min_posts: Roles with fewer posts are dropped as noise
+        min_share: Skills listed by a smaller share of a role's posts are dropped
+        max_skills: Skills stored per role
+
+    Returns:
+        (profiles created, job posts covered)
+    """
+    rows = list(
+        JobPost.objects.exclude(embedding=None)
+        .order_by("id")
+        .values_list("category", "job_title", "skills", "embedding")
+    )
+    if not rows:
+        return 0, 0
+
+    embeddings = _unit(np.vstack([np.asarray(row[3], dtype=np.float32) for row in rows]))
+    clusters = [
+        members
+        for members in cluster_job_posts([(row[0], row[1]) for row in rows], embeddings, threshold)
+        if len(members) >= min_posts
+    ]
+
+    profiles: List[RoleProfile] = []
+    profile_skills: List[List[Tuple[str, int]]] = []
+    for members in clusters:
+        titles = Counter(rows[i][1] for i in members)
+        categories = Counter(rows[i][0] for i in members)
+        post_count = len(members)
+        profiles.append(
+            RoleProfile(
+                title=titles.most_common(1)[0][0],
+                category=categories.most_common(1)[0][0],
+                titles=[title for title, _ in titles.most_common(10)],
+                post_count=post_count,
+                embedding=_unit(embeddings[members].sum(axis=0)).tolist(),
+            )
+        )
+        frequencies = skill_frequencies([rows[i][2] or [] for i in members])
+        profile_skills.append(
+            [(name, count) for name, count in frequencies if count / post_count >= min_share][:max_skills]
+        )
+
+    with transaction.atomic():
+        RoleProfile.objects.all().delete()
+        RoleProfile.objects.bulk_create(profiles, batch_size=500)
+        RoleProfileSkill.objects.bulk_create(
+            [
+                RoleProfileSkill(
+                    profile=profile,
+                    name=name[:255],
+                    support=count,
+                    share=round(count / profile.post_count, 4),
+                    rank=rank,
+                )
+                for profile, skills in zip(profiles, profile_skills)
+                for rank, (name, count) in enumerate(skills, 1)
+            ],
+            batch_size=1000,
+        )
+
+    covered = sum(profile.post_count for profile in profiles)
+    logger.info(f"Built {len(profiles)} role profiles covering {covered}/{len(rows)} job posts")
+    return len(profiles), covered
+
+
+def find_role_profile(
+    target_goal: str,
+    embeddings: Embeddings,
+    max_skills: int = ROLE_PROFILE_MAX_SKILLS,
+    min_similarity: Optional[float] = None,
+) -> Optional[Tuple[RoleProfile, List[RoleProfileSkill]]]:
+    """
+    Nearest role profile for a goal, with its top skills.
+
+    Args:
+        target_goal: Job title or free-form role description
+        embeddings: Embeddings used for the goal (typically the request memo)
+        max_skills: Skills returned, highest share first
+        min_similarity: Cosine similarity the nearest profile needs,
+            defaults to ROLE_PROFILE_MIN_SIMILARITY
+
+    Returns:
+        (profile, skills), or None when no profile is similar enough
+        (profile.similarity holds the match score)
+    """
+    min_similarity = (
+        settings.ROLE_PROFILE_MIN_SIMILARITY if min_similarity is None else min_similarity
+    )
+    vector = embeddings.embed_query(target_goal)
+    with hnsw_ef_search(k=1):
+        profile = (
+            RoleProfile.objects.annotate(distance=CosineDistance("embedding", vector))
+            .order_by("distance")
+            .first()
+        )
+    if profile is None:
+        return None
+
+    profile.similarity = 1.0 - float(profile.distance)
+    if profile.similarity < min_similarity:
+        logger.info(
+            f"Nearest role profile '{profile.title}' is too far from '{target_goal}' "
+            f"(similarity {profile.similarity:.2f} < {min_similarity:.2f})"
+        )
+        return None
+
+    skills = list(profile.skills.order_by("rank")[:max_skills])
+    if not skills:
+        return None
+    return profile, skills
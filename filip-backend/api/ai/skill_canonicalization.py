@@ -0,0 +1,160 @@
+"""
+Skill canonicalisation.
+
+Maps free-text skill names to Skill rows so skill matching can use the
+stored Skill embeddings instead of embedding every name per request:
+
+1. exact match on Skill.normalized_name or SkillAlias.normalized_name
+2. for unknown names only: embed once, nearest Skill by HNSW; close matches
+   are written back as SkillAlias (with the name's own embedding), others as
+   new Skill rows
+
+Once a name has been seen, later requests resolve it with one indexed
+lookup and no embedding API call.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from django.db import IntegrityError
+from langchain_core.embeddings import Embeddings
+from pgvector.django import CosineDistance
+
+from api.models import Skill, SkillAlias
+from api.utils.embedding import get_request_embeddings
+from api.utils.skill_names import normalize_skill_name
+from api.utils.vector_search import hnsw_ef_search
+from filip import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CanonicalSkill:
+    """A requested skill name resolved to a Skill"""
+    name: str
+    skill_id: Optional[str]
+    canonical_name: str
+    embedding: List[float]
+    # "exact", "alias", "nearest" (new alias) or "new" (new Skill)
+    match: str
+    similarity: float = 1.0
+
+
+def _lookup_known(keys: List[str]) -> Dict[str, CanonicalSkill]:
+    """Resolve normalised names from Skill and SkillAlias rows that have embeddings"""
+    known: Dict[str, CanonicalSkill] = {}
+    for skill in Skill.objects.filter(normalized_name__in=keys).exclude(embedding=None):
+        known.setdefault(
+            skill.normalized_name,
+            CanonicalSkill(skill.name, str(skill.id), skill.name, list(skill.embedding), "exact"),
+        )
+
+    remaining = [key for key in keys if key not in known]
+    if remaining:
+        aliases = (
+            SkillAlias.objects.filter(normalized_name__in=remaining)
+            .exclude(embedding=None, skill__embedding=None)
+            .select_related("skill")
+        )
+        for alias in aliases:
+            # Aliases stored before SkillAlias.embedding existed use the Skill's vector
+            embedding = alias.embedding if alias.embedding is not None else alias.skill.embedding
+            known[alias.normalized_name] = CanonicalSkill(
+                alias.name, str(alias.skill_id), alias.skill.name,
+                list(embedding), "alias", alias.similarity,
+            )
+    return known
+
+
+def _nearest_skill(vector: List[float]) -> Optional[Skill]:
+    with hnsw_ef_search(k=1):
+        return (
+            Skill.objects.exclude(embedding=None)
+            .annotate(distance=CosineDistance("embedding", vector))
+            .order_by("distance")
+            .first()
+        )
+
+
+def _resolve_unknown(name: str, key: str, vector: List[float], threshold: float) -> CanonicalSkill:
+    """Match a newly seen name to its nearest Skill and write the result back"""
+    if not key:
+        return CanonicalSkill(name, None, name, vector, "new", 1.0)
+    nearest = _nearest_skill(vector)
+    similarity = 1.0 - float(nearest.distance) if nearest is not None else 0.0
+
+    try:
+        if nearest is not None and similarity >= threshold:
+            SkillAlias.objects.get_or_create(
+                normalized_name=key,
+                defaults={
+                    "name": name[:255], "skill": nearest, "similarity": similarity,
+                    "embedding": vector,
+                },
+            )
+            return CanonicalSkill(name, str(nearest.id), nearest.name, vector, "nearest", similarity)
+
+        skill, created = Skill.objects.get_or_create(
+            name=name[:255], defaults={"normalized_name": key, "embedding": vector}
+        )
+        if not created and skill.embedding is None:
+            # Listed in skills.json but never embedded (embed_skills not run)
+            skill.embedding = vector
+            skill.save(update_fields=["embedding"])
+        return CanonicalSkill(name, str(skill.id), skill.name, vector, "new", 1.0)
+    except IntegrityError as e:
+        # Written concurrently by another request; the vector is still valid
+        logger.debug(f"Skill write-back for '{name}' skipped: {str(e)}")
+    except Exception as e:
+        logger.warning(f"Skill write-back for '{name}' failed: {str(e)}")
+    return CanonicalSkill(name, None, name, vector, "new", 1.0)
+
+
+def canonicalize_skills(
+    names: List[str],
+    embeddings: Optional[Embeddings] = None,
+    threshold: Optional[float] = None,
+) -> List[CanonicalSkill]:
+    """
+    Resolve skill names to Skill rows and their stored embeddings.
+
+    Args:
+        names: Free-text skill names, e.g. from a CV or job posts
+        embeddings: Used only for names never seen before, defaults to the
+            request embeddings
+        threshold: Cosine similarity for aliasing an unknown name to an
+            existing Skill, defaults to SKILL_ALIAS_THRESHOLD
+
+    Returns:
+        One CanonicalSkill per input name, in order
+    """
+    if not names:
+        return []
+    threshold = settings.SKILL_ALIAS_THRESHOLD if threshold is None else threshold
+    keys = [normalize_skill_name(name) for name in names]
+
+    try:
+        resolved = _lookup_known(list(set(keys)))
+    except Exception as e:
+        logger.warning(f"Skill lookup failed, embedding all names: {str(e)}")
+        vectors = (embeddings or get_request_embeddings()).embed_documents(names)
+        return [CanonicalSkill(n, None, n, v, "new", 1.0) for n, v in zip(names, vectors)]
+
+    # First spelling of each unknown key, embedded in one round trip
+    unknown: Dict[str, str] = {}
+    for name, key in zip(names, keys):
+        if key not in resolved:
+            unknown.setdefault(key, name)
+    if unknown:
+        vectors = (embeddings or get_request_embeddings()).embed_documents(list(unknown.values()))
+        for (key, name), vector in zip(unknown.items(), vectors):
+            resolved[key] = _resolve_unknown(name, key, vector, threshold)
+        logger.info(f"Canonicalised {len(unknown)} new skill names out of {len(names)}")
+
+    return [
+        CanonicalSkill(name, r.skill_id, r.canonical_name, r.embedding, r.match, r.similarity)
+        for name, key in zip(names, keys)
+        for r in [resolved[key]]
+    ]
@@ -1,10 +1,13 @@
+import time
+
 from langchain_community.callbacks.manager import get_openai_callback
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 from langgraph.graph.graph import CompiledGraph
-from typing_extensions import Any, Dict, List, TypedDict, cast
+from typing_extensions import Any, Dict, Iterator, List, Tuple, TypedDict, cast
 
 from api.types import LLMUsage
+from api.utils.embedding import embedding_memo
 
 from .agent_rag_skills import (
     compute_missing,
@@ -20,7 +23,7 @@ class SkillGapState(TypedDict, total=False):
     timeline: str
     project_requirements: str
     target_skills: List[Dict[str, str]]
-    target_skills_raw: List[str]
+    target_skills_raw: List[Dict[str, Any]]
     missing_skills: List[Dict[str, str]]
     recommended_skills: List[Dict[str, Any]]
     overall_score: int
@@ -148,9 +151,43 @@ def run_skill_gap_pipeline(
 ) -> SkillGapState:
     graph = get_skill_gap_graph()
 
-    final_state = cast(
-        SkillGapState,
-        graph.invoke(
+    # One text -> vector memo for the whole run, shared by every node
+    with embedding_memo():
+        final_state = cast(
+            SkillGapState,
+            graph.invoke(
+                {
+                    "current_skills": current_skills,
+                    "target_goal": target_goal,
+                    "timeline": timeline,
+                    "project_requirements": project_requirements,
+                },
+                config={"configurable": {"thread_id": thread_id}},
+            ),
+        )
+
+    return final_state
+
+
+def stream_skill_gap_pipeline(
+    current_skills: List[Dict[str, str]],
+    target_goal: str,
+    timeline: str,
+    project_requirements: str,
+    thread_id: str,
+) -> Iterator[Tuple[str, SkillGapState, float]]:
+    """
+    Run the same pipeline as run_skill_gap_pipeline, yielding each node's
+    output as soon as it finishes.
+
+    Yields:
+        (node name, the node's state update, seconds the node took)
+    """
+    graph = get_skill_gap_graph()
+
+    with embedding_memo():
+        started = time.time()
+        for chunk in graph.stream(
             {
                 "current_skills": current_skills,
                 "target_goal": target_goal,
@@ -158,7 +195,9 @@ def run_skill_gap_pipeline(
                 "project_requirements": project_requirements,
             },
             config={"configurable": {"thread_id": thread_id}},
-        ),
-    )
-
-    return final_state
+            stream_mode="updates",
+        ):
+            finished = time.time()
+            for node, update in chunk.items():
+                yield node, cast(SkillGapState, update or {}), finished - started
+            started = finished
@@ -0,0 +1,203 @@
+"""
+Precomputed skill-to-skill similarity graph.
+
+The build_skill_graph command stores, for every embedded Skill, its top-k
+most similar skills in SkillNeighbor. Each process keeps the table in memory
+(reloaded every SKILL_GRAPH_TTL_SECONDS), so skill equivalence checks are
+dict lookups and do not need embeddings or a similarity matrix.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.db import transaction
+
+from api.models import Skill, SkillAlias, SkillNeighbor
+from api.utils.skill_names import normalize_skill_name
+from filip import settings
+
+logger = logging.getLogger(__name__)
+
+
+def top_k_neighbors(
+    vectors: np.ndarray, k: int, block_size: int = 512
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact top-k cosine neighbours of every row, excluding the row itself.
+
+    Args:
+        vectors: (n, d) embeddings
+        k: Neighbours per row (capped at n - 1)
+        block_size: Rows multiplied at once, bounds memory to block_size * n
+
+    Returns:
+        (indices, similarities), both (n, k) and most similar first
+    """
+    n = len(vectors)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.zeros((n, 0), dtype=int), np.zeros((n, 0), dtype=np.float32)
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit = (vectors / np.where(norms == 0, 1.0, norms)).astype(np.float32)
+
+    indices = np.zeros((n, k), dtype=int)
+    similarities = np.zeros((n, k), dtype=np.float32)
+    for start in range(0, n, block_size):
+        block = unit[start : start + block_size] @ unit.T
+        rows = np.arange(len(block))
+        block[rows, rows + start] = -np.inf
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        order = np.argsort(-block[rows[:, None], top], axis=1)
+        top = top[rows[:, None], order]
+        indices[start : start + len(block)] = top
+        similarities[start : start + len(block)] = block[rows[:, None], top]
+    return indices, similarities
+
+
+def build_skill_graph(k: int = 20, batch_size: int = 5000) -> Tuple[int, int]:
+    """
+    Rebuild SkillNeighbor from the stored Skill embeddings.
+
+    Args:
+        k: Neighbours stored per skill
+        batch_size: Rows per bulk insert
+
+    Returns:
+        (skills in the graph, neighbour rows written)
+    """
+    rows = list(
+        Skill.objects.exclude(embedding=None).order_by("id").values_list("id", "embedding")
+    )
+    if not rows:
+        return 0, 0
+    ids = [skill_id for skill_id, _ in rows]
+    vectors = np.array([embedding for _, embedding in rows], dtype=np.float32)
+
+    indices, similarities = top_k_neighbors(vectors, k)
+    neighbors = [
+        SkillNeighbor(
+            skill_id=ids[i],
+            neighbor_id=ids[j],
+            similarity=float(similarities[i, rank]),
+            rank=rank + 1,
+        )
+        for i in range(len(ids))
+        for rank, j in enumerate(indices[i])
+    ]
+
+    with transaction.atomic():
+        SkillNeighbor.objects.all().delete()
+        SkillNeighbor.objects.bulk_create(neighbors, batch_size=batch_size)
+
+    logger.info(f"Built skill graph: {len(ids)} skills, {len(neighbors)} neighbour rows")
+    return len(ids), len(neighbors)
+
+
+class SkillGraph:
+    """In-process copy of SkillNeighbor, keyed by Skill id"""
+
+    def __init__(self, ttl_seconds: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds
+        self._neighbors: Dict[str, Dict[str, float]] = {}
+        # normalised name (Skill or SkillAlias) -> Skill id, and Skill id -> name
+        self._ids: Dict[str, str] = {}
+        self._names: Dict[str, str] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        ttl = settings.SKILL_GRAPH_TTL_SECONDS if self.ttl_seconds is None else self.ttl_seconds
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < ttl:
+            return
+        with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < ttl:
+                return
+            try:
+                self._load()
+            except Exception as e:
+                # Keep the previous graph; callers fall back to embeddings
+                logger.warning(f"Failed to load skill graph: {str(e)}")
+            self._loaded_at = time.monotonic()
+
+    def _load(self):
+        neighbors: Dict[str, Dict[str, float]] = defaultdict(dict)
+        queryset = SkillNeighbor.objects.values_list("skill_id", "neighbor_id", "similarity")
+        for skill_id, neighbor_id, similarity in queryset.iterator(chunk_size=5000):
+            neighbors[str(skill_id)][str(neighbor_id)] = similarity
+
+        ids: Dict[str, str] = {}
+        names: Dict[str, str] = {}
+        for skill_id, name, normalized_name in Skill.objects.values_list(
+            "id", "name", "normalized_name"
+        ):
+            names[str(skill_id)] = name
+            ids.setdefault(normalized_name or normalize_skill_name(name), str(skill_id))
+        for normalized_name, skill_id in SkillAlias.objects.values_list("normalized_name", "skill_id"):
+            ids.setdefault(normalized_name, str(skill_id))
+
+        self._neighbors, self._ids, self._names = dict(neighbors), ids, names
+        logger.info(f"Loaded skill graph with {len(self._neighbors)} skills")
+
+    def skill_id(self, name: str) -> Optional[str]:
+        """Skill id for a skill name or known alias"""
+        self._ensure_loaded()
+        return self._ids.get(normalize_skill_name(name))
+
+    def best_match(
+        self, target_id: Optional[str], candidate_ids: Sequence[Optional[str]]
+    ) -> Optional[Tuple[int, float]]:
+        """
+        Most similar candidate for a skill, from the stored neighbours.
+
+        Only answers when the result is exact: every skill must be in the graph
+        and at least one candidate among the target's top-k (any other
+        candidate is less similar than the k-th neighbour).
+
+        Returns:
+            (candidate index, similarity), or None if embeddings are needed
+        """
+        self._ensure_loaded()
+        neighbors = self._neighbors.get(target_id or "")
+        if not neighbors or not candidate_ids:
+            return None
+        if any(not candidate or candidate not in self._neighbors for candidate in candidate_ids):
+            return None
+
+        best: Optional[Tuple[int, float]] = None
+        for index, candidate in enumerate(candidate_ids):
+            similarity = 1.0 if candidate == target_id else neighbors.get(candidate)
+            if similarity is not None and (best is None or similarity > best[1]):
+                best = (index, similarity)
+        return best
+
+    def equivalent_names(self, name: str, threshold: Optional[float] = None) -> List[str]:
+        """
+        The Skill a name resolves to, then its neighbours at least `threshold`
+        similar, most similar first.
+
+        Args:
+            name: Skill name or alias
+            threshold: Defaults to SKILL_ALIAS_THRESHOLD
+
+        Returns:
+            Skill names, empty if the name is not a known skill or alias
+        """
+        threshold = settings.SKILL_ALIAS_THRESHOLD if threshold is None else threshold
+        skill_id = self.skill_id(name)
+        if skill_id is None:
+            return []
+        neighbors = sorted(self._neighbors.get(skill_id, {}).items(), key=lambda item: -item[1])
+        return [self._names[skill_id]] + [
+            self._names[neighbor_id]
+            for neighbor_id, similarity in neighbors
+            if similarity >= threshold and neighbor_id in self._names
+        ]
+
+
+# Global graph instance
+skill_graph = SkillGraph()
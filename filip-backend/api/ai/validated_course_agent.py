@@ -12,11 +12,21 @@ import time
 from typing import Dict, List, Any, Optional, Tuple
 import json
 
-from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
 from langchain_postgres.vectorstores import PGVector
 from langchain.schema import Document
 
+from api.services.course_enrichment import (
+    enrich_course,
+    load_course_enrichments,
+    lookup_enrichment,
+)
+from api.utils.embedding import EmbeddingMemo
+from api.utils.llm_clients import get_chat_llm, get_embeddings
+
+from .concurrency import bounded_gather
+from .recommendation_context import RecommendationContext
 from .response_validation import ResponseValidator
+from .skill_graph import skill_graph
 from .validation_config import ValidationConfig, ValidationConfigManager, ValidationMode, validation_metrics
 
 logger = logging.getLogger(__name__)
@@ -40,26 +50,21 @@ class ValidatedCourseAgent:
         self.config = validation_config or ValidationConfigManager.get_default_config()
         
         # Initialize Azure OpenAI components
-        self.llm = AzureChatOpenAI(
-            model=azure_config["deployment_name"],
-            openai_api_version=azure_config["api_version"],
-            azure_endpoint=azure_config["azure_endpoint"],
-            api_key=azure_config["api_key"],
-            temperature=0,
-        )
-        
-        self.embeddings = AzureOpenAIEmbeddings(
-            openai_api_version=azure_config["api_version"],
-            azure_endpoint=azure_config["azure_endpoint"],
-            api_key=azure_config["embeddings_api_key"],
-            model=azure_config["embeddings_deployment"],
-        )
+        self.llm = get_chat_llm(deployment=azure_config["deployment_name"])
+        self.embeddings = get_embeddings(azure_config["embeddings_deployment"])
         
         # Initialize validator
         self.validator = ResponseValidator(
             embeddings_model=self.embeddings,
             llm=self.llm,
-            vector_store=vector_store
+            vector_store=vector_store,
+            timeout_seconds=self.config.validation_timeout_seconds,
+            parallel=self.config.enable_parallel_validation,
+            use_rubric=self.config.use_rubric_validator,
+            cache_ttl_seconds=(
+                self.config.cache_ttl_seconds if self.config.enable_validation_caching else None
+            ),
+            validation_mode=self.config.mode.value
         )
         
         self.logger = logging.getLogger(f"{__name__}.ValidatedCourseAgent")
@@ -81,25 +86,30 @@ class ValidatedCourseAgent:
         start_time = time.time()
         
         try:
-            # Generate query
-            query = self._build_recommendation_query(user_skills, target_skills)
-            
-            # Generate recommendation with validation
-            result = await self._generate_recommendation_with_validation(
-                query=query,
+            # Request-scoped context: retrieval runs once and is reused by
+            # generation, validation and every regeneration attempt, and the
+            # query is embedded once for both retrieval and semantic validation
+            context = RecommendationContext(
+                query=self._build_recommendation_query(user_skills, target_skills),
                 user_skills=user_skills,
                 target_skills=target_skills,
                 max_results=max_results,
-                domain=domain
+                domain=domain,
+                embeddings=EmbeddingMemo(self.embeddings)
             )
             
+            # Generate recommendation with validation
+            result = await self._generate_recommendation_with_validation(context)
+            
             # Add metadata
             result["processing_metadata"] = {
                 "total_duration_seconds": time.time() - start_time,
                 "validation_config": self.config.mode.value,
                 "user_skills_count": len(user_skills),
                 "target_skills_count": len(target_skills),
-                "max_results": max_results
+                "max_results": max_results,
+                "retrievals": context.retrievals,
+                "embeddings": context.embeddings.stats()
             }
             
             return result
@@ -119,41 +129,52 @@ class ValidatedCourseAgent:
                 }
             }
     
-    async def _generate_recommendation_with_validation(self, query: str, user_skills: List[str], 
-                                                     target_skills: List[str], max_results: int, 
-                                                     domain: str) -> Dict[str, Any]:
+    async def _generate_recommendation_with_validation(self, context: RecommendationContext) -> Dict[str, Any]:
         """
         Generate recommendation with validation and regeneration
         
         Args:
-            query: Generated query for course search
-            user_skills: User's current skills
-            target_skills: Target skills to learn
-            max_results: Maximum results to return
-            domain: Domain for validation
+            context: Request-scoped query, skills and retrieval results
             
         Returns:
             Recommendation result with validation
         """
         attempts = 0
         max_attempts = self.config.max_regeneration_attempts + 1
+        validation_result = None
+        suggestions: List[str] = []
         
         while attempts < max_attempts:
             attempts += 1
             
             try:
-                # Generate courses and reasoning
+                # Generate courses and reasoning; retries reuse the courses and
+                # only regenerate the reasoning, guided by the suggestions
                 courses, reasoning = await self._generate_courses_and_reasoning(
-                    query, user_skills, target_skills, max_results, attempts
+                    context, attempts, suggestions
                 )
                 
-                # Validate the response
-                validation_result = await self.validator.validate_response(
-                    query=query,
-                    response=reasoning,
-                    domain=domain,
-                    weights=self.config.get_weights()
-                )
+                # Validate the response against the same retrieved documents;
+                # retries only re-run the validators that failed last time
+                if validation_result is None:
+                    validation_result = await self.validator.validate_response(
+                        query=context.query,
+                        response=reasoning,
+                        domain=context.domain,
+                        context_docs=context.context_docs,
+                        weights=self.config.get_weights(),
+                        embeddings=context.embeddings
+                    )
+                else:
+                    validation_result = await self.validator.revalidate_response(
+                        query=context.query,
+                        response=reasoning,
+                        previous_result=validation_result,
+                        domain=context.domain,
+                        context_docs=context.context_docs,
+                        weights=self.config.get_weights(),
+                        embeddings=context.embeddings
+                    )
                 
                 # Check if validation passed or we've exhausted attempts
                 is_valid = validation_result.get("is_valid", False)
@@ -223,36 +244,36 @@ class ValidatedCourseAgent:
             }
         }
     
-    async def _generate_courses_and_reasoning(self, query: str, user_skills: List[str], 
-                                            target_skills: List[str], max_results: int, 
-                                            attempt: int) -> Tuple[List[Dict[str, Any]], str]:
+    async def _generate_courses_and_reasoning(self, context: RecommendationContext,
+                                            attempt: int,
+                                            suggestions: Optional[List[str]] = None) -> Tuple[List[Dict[str, Any]], str]:
         """
         Generate courses and reasoning text
         
         Args:
-            query: Search query
-            user_skills: User's current skills
-            target_skills: Target skills
-            max_results: Maximum results
+            context: Request-scoped query, skills and retrieval results
             attempt: Current generation attempt
+            suggestions: Improvement suggestions from the previous validation
             
         Returns:
             Tuple of (courses, reasoning)
         """
-        # Search for relevant courses
-        context_docs = await asyncio.to_thread(
-            self.vector_store.similarity_search, query, k=max_results * 2
-        )
+        # Search for relevant courses (once per request)
+        context_docs = await context.retrieve(self.vector_store)
         
         if not context_docs:
             return [], "No relevant courses found in the database."
         
-        # Extract course information
-        courses = await self._extract_course_information(context_docs, target_skills, max_results)
+        # Extract course information; regeneration attempts reuse it
+        if context.courses is None:
+            context.courses = await self._extract_course_information(
+                context_docs, context.target_skills, context.max_results
+            )
+        courses = context.courses
         
         # Generate reasoning
         reasoning = await self._generate_reasoning(
-            user_skills, target_skills, courses, attempt
+            context.user_skills, context.target_skills, courses, attempt, suggestions
         )
         
         return courses, reasoning
@@ -261,41 +282,94 @@ class ValidatedCourseAgent:
                                         target_skills: List[str], 
                                         max_results: int) -> List[Dict[str, Any]]:
         """Extract and structure course information from documents"""
-        courses = []
+        docs = docs[:max_results]
         
-        for doc in docs[:max_results]:
-            metadata = doc.metadata
-            
-            # Get course highlights using LLM
-            highlights = await self._get_course_highlights(metadata.get("url", ""), doc.page_content)
-            
-            # Match skills
-            matched_skills = []
-            for skill in target_skills:
-                matched_skills.append({
-                    "name": skill,
-                    "matched": skill.lower() in doc.page_content.lower()
-                })
-            
-            course_info = {
-                "course_title": metadata.get("title", ""),
-                "course_description": doc.page_content,
-                "course_url": metadata.get("url", ""),
-                "course_level": metadata.get("level", ""),
-                "course_duration": metadata.get("duration", ""),
-                "course_instructor": metadata.get("instructors", ""),
-                "course_rating": metadata.get("rating", 0),
-                "course_price": metadata.get("price", ""),
-                "course_provider": metadata.get("provider", ""),
-                "course_students": metadata.get("students", 0),
-                "course_skills": matched_skills,
-                "course_highlights": highlights,
-                "target": str(int(time.time()))  # Current timestamp
-            }
-            
-            courses.append(course_info)
+        # Precomputed highlights from the DB; missing/stale courses are
+        # enriched below, inside the bounded fan-out
+        enrichments, stale_courses = await asyncio.to_thread(
+            load_course_enrichments,
+            course_ids=[str(doc.metadata.get("course_id", "")) for doc in docs],
+            urls=[doc.metadata.get("url", "") for doc in docs]
+        )
+        stale = {key: course for course in stale_courses for key in (course.id, course.url)}
+        # Names each target skill also counts as matched by ("K8s" -> "Kubernetes")
+        equivalents = await asyncio.to_thread(
+            lambda: {skill: skill_graph.equivalent_names(skill) for skill in target_skills}
+        )
+        
+        # Enrich courses concurrently (capped), keeping retrieval order;
+        # a course whose enrichment fails falls back to placeholder highlights
+        return await bounded_gather(
+            [
+                lambda doc=doc: self._build_course_info(
+                    doc, target_skills, enrichments, equivalents, stale
+                )
+                for doc in docs
+            ],
+            limit=self.config.max_concurrent_enrichments,
+            fallback=lambda i, e: self._course_info(
+                docs[i], target_skills, ["Course highlights not available"], equivalents
+            )
+        )
+    
+    async def _build_course_info(self, doc: Document, target_skills: List[str],
+                                 enrichments: Dict[str, Any],
+                                 equivalents: Optional[Dict[str, List[str]]] = None,
+                                 stale: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build one course entry, generating highlights only if none are stored"""
+        metadata = doc.metadata
+        course_id, url = str(metadata.get("course_id", "")), metadata.get("url", "")
+        stale = stale or {}
+        
+        highlights = list(lookup_enrichment(enrichments, course_id, url)["highlights"])
+        course = stale.get(course_id) or stale.get(url)
+        if not highlights and course is not None:
+            # Catalogue course never enriched (or changed since): generate and store it
+            try:
+                enrichment = await asyncio.to_thread(enrich_course, course)
+                highlights = list(enrichment["highlights"])
+            except Exception as e:
+                logger.warning(f"Enrichment failed for course {course.id}: {str(e)}")
+        if not highlights:
+            # Course not in the catalogue (e.g. CSV-only collection entries) or enrichment failed
+            highlights = await self._get_course_highlights(url, doc.page_content)
         
-        return courses
+        return self._course_info(doc, target_skills, highlights, equivalents)
+    
+    def _course_info(self, doc: Document, target_skills: List[str],
+                     highlights: List[str],
+                     equivalents: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+        """Structure a course document and its highlights for the response"""
+        metadata = doc.metadata
+        content = doc.page_content.lower()
+        equivalents = equivalents or {}
+        
+        # Match skills by name or by an equivalent skill from the skill graph
+        matched_skills = []
+        for skill in target_skills:
+            names = [skill] + equivalents.get(skill, [])
+            matched_skills.append({
+                "name": skill,
+                "matched": any(name.lower() in content for name in names)
+            })
+        
+        return {
+            "course_title": metadata.get("title", ""),
+            "course_description": doc.page_content,
+            "course_url": metadata.get("url", ""),
+            "course_level": metadata.get("level", ""),
+            "course_duration": metadata.get("duration", ""),
+            "course_duration_hours": metadata.get("duration_hours"),
+            "course_question_count": metadata.get("question_count"),
+            "course_instructor": metadata.get("instructors", ""),
+            "course_rating": metadata.get("rating", 0),
+            "course_price": metadata.get("price", ""),
+            "course_provider": metadata.get("provider", ""),
+            "course_students": metadata.get("students", 0),
+            "course_skills": matched_skills,
+            "course_highlights": highlights,
+            "target": str(int(time.time()))  # Current timestamp
+        }
     
     async def _get_course_highlights(self, url: str, content: str) -> List[str]:
         """Get course highlights using LLM"""
@@ -328,12 +402,20 @@ class ValidatedCourseAgent:
             return ["Course highlights not available"]
     
     async def _generate_reasoning(self, user_skills: List[str], target_skills: List[str], 
-                                courses: List[Dict[str, Any]], attempt: int) -> str:
+                                courses: List[Dict[str, Any]], attempt: int,
+                                suggestions: Optional[List[str]] = None) -> str:
         """Generate reasoning for course recommendations"""
         try:
             # Adjust prompt based on attempt to improve validation
             improvement_note = ""
-            if attempt > 1:
+            if attempt > 1 and suggestions:
+                suggestion_lines = "\n".join(f"                - {s}" for s in suggestions)
+                improvement_note = f"""
+                
+                A previous draft failed validation. Address this feedback:
+{suggestion_lines}
+                """
+            elif attempt > 1:
                 improvement_note = """
                 
                 Focus on:
@@ -392,7 +474,8 @@ class ValidatedCourseAgent:
         return f"Find relevant courses for learning {target_context} {user_context}. Focus on practical, well-rated courses that provide clear learning outcomes."
     
     async def validate_existing_recommendation(self, query: str, response: str, 
-                                             domain: str = "courses") -> Dict[str, Any]:
+                                             domain: str = "courses",
+                                             context_docs: Optional[List[Document]] = None) -> Dict[str, Any]:
         """
         Validate an existing recommendation without regeneration
         
@@ -400,6 +483,7 @@ class ValidatedCourseAgent:
             query: Original query
             response: Response to validate
             domain: Domain context
+            context_docs: Documents already retrieved for the query, if any
             
         Returns:
             Validation results
@@ -409,6 +493,7 @@ class ValidatedCourseAgent:
                 query=query,
                 response=response,
                 domain=domain,
+                context_docs=context_docs,
                 weights=self.config.get_weights()
             )
         except Exception as e:
@@ -0,0 +1,126 @@
+"""
+Validation Result Cache
+
+TTL cache for ResponseValidator results. Identical (query, response, domain,
+weights, mode) inputs are common when a regeneration produces the same
+reasoning or a client retries, and re-validating them costs several LLM
+calls. Results are kept either in-process or in the shared Django cache
+configured under VALIDATION_CACHE_ALIAS.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from django.core.cache import caches
+
+from filip import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LocalValidationCacheBackend:
+    """In-process TTL cache with LRU eviction"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: int):
+        with self._lock:
+            self._entries[key] = (time.time() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SharedValidationCacheBackend:
+    """Django cache backend shared across workers (database table by default)"""
+
+    def __init__(self, alias: str):
+        self.alias = alias
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return caches[self.alias].get(key)
+
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: int):
+        caches[self.alias].set(key, value, timeout=ttl_seconds)
+
+    def clear(self):
+        caches[self.alias].clear()
+
+
+class ValidationCache:
+    """Keyed, TTL-bounded store for validation results"""
+
+    KEY_PREFIX = "validation:v1:"
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    @classmethod
+    def make_key(cls, query: str, response: str, domain: str,
+                 weights: Dict[str, float], mode: str) -> str:
+        """Hash the validation inputs into a cache key"""
+        payload = json.dumps(
+            {
+                "query": query,
+                "response": response,
+                "domain": domain,
+                "weights": weights,
+                "mode": mode,
+            },
+            sort_keys=True,
+        )
+        return cls.KEY_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result, or None on a miss or backend error"""
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Validation cache lookup failed: {e}")
+            return None
+        return copy.deepcopy(value) if value is not None else None
+
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: int):
+        """Store a result; backend errors are logged and ignored"""
+        try:
+            self.backend.set(key, copy.deepcopy(value), ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Validation cache write failed: {e}")
+
+    def clear(self):
+        self.backend.clear()
+
+
+def _create_validation_cache() -> ValidationCache:
+    if settings.VALIDATION_CACHE_BACKEND == "shared":
+        return ValidationCache(SharedValidationCacheBackend(settings.VALIDATION_CACHE_ALIAS))
+    return ValidationCache(LocalValidationCacheBackend(settings.VALIDATION_CACHE_MAX_ENTRIES))
+
+
+# Global cache instance
+validation_cache = _create_validation_cache()
@@ -8,11 +8,13 @@ environment-based settings.
 
 import logging
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import time
 import threading
 
+from filip import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +67,9 @@ class ValidationConfig:
     enable_async_validation: bool = True
     validation_timeout_seconds: int = 30
     enable_parallel_validation: bool = True
+    max_concurrent_enrichments: int = 5  # Cap on parallel per-course LLM calls
+    # Score contextual/domain/quality rubrics in a single LLM call
+    use_rubric_validator: bool = field(default_factory=lambda: settings.VALIDATION_USE_RUBRIC)
     
     # Logging settings
     log_validation_results: bool = True
@@ -259,11 +264,13 @@ class ValidationMetrics:
             "total_score": 0.0,
             "total_duration": 0.0,
             "regenerations": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
             "validator_performances": {
-                "semantic": {"count": 0, "total_score": 0.0, "total_duration": 0.0},
-                "contextual": {"count": 0, "total_score": 0.0, "total_duration": 0.0},
-                "domain": {"count": 0, "total_score": 0.0, "total_duration": 0.0},
-                "quality": {"count": 0, "total_score": 0.0, "total_duration": 0.0}
+                "semantic": {"count": 0, "total_score": 0.0, "total_duration": 0.0, "timeouts": 0},
+                "contextual": {"count": 0, "total_score": 0.0, "total_duration": 0.0, "timeouts": 0},
+                "domain": {"count": 0, "total_score": 0.0, "total_duration": 0.0, "timeouts": 0},
+                "quality": {"count": 0, "total_score": 0.0, "total_duration": 0.0, "timeouts": 0}
             },
             "recent_errors": []
         }
@@ -292,6 +299,10 @@ class ValidationMetrics:
             for validator_name, result in individual_results.items():
                 if validator_name in self._metrics["validator_performances"]:
                     perf = self._metrics["validator_performances"][validator_name]
+                    if result.get("metadata", {}).get("timed_out"):
+                        # Timed-out validators have no real score to average
+                        perf["timeouts"] += 1
+                        continue
                     perf["count"] += 1
                     perf["total_score"] += result.get("score", 0.0)
                     perf["total_duration"] += result.get("metadata", {}).get("duration_seconds", 0.0)
@@ -305,6 +316,26 @@ class ValidationMetrics:
         with self._lock:
             self._metrics["regenerations"] += 1
     
+    def record_cache_hit(self):
+        """Record a validation served from the result cache"""
+        with self._lock:
+            self._metrics["cache_hits"] += 1
+    
+    def record_cache_miss(self):
+        """Record a cacheable validation that had to be computed"""
+        with self._lock:
+            self._metrics["cache_misses"] += 1
+    
+    def _cache_summary(self) -> Dict[str, Any]:
+        hits = self._metrics["cache_hits"]
+        misses = self._metrics["cache_misses"]
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0
+        }
+    
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary of validation metrics"""
         with self._lock:
@@ -317,6 +348,7 @@ class ValidationMetrics:
                     "average_duration": 0.0,
                     "regeneration_rate": 0.0,
                     "validator_performances": {},
+                    "cache": self._cache_summary(),
                     "recent_errors": []
                 }
             
@@ -333,13 +365,15 @@ class ValidationMetrics:
                     validator_perfs[name] = {
                         "average_score": perf["total_score"] / perf["count"],
                         "average_duration": perf["total_duration"] / perf["count"],
-                        "validation_count": perf["count"]
+                        "validation_count": perf["count"],
+                        "timeout_count": perf["timeouts"]
                     }
                 else:
                     validator_perfs[name] = {
                         "average_score": 0.0,
                         "average_duration": 0.0,
-                        "validation_count": 0
+                        "validation_count": 0,
+                        "timeout_count": perf["timeouts"]
                     }
             
             return {
@@ -349,6 +383,7 @@ class ValidationMetrics:
                 "average_duration": average_duration,
                 "regeneration_rate": regeneration_rate,
                 "validator_performances": validator_perfs,
+                "cache": self._cache_summary(),
                 "recent_errors": self._metrics["recent_errors"][-10:]  # Last 10 errors
             }
     
@@ -372,11 +407,13 @@ class ValidationMetrics:
                 "total_score": 0.0,
                 "total_duration": 0.0,
                 "regenerations": 0,
+                "cache_hits": 0,
+                "cache_misses": 0,
                 "validator_performances": {
-                    "semantic": {"count": 0, "total_score": 0.0, "total_duration": 0.0},
-                    "contextual": {"count": 0, "total_score": 0.0, "total_duration": 0.0},
-                    "domain": {"count": 0, "total_score": 0.0, "total_duration": 0.0},
-                    "quality": {"count": 0, "total_score": 0.0, "total_duration": 0.0}
+                    "semantic": {"count": 0, "total_score": 0.0, "total_duration": 0.0, "timeouts": 0},
+                    "contextual": {"count": 0, "total_score": 0.0, "total_duration": 0.0, "timeouts": 0},
+                    "domain": {"count": 0, "total_score": 0.0, "total_duration": 0.0, "timeouts": 0},
+                    "quality": {"count": 0, "total_score": 0.0, "total_duration": 0.0, "timeouts": 0}
                 },
                 "recent_errors": []
             }
@@ -424,6 +461,9 @@ def get_validation_config_for_request(request_data: Dict[str, Any]) -> Validatio
     if "max_regeneration_attempts" in request_data:
         overrides["max_regeneration_attempts"] = int(request_data["max_regeneration_attempts"])
     
+    if "use_rubric_validator" in request_data:
+        overrides["use_rubric_validator"] = bool(request_data["use_rubric_validator"])
+    
     # Apply overrides if any
     if overrides:
         return ValidationConfigManager.create_custom_config(**overrides)
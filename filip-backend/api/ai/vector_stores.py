@@ -0,0 +1,347 @@
+"""
+Shared PGVector store handles.
+
+Building a PGVector store per request creates a new SQLAlchemy engine and
+re-resolves the collection row on every query. The helpers here keep one
+lazily created store per collection on top of a single pooled engine, and
+cache each collection's UUID after the first lookup.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+from langchain_postgres.vectorstores import PGVector
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from api.utils.llm_clients import get_embeddings
+from filip import settings
+
+if TYPE_CHECKING:
+    from api.ai.course_filters import CourseFilters
+    from api.models import UdemyCourse
+
+logger = logging.getLogger(__name__)
+
+COURSE_COLLECTION = "course"
+JOBPOST_COLLECTION = "jobpost"
+
+# Same per-connection HNSW ef_search default as the Django connection
+_CONNECT_ARGS = {"options": f"-c hnsw.ef_search={settings.PGVECTOR_HNSW_EF_SEARCH}"}
+
+_lock = threading.Lock()
+_engine: Optional[Engine] = None
+_stores: Dict[str, "CachedCollectionPGVector"] = {}
+_memory_course_store: Optional[VectorStore] = None
+_hybrid_course_store: Optional[VectorStore] = None
+_async_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_stores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, CachedCollectionPGVector]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class CachedCollectionPGVector(PGVector):
+    """
+    PGVector that resolves its collection row once.
+
+    Stock PGVector looks the collection up by name before every query and
+    insert; the UUID never changes for a live collection, so it is cached
+    after the first successful lookup.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._collection_uuid = None
+        super().__init__(*args, **kwargs)
+
+    def get_collection(self, session) -> Any:
+        if self._collection_uuid is not None:
+            return SimpleNamespace(uuid=self._collection_uuid)
+        collection = super().get_collection(session)
+        if collection is not None:
+            self._collection_uuid = collection.uuid
+        return collection
+
+    async def aget_collection(self, session) -> Any:
+        if self._collection_uuid is not None:
+            return SimpleNamespace(uuid=self._collection_uuid)
+        collection = await super().aget_collection(session)
+        if collection is not None:
+            self._collection_uuid = collection.uuid
+        return collection
+
+    def delete_collection(self) -> None:
+        self._collection_uuid = None
+        super().delete_collection()
+        self._collection_uuid = None
+
+    async def adelete_collection(self) -> None:
+        self._collection_uuid = None
+        await super().adelete_collection()
+        self._collection_uuid = None
+
+
+def _get_engine() -> Engine:
+    """Return the process-wide pooled engine for PGVECTOR_CONNECTION."""
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = create_engine(
+                    settings.PGVECTOR_CONNECTION,
+                    pool_size=settings.PGVECTOR_POOL_SIZE,
+                    max_overflow=settings.PGVECTOR_MAX_OVERFLOW,
+                    pool_recycle=settings.PGVECTOR_POOL_RECYCLE_SECONDS,
+                    pool_pre_ping=True,
+                    connect_args=_CONNECT_ARGS,
+                )
+    return _engine
+
+
+def _create_async_engine() -> AsyncEngine:
+    return create_async_engine(
+        settings.PGVECTOR_ASYNC_CONNECTION,
+        pool_size=settings.PGVECTOR_POOL_SIZE,
+        max_overflow=settings.PGVECTOR_MAX_OVERFLOW,
+        pool_recycle=settings.PGVECTOR_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=True,
+        connect_args=_CONNECT_ARGS,
+    )
+
+
+def get_vector_store(collection_name: str = COURSE_COLLECTION) -> PGVector:
+    """
+    Get the shared vector store for a collection.
+
+    The store is created on first use and reused for the lifetime of the
+    process. It is safe to share between threads, and async code can call
+    it through asyncio.to_thread.
+
+    Args:
+        collection_name: PGVector collection, e.g. "course" or "jobpost"
+
+    Returns:
+        A long-lived PGVector instance backed by the pooled engine
+    """
+    store = _stores.get(collection_name)
+    if store is not None:
+        return store
+
+    engine = _get_engine()
+    with _lock:
+        if collection_name not in _stores:
+            logger.debug(f"Creating shared vector store for '{collection_name}'")
+            _stores[collection_name] = CachedCollectionPGVector(
+                embeddings=get_embeddings(),
+                embedding_length=settings.EMBEDDING_DIMENSIONS,
+                connection=engine,
+                collection_name=collection_name,
+            )
+        return _stores[collection_name]
+
+
+def get_async_vector_store(collection_name: str = COURSE_COLLECTION) -> PGVector:
+    """
+    Get a native async vector store for a collection.
+
+    Async engines are bound to the event loop that created them, so the
+    engine and its stores are shared per running loop: a long-lived ASGI
+    loop reuses them for every request, while each asyncio.run() gets its
+    own.
+
+    Args:
+        collection_name: PGVector collection, e.g. "course" or "jobpost"
+
+    Returns:
+        A PGVector instance in async mode for the current event loop
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        stores = _async_stores.setdefault(loop, {})
+        if collection_name not in stores:
+            logger.debug(f"Creating async vector store for '{collection_name}'")
+            if loop not in _async_engines:
+                _async_engines[loop] = _create_async_engine()
+            stores[collection_name] = CachedCollectionPGVector(
+                embeddings=get_embeddings(),
+                embedding_length=settings.EMBEDDING_DIMENSIONS,
+                connection=_async_engines[loop],
+                collection_name=collection_name,
+                async_mode=True,
+            )
+        return stores[collection_name]
+
+
+def upsert_course_vectors(courses: List["UdemyCourse"], store: Optional[PGVector] = None) -> List[str]:
+    """
+    Write courses with their stored embeddings into the "course" collection.
+
+    Uses PGVector.add_embeddings, so nothing is sent to the embeddings API.
+    Rows are keyed by course_id and upserted, so writing a course again
+    replaces its row.
+
+    Args:
+        courses: UdemyCourse rows with embeddings, written in one INSERT
+        store: Target store, defaults to the shared "course" collection
+
+    Returns:
+        The row ids written (the course ids)
+    """
+    from api.ai.course_index import course_document
+
+    courses = [course for course in courses if course.embedding is not None]
+    if not courses:
+        return []
+    documents = [course_document(course) for course in courses]
+    return (store or get_vector_store(COURSE_COLLECTION)).add_embeddings(
+        texts=[document.page_content for document in documents],
+        embeddings=[list(map(float, course.embedding)) for course in courses],
+        metadatas=[document.metadata for document in documents],
+        ids=[str(course.id) for course in courses],
+    )
+
+
+def sync_course_collection(
+    batch_size: int = 1000, recreate: bool = False, prune: bool = False
+) -> Tuple[int, int]:
+    """
+    Write every embedded UdemyCourse row into the "course" collection.
+
+    Args:
+        batch_size: Courses per INSERT
+        recreate: Drop and recreate the collection first
+        prune: Delete course rows (metadata with a course_id) whose course
+            was not written, e.g. courses that lost their embedding. Rows
+            without a course_id, such as the CSV load of embed_courses, are
+            kept; nothing is pruned when no course was written
+
+    Returns:
+        (courses written, stale rows deleted)
+    """
+    from sqlalchemy import delete
+
+    from api.models import UdemyCourse
+
+    store = get_vector_store(COURSE_COLLECTION)
+    if recreate:
+        store.delete_collection()
+        store.create_collection()
+
+    queryset = UdemyCourse.objects.filter(embedding__isnull=False).order_by("id")
+    written: List[str] = []
+    batch: List[UdemyCourse] = []
+    for course in queryset.iterator(chunk_size=batch_size):
+        batch.append(course)
+        if len(batch) == batch_size:
+            written += upsert_course_vectors(batch, store)
+            logger.info(f"Wrote {len(written)} course vectors")
+            batch = []
+    written += upsert_course_vectors(batch, store)
+
+    deleted = 0
+    if prune and written and not recreate:
+        with store._make_sync_session() as session:
+            collection = store.get_collection(session)
+            result = session.execute(
+                delete(store.EmbeddingStore).where(
+                    store.EmbeddingStore.collection_id == collection.uuid,
+                    store.EmbeddingStore.cmetadata.has_key("course_id"),
+                    store.EmbeddingStore.id.not_in(written),
+                )
+            )
+            session.commit()
+            deleted = result.rowcount
+    return len(written), deleted
+
+
+def get_course_store(filters: Optional["CourseFilters"] = None) -> VectorStore:
+    """
+    Get the store used for course retrieval.
+
+    With COURSE_INDEX_BACKEND="memory" this is the memory-mapped course index
+    (see course_index.py), falling back to PGVector until an index is built.
+    With "hybrid" it is the full-text + vector RRF search over UdemyCourse
+    (see hybrid_search.py). Otherwise it is the shared PGVector "course"
+    collection.
+
+    Active filters are applied in SQL on the typed UdemyCourse columns, so
+    they always search api_udemycourse: hybrid with the hybrid backend,
+    vector-only otherwise.
+
+    Args:
+        filters: Optional CourseFilters (level, duration, price, provider)
+    """
+    global _memory_course_store, _hybrid_course_store
+    if filters is not None and filters.is_active():
+        from api.ai.course_filters import FilteredCourseStore
+        from api.ai.hybrid_search import HybridCourseStore
+
+        if settings.COURSE_INDEX_BACKEND == "hybrid":
+            return HybridCourseStore(candidates=settings.HYBRID_SEARCH_CANDIDATES, filters=filters)
+        return FilteredCourseStore(filters)
+
+    if settings.COURSE_INDEX_BACKEND == "hybrid":
+        from api.ai.hybrid_search import HybridCourseStore
+
+        if _hybrid_course_store is None:
+            with _lock:
+                if _hybrid_course_store is None:
+                    _hybrid_course_store = HybridCourseStore(
+                        candidates=settings.HYBRID_SEARCH_CANDIDATES
+                    )
+        return _hybrid_course_store
+    if settings.COURSE_INDEX_BACKEND == "memory":
+        from api.ai.course_index import MemoryCourseIndex, MemoryCourseVectorStore
+
+        if _memory_course_store is None:
+            with _lock:
+                if _memory_course_store is None:
+                    _memory_course_store = MemoryCourseVectorStore(MemoryCourseIndex())
+        if _memory_course_store.index.available():
+            return _memory_course_store
+        logger.warning("Course index not built yet, using PGVector for course retrieval")
+    return get_vector_store(COURSE_COLLECTION)
+
+
+def search_by_query(
+    vector_store: VectorStore,
+    query: str,
+    k: int = 4,
+    query_vector: Optional[List[float]] = None,
+    embeddings: Optional[Embeddings] = None,
+    **kwargs: Any,
+) -> List[Document]:
+    """
+    Similarity search that reuses an already computed query vector.
+
+    PGVector.similarity_search always embeds the query with the store's own
+    embeddings. Here the vector is taken as given, or computed with the
+    caller's embeddings (typically a request's EmbeddingMemo) so the same
+    text is not embedded again by later stages. Stores with a hybrid_search
+    method (HybridCourseStore) get both the text and the vector.
+
+    Args:
+        vector_store: Store to search
+        query: Query text, embedded only if query_vector is not given
+        k: Number of documents to return
+        query_vector: Precomputed embedding of the query
+        embeddings: Embeddings used for the query, defaults to the store's
+        **kwargs: Passed through, e.g. filter
+
+    Returns:
+        The k most similar documents
+    """
+    if query_vector is None:
+        query_vector = (embeddings or vector_store.embeddings).embed_query(query)
+    if hasattr(vector_store, "hybrid_search"):
+        return vector_store.hybrid_search(query, k=k, query_vector=query_vector, **kwargs)
+    return vector_store.similarity_search_by_vector(query_vector, k=k, **kwargs)
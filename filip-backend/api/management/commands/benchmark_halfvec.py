@@ -0,0 +1,158 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from api.utils.vector_search import (
+    VECTOR_TABLES,
+    effective_ef_search,
+    embedding_column_type,
+    hnsw_index_sql,
+    vector_type,
+)
+
+# Scratch copies of one table's embeddings; TEMP tables vanish with the session.
+# The float32 copy is taken as-is and is the ground truth for recall, so the
+# source column must still be float32.
+BENCH_TABLES = {"vector": "bench_embedding_f32", "halfvec": "bench_embedding_f16"}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare float32 (vector) and float16 (halfvec) storage on copies of the "
+        "stored embeddings: table and HNSW index size, p50/p99 latency and recall@k"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tables",
+            nargs="+",
+            default=["api_udemycourse", "api_jobpost", "api_skill"],
+            help="Embedding tables to benchmark (default: api_udemycourse api_jobpost api_skill)",
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=100,
+            help="Number of stored vectors used as queries (default: 100)",
+        )
+        parser.add_argument(
+            "--k",
+            type=int,
+            default=10,
+            help="Neighbours compared per query (default: 10)",
+        )
+        parser.add_argument(
+            "--ef-search",
+            type=int,
+            default=None,
+            help="hnsw.ef_search for the ANN queries (default: PGVECTOR_HNSW_EF_SEARCH)",
+        )
+
+    def handle(self, *args, **options):
+        k = options["k"]
+        ef_search = effective_ef_search(options["ef_search"], k)
+        known = {table for _, table, _ in VECTOR_TABLES}
+        self.stdout.write(f"🔎 ef_search={ef_search}, k={k}, samples={options['samples']}")
+
+        for table in options["tables"]:
+            if table not in known:
+                self.stderr.write(f"⚠️ {table}: not an embedding table, skipped")
+                continue
+            column_type = embedding_column_type(table)
+            if column_type is None:
+                self.stdout.write(f"⏭️  {table}: table not found")
+                continue
+            if column_type.split("(")[0] != "vector":
+                # An upcast of float16 values is no float32 baseline
+                self.stderr.write(
+                    f"⚠️ {table}: embeddings are stored as {column_type}, the float32 "
+                    "originals are gone; benchmark before convert_vector_storage, skipped"
+                )
+                continue
+            try:
+                self._benchmark(table, k, ef_search, options["samples"])
+            finally:
+                self._drop_copies()
+
+        self.stdout.write(self.style.SUCCESS("🎉 halfvec benchmark complete."))
+
+    def _benchmark(self, table: str, k: int, ef_search: int, samples: int):
+        stats = {}
+        for storage, copy in BENCH_TABLES.items():
+            stats[storage] = self._build_copy(table, copy, storage)
+        rows = stats["vector"]["rows"]
+        if rows == 0:
+            self.stdout.write(f"⏭️  {table}: no embeddings")
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT embedding::text FROM {BENCH_TABLES['vector']} ORDER BY random() LIMIT %s",
+                [samples],
+            )
+            queries = [row[0] for row in cursor.fetchall()]
+
+        latencies = {storage: [] for storage in BENCH_TABLES}
+        recalls = {storage: [] for storage in BENCH_TABLES}
+        for query in queries:
+            # Ground truth: exact float32 scan
+            exact = self._search(BENCH_TABLES["vector"], "vector", query, k, ef_search, exact=True)
+            for storage, copy in BENCH_TABLES.items():
+                start = time.perf_counter()
+                ann = self._search(copy, storage, query, k, ef_search)
+                latencies[storage].append((time.perf_counter() - start) * 1000)
+                recalls[storage].append(len(set(ann) & set(exact)) / len(exact) if exact else 1.0)
+
+        self.stdout.write(f"📊 {table} ({rows} rows):")
+        for storage in BENCH_TABLES:
+            values = latencies[storage]
+            self.stdout.write(
+                f"   {storage:<8} table={stats[storage]['table_size']}, "
+                f"index={stats[storage]['index_size']}, build={stats[storage]['build']:.1f}s, "
+                f"p50={self._percentile(values, 0.50):.2f}ms, "
+                f"p99={self._percentile(values, 0.99):.2f}ms, "
+                f"recall@{k}={sum(recalls[storage]) / len(recalls[storage]):.3f}"
+            )
+
+    def _build_copy(self, table: str, copy: str, storage: str):
+        """Copy the float32 table.embedding into a TEMP table of the given type and index it"""
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {copy}")
+            cursor.execute(
+                f"CREATE TEMP TABLE {copy} AS "
+                f"SELECT id::text AS id, embedding::{vector_type(storage)} AS embedding "
+                f"FROM {table} WHERE embedding IS NOT NULL"
+            )
+            start = time.time()
+            cursor.execute(hnsw_index_sql(copy, f"{copy}_hnsw", storage))
+            build = time.time() - start
+            cursor.execute(f"ANALYZE {copy}")
+            cursor.execute(
+                f"SELECT count(*), pg_size_pretty(pg_table_size('{copy}')), "
+                f"pg_size_pretty(pg_relation_size('{copy}_hnsw')) FROM {copy}"
+            )
+            rows, table_size, index_size = cursor.fetchone()
+        return {"rows": rows, "table_size": table_size, "index_size": index_size, "build": build}
+
+    def _search(self, copy: str, storage: str, query: str, k: int, ef_search: int,
+                exact: bool = False):
+        """Ids of the k nearest rows to a query vector, by HNSW or by exact scan"""
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SELECT set_config('hnsw.ef_search', %s, true)", [str(ef_search)])
+            if exact:
+                cursor.execute("SET LOCAL enable_indexscan = off")
+            cursor.execute(
+                f"SELECT id FROM {copy} ORDER BY embedding <=> %s::{vector_type(storage)} LIMIT %s",
+                [query, k],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def _drop_copies(self):
+        with connection.cursor() as cursor:
+            for copy in BENCH_TABLES.values():
+                cursor.execute(f"DROP TABLE IF EXISTS {copy}")
+
+    def _percentile(self, values, q):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
@@ -0,0 +1,113 @@
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from pgvector.django import CosineDistance
+
+from api.ai.hybrid_search import hybrid_course_search
+from api.models.udemy import UdemyCourse
+from api.utils.llm_clients import get_embeddings
+from api.utils.vector_search import hnsw_ef_search
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare latency, precision@k and MRR of hybrid (full-text + vector, RRF) "
+        "course search against pure vector search"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=30,
+            help="Courses sampled as known-item queries (default: 30)",
+        )
+        parser.add_argument(
+            "--k",
+            type=int,
+            default=5,
+            help="Results per query (default: 5)",
+        )
+        parser.add_argument(
+            "--candidates",
+            type=int,
+            default=50,
+            help="Rows per ranking before fusion (default: 50)",
+        )
+        parser.add_argument(
+            "--query-file",
+            type=str,
+            default=None,
+            help='JSON list of {"query": ..., "relevant_ids": [...]} used instead of sampling',
+        )
+
+    def handle(self, *args, **options):
+        k = options["k"]
+        queries = self._load_queries(options)
+        if not queries:
+            self.stdout.write("❌ No queries to run (no embedded courses?).")
+            return
+
+        self.stdout.write(f"🚀 Embedding {len(queries)} queries...")
+        vectors = get_embeddings().embed_documents([q["query"] for q in queries])
+
+        self.stdout.write(f"🔎 k={k}, candidates={options['candidates']}")
+        results = {"vector": [], "hybrid": []}
+        for query, vector in zip(queries, vectors):
+            relevant = set(query["relevant_ids"])
+
+            start = time.perf_counter()
+            with hnsw_ef_search(k=k):
+                ids = list(
+                    UdemyCourse.objects.exclude(embedding=None)
+                    .order_by(CosineDistance("embedding", vector))
+                    .values_list("id", flat=True)[:k]
+                )
+            results["vector"].append(self._score(ids, relevant, k, start))
+
+            start = time.perf_counter()
+            docs = hybrid_course_search(
+                query["query"], k=k, query_vector=vector, candidates=options["candidates"]
+            )
+            ids = [doc.metadata["course_id"] for doc, _ in docs]
+            results["hybrid"].append(self._score(ids, relevant, k, start))
+
+        for name, scores in results.items():
+            precision, reciprocal_rank, hits, latency = zip(*scores)
+            self.stdout.write(
+                f"📊 {name}: precision@{k}={statistics.mean(precision):.3f}, "
+                f"hit@{k}={statistics.mean(hits):.3f}, "
+                f"MRR={statistics.mean(reciprocal_rank):.3f}, "
+                f"latency={statistics.mean(latency):.1f}ms "
+                f"(p95 {self._p95(latency):.1f}ms)"
+            )
+
+        self.stdout.write(self.style.SUCCESS("🎉 Hybrid search benchmark complete."))
+
+    def _load_queries(self, options):
+        if options["query_file"]:
+            with open(options["query_file"]) as f:
+                return json.load(f)
+
+        # Known-item queries: a course's related topics (or title) should find that course
+        queries = []
+        sample = UdemyCourse.objects.exclude(embedding=None).order_by("?")[: options["samples"]]
+        for course in sample:
+            text = ", ".join(course.related_topics) if course.related_topics else course.title
+            queries.append({"query": text, "relevant_ids": [course.id]})
+        return queries
+
+    def _score(self, ids, relevant, k, start):
+        """(precision@k, reciprocal rank, hit, latency ms) for one ranked list"""
+        latency = (time.perf_counter() - start) * 1000
+        precision = len(set(ids) & relevant) / k
+        reciprocal_rank = next(
+            (1.0 / rank for rank, id_ in enumerate(ids, 1) if id_ in relevant), 0.0
+        )
+        return precision, reciprocal_rank, float(reciprocal_rank > 0), latency
+
+    def _p95(self, values):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
@@ -0,0 +1,136 @@
+import asyncio
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from langchain_community.callbacks.manager import get_openai_callback
+
+from api.ai.response_validation import ResponseValidator
+from api.ai.vector_stores import get_course_store
+from api.utils.llm_clients import get_chat_llm, get_embeddings
+
+SAMPLE_CASES = [
+    (
+        "I want to learn Python programming for data analysis",
+        "Start with 'Python for Data Analysis', a beginner course covering pandas and "
+        "NumPy, then take 'Data Visualization with Matplotlib' to practice plotting. "
+        "Finish with a hands-on project course to build a portfolio.",
+    ),
+    (
+        "Which courses help me move from backend development to cloud architecture?",
+        "Take 'AWS Certified Solutions Architect' to learn core cloud services, followed "
+        "by 'Docker and Kubernetes: The Complete Guide' for containers and orchestration.",
+    ),
+    (
+        "Recommend courses to improve my React skills",
+        "Cooking is a great hobby. Try a pasta course.",
+    ),
+    (
+        "I need to learn machine learning as an intermediate Python developer",
+        "'Machine Learning A-Z' covers regression, classification and clustering with "
+        "hands-on Python labs. Pair it with 'Deep Learning Specialization' once you are "
+        "comfortable with the fundamentals.",
+    ),
+]
+
+RUBRIC_DIMENSIONS = ("contextual", "domain", "quality")
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the consolidated rubric validator against the multi-call "
+        "validators: latency, token usage and score agreement"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=1,
+            help="Number of times to validate each sample case (default: 1)",
+        )
+        parser.add_argument(
+            "--domain",
+            type=str,
+            default="courses",
+            help="Validation domain (default: courses)",
+        )
+
+    def handle(self, *args, **options):
+        runs = options["runs"]
+        domain = options["domain"]
+
+        embeddings = get_embeddings()
+        llm = get_chat_llm()
+        vectorstore = get_course_store()
+
+        validators = {
+            "multi_call": ResponseValidator(embeddings, llm, vectorstore, use_rubric=False),
+            "rubric": ResponseValidator(embeddings, llm, vectorstore, use_rubric=True),
+        }
+        stats = {
+            name: {"latency": [], "tokens": [], "llm_calls": []} for name in validators
+        }
+        score_diffs = {dim: [] for dim in RUBRIC_DIMENSIONS + ("overall",)}
+        verdict_agreement = []
+
+        self.stdout.write(
+            f"🚀 Benchmarking {len(SAMPLE_CASES)} cases x {runs} run(s)..."
+        )
+
+        for query, response in SAMPLE_CASES:
+            # Fetch context once so both paths grade against the same documents
+            context_docs = vectorstore.similarity_search(query, k=5)
+
+            for _ in range(runs):
+                results = {}
+                for name, validator in validators.items():
+                    with get_openai_callback() as cb:
+                        start = time.time()
+                        results[name] = asyncio.run(
+                            validator.validate_response(
+                                query=query,
+                                response=response,
+                                domain=domain,
+                                context_docs=context_docs,
+                            )
+                        )
+                        stats[name]["latency"].append(time.time() - start)
+                    stats[name]["tokens"].append(cb.total_tokens)
+                    stats[name]["llm_calls"].append(cb.successful_requests)
+
+                multi, rubric = results["multi_call"], results["rubric"]
+                for dim in RUBRIC_DIMENSIONS:
+                    score_diffs[dim].append(
+                        abs(
+                            multi["individual_results"][dim]["score"]
+                            - rubric["individual_results"][dim]["score"]
+                        )
+                    )
+                score_diffs["overall"].append(
+                    abs(multi["overall_score"] - rubric["overall_score"])
+                )
+                verdict_agreement.append(multi["is_valid"] == rubric["is_valid"])
+
+            self.stdout.write(f"✅ {query[:60]}")
+
+        self.stdout.write("")
+        for name, values in stats.items():
+            self.stdout.write(
+                f"📊 {name}: "
+                f"latency p50={statistics.median(values['latency']):.2f}s "
+                f"mean={statistics.mean(values['latency']):.2f}s, "
+                f"tokens mean={statistics.mean(values['tokens']):.0f}, "
+                f"LLM calls mean={statistics.mean(values['llm_calls']):.1f}"
+            )
+
+        self.stdout.write("")
+        for dim, diffs in score_diffs.items():
+            self.stdout.write(
+                f"🔍 {dim} score mean abs diff={statistics.mean(diffs):.3f} "
+                f"max={max(diffs):.3f}"
+            )
+        agreement = sum(verdict_agreement) / len(verdict_agreement)
+        self.stdout.write(
+            self.style.SUCCESS(f"🎯 is_valid agreement: {agreement:.0%}")
+        )
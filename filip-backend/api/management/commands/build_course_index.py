@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.ai.course_index import build_course_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the memory-mapped course embedding index from UdemyCourse "
+        "embeddings and bump the catalog generation so workers reload it"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dir",
+            default=None,
+            help="Output directory (default: COURSE_INDEX_DIR)",
+        )
+        parser.add_argument(
+            "--keep",
+            type=int,
+            default=2,
+            help="Generations kept on disk (default: 2)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🚀 Building course index...")
+        start = time.time()
+        generation, count = build_course_index(options["dir"], keep=options["keep"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"🎉 Built generation {generation} with {count} courses "
+                f"in {time.time() - start:.1f}s."
+            )
+        )
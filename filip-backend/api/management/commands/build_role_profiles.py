@@ -0,0 +1,65 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.ai.role_profiles import build_role_profiles
+from api.models import RoleProfile
+
+
+class Command(BaseCommand):
+    help = (
+        "Cluster embedded job posts into roles and store each role's skill "
+        "frequency profile for the skill gap analysis"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.9,
+            help="Cosine similarity for merging job title groups into one role (default: 0.9)",
+        )
+        parser.add_argument(
+            "--min-posts",
+            type=int,
+            default=3,
+            help="Drop roles with fewer job posts (default: 3)",
+        )
+        parser.add_argument(
+            "--min-share",
+            type=float,
+            default=0.05,
+            help="Drop skills listed by a smaller share of a role's posts (default: 0.05)",
+        )
+        parser.add_argument(
+            "--max-skills",
+            type=int,
+            default=50,
+            help="Skills stored per role (default: 50)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🚀 Building role profiles from job posts...")
+        start = time.time()
+        count, covered = build_role_profiles(
+            threshold=options["threshold"],
+            min_posts=options["min_posts"],
+            min_share=options["min_share"],
+            max_skills=options["max_skills"],
+        )
+        if count == 0:
+            self.stdout.write("❌ No role profiles built (are job posts embedded?).")
+            return
+
+        for profile in RoleProfile.objects.order_by("-post_count")[:5]:
+            top = ", ".join(
+                f"{skill.name} ({skill.share:.0%})" for skill in profile.skills.all()[:5]
+            )
+            self.stdout.write(f"📊 {profile.title} [{profile.post_count} posts]: {top}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"🎉 Built {count} role profiles covering {covered} job posts "
+                f"in {time.time() - start:.1f}s."
+            )
+        )
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.ai.skill_graph import build_skill_graph
+from api.models import Skill
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompute each Skill's most similar skills from the stored embeddings "
+        "for skill matching without embedding calls"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--k",
+            type=int,
+            default=20,
+            help="Neighbours stored per skill (default: 20)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🚀 Building skill neighbour graph...")
+        start = time.time()
+        skills, rows = build_skill_graph(k=options["k"])
+        if skills == 0:
+            self.stdout.write("❌ No embedded skills found (run embed_skills first).")
+            return
+
+        for skill in Skill.objects.exclude(embedding=None).order_by("name")[:3]:
+            top = ", ".join(
+                f"{neighbor.neighbor.name} ({neighbor.similarity:.2f})"
+                for neighbor in skill.neighbors.select_related("neighbor")[:5]
+            )
+            self.stdout.write(f"📊 {skill.name}: {top}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"🎉 Stored {rows} neighbours for {skills} skills in {time.time() - start:.1f}s."
+            )
+        )
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from api.services.jobs import cleanup_jobs, fail_orphaned_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete background analysis jobs past their TTL and fail jobs that "
+        "never finished (e.g. lost in a restart)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--orphaned',
+            action='store_true',
+            help='Also fail every pending/running job not queued under the current '
+                 'JOB_BOOT_ID (run at startup, before the server)'
+        )
+
+    def handle(self, *args, **options):
+        if options['orphaned']:
+            orphaned = fail_orphaned_jobs()
+            self.stdout.write(f"🔄 Failed {orphaned} jobs interrupted by a restart.")
+
+        counts = cleanup_jobs()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"🧹 Deleted {counts['deleted']} expired jobs, "
+                f"failed {counts['failed']} stale jobs."
+            )
+        )
@@ -0,0 +1,74 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from api.utils.vector_search import (
+    VECTOR_STORAGE_TYPES,
+    VECTOR_TABLES,
+    convert_vector_storage,
+    embedding_column_type,
+)
+from filip import settings
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert the stored embeddings and their HNSW indexes between float32 "
+        "(vector) and float16 (halfvec) storage"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--to",
+            choices=VECTOR_STORAGE_TYPES,
+            default=None,
+            help="Target storage (default: VECTOR_STORAGE setting)",
+        )
+
+    def handle(self, *args, **options):
+        storage = options["to"] or settings.VECTOR_STORAGE
+        if storage != settings.VECTOR_STORAGE:
+            self.stderr.write(
+                f"⚠️ VECTOR_STORAGE is '{settings.VECTOR_STORAGE}'; set it to '{storage}' "
+                "so raw SQL queries cast to the new column type"
+            )
+
+        before = self._sizes()
+        self.stdout.write(f"🚀 Converting embedding columns to {storage}...")
+        start = time.time()
+        try:
+            converted = convert_vector_storage(storage)
+        except Exception as e:
+            raise CommandError(f"❌ Conversion failed, nothing was changed: {e}")
+
+        if not converted:
+            self.stdout.write(f"✅ All embedding columns are already {storage}.")
+            return
+
+        after = self._sizes()
+        for table in converted:
+            self.stdout.write(
+                f"📊 {table}: table {before[table][0]} -> {after[table][0]}, "
+                f"index {before[table][1]} -> {after[table][1]}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"🎉 Converted {len(converted)} tables to {storage} in {time.time() - start:.1f}s."
+            )
+        )
+
+    def _sizes(self):
+        """(table size, HNSW index size) per existing embedding table"""
+        sizes = {}
+        with connection.cursor() as cursor:
+            for _, table, index in VECTOR_TABLES:
+                if embedding_column_type(table, cursor) is None:
+                    continue
+                cursor.execute(
+                    "SELECT pg_size_pretty(pg_table_size(%s::regclass)), "
+                    "pg_size_pretty(pg_relation_size(to_regclass(%s)))",
+                    [table, index],
+                )
+                sizes[table] = cursor.fetchone()
+        return sizes
@@ -1,9 +1,9 @@
 import pandas as pd
 from django.core.management.base import BaseCommand
 from langchain.schema import Document
-from langchain_openai import AzureOpenAIEmbeddings
 from langchain_postgres.vectorstores import PGVector
 
+from api.utils.llm_clients import get_embeddings
 from filip import settings
 
 
@@ -50,12 +50,7 @@ class Command(BaseCommand):
         # Step 3: Embed and store in PGVector
         PGVector.from_documents(
             documents=documents,
-            embedding=AzureOpenAIEmbeddings(
-                openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-                api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-                model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-            ),
+            embedding=get_embeddings(),
             connection=settings.PGVECTOR_CONNECTION,
             collection_name=COLLECTION_NAME,
         )
@@ -3,10 +3,10 @@ from langchain.chains.summarize import load_summarize_chain
 from langchain.prompts import PromptTemplate
 from langchain.schema import Document
 from langchain.schema.document import Document as LangchainDocument
-from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
 from langchain_postgres.vectorstores import PGVector
 
 from api.models import JobPost
+from api.utils.llm_clients import get_chat_llm, get_embeddings
 from filip import settings
 
 
@@ -26,13 +26,8 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING("No job posts to process."))
             return
 
-        llm = AzureChatOpenAI(
-            azure_deployment=settings.AZURE_OPENAI_CHAT_MODEL,
-            openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-            temperature=0,
-        )
+        llm = get_chat_llm()
+        embedder = get_embeddings()
 
         prompt_template = """
         Summarize the following job description in a concise paragraph that captures:
@@ -109,25 +104,12 @@ class Command(BaseCommand):
             # Store embeddings in PGVector AND update JobPost.embedding field
             if documents:
                 try:
-                    # Initialize embedder
-                    embedder = AzureOpenAIEmbeddings(
-                        openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-                        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-                        api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-                        model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-                    )
-                    
                     # Generate embeddings for JobPost.embedding field
-                    for i, (job_post, document) in enumerate(zip(updated_posts, documents)):
-                        try:
-                            vector = embedder.embed_query(document.page_content)
-                            job_post.embedding = vector
-                        except Exception as e:
-                            self.stdout.write(
-                                self.style.WARNING(
-                                    f"❌ Failed to generate embedding for job {job_post.id}: {e}"
-                                )
-                            )
+                    vectors = embedder.embed_documents(
+                        [document.page_content for document in documents]
+                    )
+                    for job_post, vector in zip(updated_posts, vectors):
+                        job_post.embedding = vector
                     
                     # Update JobPost.embedding field in database
                     JobPost.objects.bulk_update(updated_posts, ["embedding"])
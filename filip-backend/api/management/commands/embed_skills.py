@@ -1,18 +1,10 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
-from langchain_openai import AzureOpenAIEmbeddings
 
 from api.models import Skill
-from filip import settings
+from api.utils.embedding import embed_texts
 
-BATCH_SIZE = 10
-
-embedder = AzureOpenAIEmbeddings(
-    openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-    azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-    api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-    model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-)
+BATCH_SIZE = 200
 
 
 class Command(BaseCommand):
@@ -33,12 +25,14 @@ class Command(BaseCommand):
         with transaction.atomic():
             for i in range(0, total, BATCH_SIZE):
                 batch = list(skills_qs[i : i + BATCH_SIZE])
-                for skill in batch:
-                    try:
-                        vector = embedder.embed_query(skill.name)
+                try:
+                    vectors = embed_texts([skill.name for skill in batch])
+                    for skill, vector in zip(batch, vectors):
                         skill.embedding = vector
-                    except Exception as e:
-                        self.stderr.write(f"❌ Failed to embed '{skill.name}': {e}")
+                except Exception as e:
+                    self.stderr.write(
+                        f"❌ Failed to embed batch {i + 1}–{i + len(batch)}: {e}"
+                    )
 
                 Skill.objects.bulk_update(batch, ["embedding"])
                 updated_total += len(batch)
@@ -1,10 +1,9 @@
-import time
-
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
+from api.ai.course_index import build_course_index
 from api.models.udemy import UdemyCourse
-from api.utils.embedding import embed_text
+from api.utils.embedding import embed_texts
 from langchain_postgres.vectorstores import PGVector
 from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
 from langchain.schema import Document
@@ -47,20 +46,17 @@ class Command(BaseCommand):
                 break
 
             updated = []
-            for course in batch:
-                try:
-                    text = self.build_text(course)
-                    embedding = embed_text(text)
-                    if embedding:
-                        course.embedding = embedding
-                        updated.append(course)
-                        count += 1
-                    else:
-                        self.stderr.write(f"⚠️ Embedding failed for ID={course.id}")
-                except Exception as e:
-                    self.stderr.write(f"❌ Error for ID={course.id}: {e}")
-
-                time.sleep(0.2)  # honor rate limits
+            try:
+                vectors = embed_texts([self.build_text(course) for course in batch])
+                for course, embedding in zip(batch, vectors):
+                    course.embedding = embedding
+                    updated.append(course)
+                    count += 1
+            except Exception as e:
+                self.stderr.write(
+                    f"❌ Error embedding batch starting at ID={batch[0].id}: {e}"
+                )
+                break
 
             if updated:
                 with transaction.atomic():
@@ -101,3 +97,7 @@ class Command(BaseCommand):
             self.stdout.write(f"✅ Embedded {count}/{total}")
 
         self.stdout.write(self.style.SUCCESS(f"🎉 Finished embedding {count} courses."))
+
+        if count and settings.COURSE_INDEX_BACKEND == "memory":
+            generation, indexed = build_course_index()
+            self.stdout.write(f"🧠 Rebuilt course index generation {generation} ({indexed} courses)")
@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+
+from api.models.udemy import UdemyCourse
+from api.services.course_enrichment import (
+    ENRICHMENT_FIELDS,
+    enrich_course,
+    needs_enrichment,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompute LLM highlights and related topics for UdemyCourse rows "
+        "that are missing or whose content changed"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of courses to save per batch (default: 50)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Concurrent LLM calls (default: 4)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Only enrich up to this many courses",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate enrichment even for up-to-date courses",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        force = options["force"]
+
+        queryset = UdemyCourse.objects.only(
+            "id", "title", "level", "url", "description", *ENRICHMENT_FIELDS
+        ).order_by("id")
+        pending = [c for c in queryset.iterator() if force or needs_enrichment(c)]
+        if options["limit"]:
+            pending = pending[: options["limit"]]
+
+        total = len(pending)
+        if total == 0:
+            self.stdout.write("✅ All courses are already enriched.")
+            return
+
+        self.stdout.write(f"🚀 Enriching {total} courses...")
+
+        enriched = 0
+        failed = 0
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            for start in range(0, total, batch_size):
+                batch = pending[start : start + batch_size]
+                futures = {
+                    executor.submit(enrich_course, course, save=False): course
+                    for course in batch
+                }
+
+                updated = []
+                for future in as_completed(futures):
+                    course = futures[future]
+                    try:
+                        future.result()
+                        updated.append(course)
+                    except Exception as e:
+                        failed += 1
+                        self.stderr.write(f"❌ Error for ID={course.id}: {e}")
+
+                if updated:
+                    UdemyCourse.objects.bulk_update(updated, ENRICHMENT_FIELDS)
+                enriched += len(updated)
+                self.stdout.write(f"✅ Enriched {enriched}/{total}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"🎉 Finished enriching {enriched} courses ({failed} failed)."
+            )
+        )
@@ -4,6 +4,7 @@ import os
 from django.core.management.base import BaseCommand, CommandError
 
 from api.models import Skill
+from api.utils.skill_names import normalize_skill_name
 
 
 class Command(BaseCommand):
@@ -38,7 +39,11 @@ class Command(BaseCommand):
         existing = set(
             Skill.objects.filter(name__in=skill_names).values_list("name", flat=True)
         )
-        new_skills = [Skill(name=name) for name in skill_names if name not in existing]
+        new_skills = [
+            Skill(name=name, normalized_name=normalize_skill_name(name))
+            for name in skill_names
+            if name not in existing
+        ]
 
         Skill.objects.bulk_create(new_skills, ignore_conflicts=True)
         self.stdout.write(self.style.SUCCESS(f"Created {len(new_skills)} new skills."))
@@ -4,6 +4,11 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from api.models.udemy import UdemyCourse
+from api.utils.course_metadata import (
+    parse_duration_hours,
+    parse_price_vnd,
+    parse_question_count,
+)
 
 
 class Command(BaseCommand):
@@ -50,6 +55,9 @@ class Command(BaseCommand):
                         duration=row.get("Duration", ""),
                         price=row.get("Price (VND)", ""),
                         description=row.get("Description", ""),
+                        duration_hours=parse_duration_hours(row.get("Duration", "")),
+                        question_count=parse_question_count(row.get("Duration", "")),
+                        price_vnd=parse_price_vnd(row.get("Price (VND)", "")),
                     )
                 )
 
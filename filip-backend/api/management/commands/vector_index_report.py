@@ -0,0 +1,142 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from api.utils.vector_search import (
+    LANGCHAIN_HNSW_SQL,
+    VECTOR_TABLES,
+    effective_ef_search,
+    embedding_column_type,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Report size, build time and recall@k vs exact search for the HNSW "
+        "indexes on every embedding column"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=20,
+            help="Number of stored vectors used as queries (default: 20)",
+        )
+        parser.add_argument(
+            "--k",
+            type=int,
+            default=10,
+            help="Neighbours compared per query (default: 10)",
+        )
+        parser.add_argument(
+            "--ef-search",
+            type=int,
+            default=None,
+            help="hnsw.ef_search for the ANN queries (default: PGVECTOR_HNSW_EF_SEARCH)",
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="REINDEX each index and report the build time",
+        )
+        parser.add_argument(
+            "--ensure-langchain-index",
+            action="store_true",
+            help="Type langchain_pg_embedding.embedding and create its HNSW index first",
+        )
+
+    def handle(self, *args, **options):
+        k = options["k"]
+        ef_search = effective_ef_search(options["ef_search"], k)
+
+        if options["ensure_langchain_index"]:
+            if self._exists("langchain_pg_embedding"):
+                start = time.time()
+                with connection.cursor() as cursor:
+                    cursor.execute(LANGCHAIN_HNSW_SQL)
+                self.stdout.write(
+                    f"✅ LangChain HNSW index ready in {time.time() - start:.1f}s"
+                )
+            else:
+                self.stderr.write("⚠️ langchain_pg_embedding does not exist yet")
+
+        self.stdout.write(f"🔎 ef_search={ef_search}, k={k}, samples={options['samples']}")
+
+        for label, table, index in VECTOR_TABLES:
+            if not self._exists(table):
+                self.stdout.write(f"⏭️  {label}: table {table} not found")
+                continue
+            if not self._exists(index):
+                self.stdout.write(f"❌ {label}: index {index} missing")
+                continue
+
+            build_seconds = None
+            if options["rebuild"]:
+                start = time.time()
+                with connection.cursor() as cursor:
+                    cursor.execute(f"REINDEX INDEX {index}")
+                build_seconds = time.time() - start
+
+            rows, index_size = self._sizes(table, index)
+            recall, ann_ms, exact_ms = self._recall(table, k, ef_search, options["samples"])
+
+            line = (
+                f"📊 {label}: rows={rows}, index={index_size}, "
+                f"recall@{k}={recall:.3f}, ann={ann_ms:.1f}ms, exact={exact_ms:.1f}ms"
+            )
+            if build_seconds is not None:
+                line += f", build={build_seconds:.1f}s"
+            self.stdout.write(line)
+
+        self.stdout.write(self.style.SUCCESS("🎉 Vector index report complete."))
+
+    def _exists(self, relation: str) -> bool:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [relation])
+            return cursor.fetchone()[0]
+
+    def _sizes(self, table: str, index: str):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*), pg_size_pretty(pg_relation_size(%s::regclass)) "
+                f"FROM {table} WHERE embedding IS NOT NULL",
+                [index],
+            )
+            return cursor.fetchone()
+
+    def _recall(self, table: str, k: int, ef_search: int, samples: int):
+        """Mean recall@k of the HNSW scan against an exact scan, plus mean latencies"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT embedding::text FROM {table} "
+                f"WHERE embedding IS NOT NULL ORDER BY random() LIMIT %s",
+                [samples],
+            )
+            queries = [row[0] for row in cursor.fetchall()]
+        if not queries:
+            return 0.0, 0.0, 0.0
+
+        column_type = embedding_column_type(table)
+        search_sql = f"SELECT id FROM {table} ORDER BY embedding <=> %s::{column_type} LIMIT %s"
+        recalls, ann_ms, exact_ms = [], [], []
+        for query in queries:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("SELECT set_config('hnsw.ef_search', %s, true)", [str(ef_search)])
+                start = time.perf_counter()
+                cursor.execute(search_sql, [query, k])
+                ann = {row[0] for row in cursor.fetchall()}
+                ann_ms.append((time.perf_counter() - start) * 1000)
+
+                # Exact scan: same query with index scans disabled
+                cursor.execute("SET LOCAL enable_indexscan = off")
+                start = time.perf_counter()
+                cursor.execute(search_sql, [query, k])
+                exact = {row[0] for row in cursor.fetchall()}
+                exact_ms.append((time.perf_counter() - start) * 1000)
+
+            recalls.append(len(ann & exact) / len(exact) if exact else 1.0)
+
+        return statistics.mean(recalls), statistics.mean(ann_ms), statistics.mean(exact_ms)
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-16 23:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_embeddingcacheentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='udemycourse',
+            name='enriched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='udemycourse',
+            name='enrichment_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='udemycourse',
+            name='highlights',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='udemycourse',
+            name='related_topics',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
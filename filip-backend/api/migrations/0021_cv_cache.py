@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-16 23:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_udemycourse_enrichment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CVExtractionCache',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('text_hash', models.CharField(max_length=64, unique=True)),
+                ('result', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CVTextCache',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('file_hash', models.CharField(max_length=64, unique=True)),
+                ('text', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
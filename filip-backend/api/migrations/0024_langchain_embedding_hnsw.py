@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# langchain_postgres creates langchain_pg_embedding on first use, with an
+# untyped "vector" column unless embedding_length is passed. HNSW needs a
+# fixed dimension, so the column is typed first. Skipped if the table does
+# not exist yet; PGVector stores now create it typed (see vector_stores.py)
+# and `vector_index_report --ensure-langchain-index` adds the index later.
+FORWARD_SQL = """
+DO $$
+BEGIN
+    IF to_regclass('langchain_pg_embedding') IS NOT NULL THEN
+        ALTER TABLE langchain_pg_embedding
+            ALTER COLUMN embedding TYPE vector(1536);
+        CREATE INDEX IF NOT EXISTS langchain_pg_embedding_hnsw
+            ON langchain_pg_embedding
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64);
+    END IF;
+END
+$$;
+"""
+
+REVERSE_SQL = "DROP INDEX IF EXISTS langchain_pg_embedding_hnsw;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0023_hnsw_indexes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(FORWARD_SQL, REVERSE_SQL),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-16 23:39
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_langchain_embedding_hnsw'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='udemycourse',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('title', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('description', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='udemycourse',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='udemycourse_search_gin'),
+        ),
+    ]
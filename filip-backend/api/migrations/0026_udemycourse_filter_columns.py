@@ -0,0 +1,81 @@
+# Generated by Django 5.2.1 on 2026-10-16 23:42
+
+import re
+
+from django.db import migrations, models
+
+# Frozen copies of api.utils.course_metadata as of this migration, so later
+# changes to the parsers do not change what the backfill writes
+_DURATION_RE = re.compile(r"([\d.]+)\s*(?:total\s+)?(hours?|hrs?|h\b|mins?|minutes?)", re.IGNORECASE)
+_NUMBER_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*$")
+
+
+def parse_duration_hours(duration):
+    text = duration or ""
+    bare = _NUMBER_RE.match(text)
+    if bare:
+        return round(float(bare.group(1)), 2)
+    match = _DURATION_RE.search(text)
+    if not match:
+        return None
+    try:
+        value = float(match.group(1))
+    except ValueError:
+        return None
+    if match.group(2).lower().startswith("m"):
+        value /= 60
+    return round(value, 2)
+
+
+def parse_price_vnd(price):
+    text = (price or "").strip()
+    if text.lower() == "free":
+        return 0
+    text = re.sub(r"[.,]\d{1,2}$", "", text)
+    digits = re.sub(r"[^\d]", "", text)
+    return int(digits) if digits else None
+
+
+def backfill_filter_columns(apps, schema_editor):
+    UdemyCourse = apps.get_model('api', 'UdemyCourse')
+    batch = []
+    for course in UdemyCourse.objects.only('id', 'duration', 'price').iterator(chunk_size=1000):
+        course.duration_hours = parse_duration_hours(course.duration)
+        course.price_vnd = parse_price_vnd(course.price)
+        batch.append(course)
+        if len(batch) >= 1000:
+            UdemyCourse.objects.bulk_update(batch, ['duration_hours', 'price_vnd'])
+            batch = []
+    if batch:
+        UdemyCourse.objects.bulk_update(batch, ['duration_hours', 'price_vnd'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_udemycourse_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='udemycourse',
+            name='duration_hours',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='udemycourse',
+            name='price_vnd',
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='udemycourse',
+            name='provider',
+            field=models.CharField(db_index=True, default='Udemy', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='udemycourse',
+            name='level',
+            field=models.CharField(blank=True, db_index=True, max_length=100),
+        ),
+        migrations.RunPython(backfill_filter_columns, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.1 on 2026-10-16 23:44
+
+import re
+
+from django.db import migrations, models
+
+# Frozen copy of api.utils.course_metadata.parse_question_count as of this migration
+_QUESTIONS_RE = re.compile(r"(\d[\d,]*)\s*(?:practice\s+)?questions?", re.IGNORECASE)
+
+
+def parse_question_count(duration):
+    match = _QUESTIONS_RE.search(duration or "")
+    return int(match.group(1).replace(",", "")) if match else None
+
+
+def backfill_question_count(apps, schema_editor):
+    UdemyCourse = apps.get_model('api', 'UdemyCourse')
+    batch = []
+    for course in UdemyCourse.objects.filter(duration__icontains='question').only('id', 'duration'):
+        course.question_count = parse_question_count(course.duration)
+        batch.append(course)
+    UdemyCourse.objects.bulk_update(batch, ['question_count'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_udemycourse_filter_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='udemycourse',
+            name='question_count',
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_question_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.1 on 2026-10-16 23:46
+
+import django.db.models.deletion
+import pgvector.django.indexes
+import pgvector.django.vector
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0027_udemycourse_question_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoleProfile',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('category', models.CharField(blank=True, max_length=100)),
+                ('titles', models.JSONField(blank=True, default=list)),
+                ('post_count', models.PositiveIntegerField()),
+                ('embedding', pgvector.django.vector.VectorField(dimensions=1536)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [pgvector.django.indexes.HnswIndex(ef_construction=64, fields=['embedding'], m=16, name='roleprofile_embedding_hnsw', opclasses=['vector_cosine_ops'])],
+            },
+        ),
+        migrations.CreateModel(
+            name='RoleProfileSkill',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('support', models.PositiveIntegerField()),
+                ('share', models.FloatField()),
+                ('rank', models.PositiveIntegerField()),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skills', to='api.roleprofile')),
+            ],
+            options={
+                'ordering': ['rank'],
+                'indexes': [models.Index(fields=['profile', 'rank'], name='roleprofileskill_rank_idx')],
+                'constraints': [models.UniqueConstraint(fields=('profile', 'name'), name='roleprofileskill_unique_name')],
+            },
+        ),
+    ]
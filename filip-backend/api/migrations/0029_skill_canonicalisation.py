@@ -0,0 +1,51 @@
+# Generated by Django 5.2.1 on 2026-10-16 23:48
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copy of api.utils.skill_names.normalize_skill_name as of this migration
+_SEPARATORS_RE = re.compile(r"[^\w+#./]+")
+
+
+def normalize_skill_name(name):
+    text = unicodedata.normalize("NFKC", name or "").lower()
+    text = _SEPARATORS_RE.sub(" ", text)
+    return " ".join(text.split()).rstrip(".")
+
+
+def backfill_normalized_name(apps, schema_editor):
+    Skill = apps.get_model('api', 'Skill')
+    skills = list(Skill.objects.only('id', 'name'))
+    for skill in skills:
+        skill.normalized_name = normalize_skill_name(skill.name)
+    Skill.objects.bulk_update(skills, ['normalized_name'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0028_role_profiles'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skill',
+            name='normalized_name',
+            field=models.CharField(blank=True, db_index=True, max_length=255),
+        ),
+        migrations.RunPython(backfill_normalized_name, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='SkillAlias',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('normalized_name', models.CharField(max_length=255, unique=True)),
+                ('name', models.CharField(max_length=255)),
+                ('similarity', models.FloatField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='api.skill')),
+            ],
+        ),
+    ]
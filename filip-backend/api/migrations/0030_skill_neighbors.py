@@ -0,0 +1,29 @@
+# Generated by Django 5.2.1 on 2026-10-16 23:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0029_skill_canonicalisation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkillNeighbor',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('similarity', models.FloatField()),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('neighbor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='api.skill')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='neighbors', to='api.skill')),
+            ],
+            options={
+                'ordering': ['rank'],
+                'indexes': [models.Index(fields=['skill', 'rank'], name='skillneighbor_rank_idx')],
+                'constraints': [models.UniqueConstraint(fields=('skill', 'neighbor'), name='skillneighbor_unique_pair')],
+            },
+        ),
+    ]
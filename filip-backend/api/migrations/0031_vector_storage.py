@@ -0,0 +1,22 @@
+from django.db import migrations
+
+# Intentionally empty. This migration used to convert the embedding columns
+# to halfvec when VECTOR_STORAGE="halfvec", which made the schema depend on
+# the environment it was migrated in. Storage is now only changed explicitly
+# with `manage.py convert_vector_storage`; the migration is kept so later
+# migrations keep their dependency chain.
+#
+# The models keep VectorField and vector_cosine_ops either way: values are
+# read and written as "[...]" text, which Postgres casts to the column type,
+# and raw SQL casts to vector_type() (VECTOR_STORAGE). A migration that
+# rebuilds an embedding column or its HNSW index must run
+# `convert_vector_storage --to vector` first.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0030_skill_neighbors"),
+    ]
+
+    operations = []
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-17 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0031_vector_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysisjob',
+            name='boot_id',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
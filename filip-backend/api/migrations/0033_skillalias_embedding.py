@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-17 00:10
+
+import pgvector.django.vector
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0032_analysisjob_boot_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skillalias',
+            name='embedding',
+            field=pgvector.django.vector.VectorField(blank=True, dimensions=1536, null=True),
+        ),
+    ]
@@ -1,7 +1,11 @@
+from .analysis_job import AnalysisJob
+from .cv_cache import CVExtractionCache, CVTextCache
+from .embedding_cache import EmbeddingCacheEntry
 from .jobs import JobPost
 from .learning_path import LearningPath
 from .learning_path_course import LearningPathCourse
-from .skill import Course, CourseSkill, Skill
+from .role_profile import RoleProfile, RoleProfileSkill
+from .skill import Course, CourseSkill, Skill, SkillAlias, SkillNeighbor
 from .udemy import UdemyCourse
 
 __all__ = [
@@ -10,6 +14,14 @@ __all__ = [
     "Course",
     "CourseSkill",
     "Skill",
+    "SkillAlias",
+    "SkillNeighbor",
     "UdemyCourse",
     "JobPost",
+    "EmbeddingCacheEntry",
+    "CVTextCache",
+    "CVExtractionCache",
+    "AnalysisJob",
+    "RoleProfile",
+    "RoleProfileSkill",
 ]
@@ -0,0 +1,47 @@
+# mypy: disable-error-code=var-annotated
+from uuid import uuid4
+
+from django.db import models
+
+
+class AnalysisJob(models.Model):
+    """A long-running recommendation or skill-analysis request run in the background."""
+
+    KIND_RECOMMENDATIONS = "recommendations"
+    KIND_SKILL_ANALYSIS = "skill_analysis"
+    KIND_CHOICES = [
+        (KIND_RECOMMENDATIONS, "Course recommendations"),
+        (KIND_SKILL_ANALYSIS, "Skill analysis"),
+    ]
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    kind = models.CharField(max_length=32, choices=KIND_CHOICES)
+    status = models.CharField(
+        max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    payload = models.JSONField(default=dict)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(db_index=True)
+    # JOB_BOOT_ID of the process that queued the job
+    boot_id = models.CharField(max_length=64, blank=True, default="")
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self):
+        return f"{self.kind}:{self.id} ({self.status})"
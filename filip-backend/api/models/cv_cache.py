@@ -0,0 +1,26 @@
+# mypy: disable-error-code=var-annotated
+from django.db import models
+
+
+class CVTextCache(models.Model):
+    """Text extracted from an uploaded CV, keyed by sha256(file bytes)."""
+
+    id = models.BigAutoField(primary_key=True)
+    file_hash = models.CharField(max_length=64, unique=True)
+    text = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.file_hash[:12]
+
+
+class CVExtractionCache(models.Model):
+    """LLM extraction result for a CV, keyed by sha256(version + CV text)."""
+
+    id = models.BigAutoField(primary_key=True)
+    text_hash = models.CharField(max_length=64, unique=True)
+    result = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.text_hash[:12]
@@ -0,0 +1,23 @@
+# mypy: disable-error-code=var-annotated
+from django.db import models
+from pgvector.django import VectorField
+
+
+class EmbeddingCacheEntry(models.Model):
+    """Persistent embedding cache keyed by (model, sha256(text))."""
+
+    id = models.BigAutoField(primary_key=True)
+    model = models.CharField(max_length=100)
+    text_hash = models.CharField(max_length=64)
+    embedding = VectorField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model", "text_hash"], name="uniq_embedding_cache_key"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.model}:{self.text_hash[:12]}"
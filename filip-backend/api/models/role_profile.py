@@ -0,0 +1,53 @@
+# mypy: disable-error-code=var-annotated
+from django.db import models
+from pgvector.django import HnswIndex, VectorField
+
+
+class RoleProfile(models.Model):
+    """A cluster of similar job posts, built offline by the build_role_profiles command."""
+
+    id = models.BigAutoField(primary_key=True)
+    title = models.CharField(max_length=255)
+    category = models.CharField(max_length=100, blank=True)
+    # Most common job titles in the cluster, for inspection
+    titles = models.JSONField(default=list, blank=True)
+    post_count = models.PositiveIntegerField()
+    # Normalised centroid of the member JobPost embeddings
+    embedding = VectorField(dimensions=1536)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            HnswIndex(
+                name="roleprofile_embedding_hnsw",
+                fields=["embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_cosine_ops"],
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.title} ({self.post_count} posts)"
+
+
+class RoleProfileSkill(models.Model):
+    """How often a skill is required by the job posts of a RoleProfile."""
+
+    id = models.BigAutoField(primary_key=True)
+    profile = models.ForeignKey(RoleProfile, on_delete=models.CASCADE, related_name="skills")
+    name = models.CharField(max_length=255)
+    # Number of posts listing the skill, and that number over post_count
+    support = models.PositiveIntegerField()
+    share = models.FloatField()
+    rank = models.PositiveIntegerField()
+
+    class Meta:
+        ordering = ["rank"]
+        constraints = [
+            models.UniqueConstraint(fields=["profile", "name"], name="roleprofileskill_unique_name")
+        ]
+        indexes = [models.Index(fields=["profile", "rank"], name="roleprofileskill_rank_idx")]
+
+    def __str__(self):
+        return f"{self.name} ({self.share:.0%})"
@@ -2,18 +2,75 @@
 from uuid import uuid4
 
 from django.db import models
-from pgvector.django import VectorField
+from pgvector.django import HnswIndex, VectorField
+
+from api.utils.skill_names import normalize_skill_name
 
 
 class Skill(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     name = models.CharField(max_length=255, unique=True)
+    # normalize_skill_name(name), the exact-match key used by skill canonicalisation
+    normalized_name = models.CharField(max_length=255, blank=True, db_index=True)
     embedding = VectorField(dimensions=1536, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            HnswIndex(
+                name="skill_embedding_hnsw",
+                fields=["embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_cosine_ops"],
+            )
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self.normalized_name:
+            self.normalized_name = normalize_skill_name(self.name)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return str(self.name)
 
 
+class SkillAlias(models.Model):
+    """A free-text skill name seen in a request, mapped to its nearest Skill."""
+
+    id = models.BigAutoField(primary_key=True)
+    normalized_name = models.CharField(max_length=255, unique=True)
+    name = models.CharField(max_length=255)
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="aliases")
+    similarity = models.FloatField()
+    # The alias's own embedding; matching uses it instead of the Skill's
+    embedding = VectorField(dimensions=1536, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.name} -> {self.skill_id}"
+
+
+class SkillNeighbor(models.Model):
+    """One of a Skill's top-k most similar skills, built by the build_skill_graph command."""
+
+    id = models.BigAutoField(primary_key=True)
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="neighbors")
+    neighbor = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="+")
+    # Cosine similarity of the two Skill embeddings
+    similarity = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+
+    class Meta:
+        ordering = ["rank"]
+        constraints = [
+            models.UniqueConstraint(fields=["skill", "neighbor"], name="skillneighbor_unique_pair")
+        ]
+        indexes = [models.Index(fields=["skill", "rank"], name="skillneighbor_rank_idx")]
+
+    def __str__(self):
+        return f"{self.skill_id} ~ {self.neighbor_id} ({self.similarity:.2f})"
+
+
 class Course(models.Model):
     LEVEL_CHOICES = [
         ("Beginner", "Beginner"),
@@ -31,6 +88,17 @@ class Course(models.Model):
     embedding = VectorField(dimensions=1536, null=True, blank=True)
     skills = models.ManyToManyField(Skill, through="CourseSkill")
 
+    class Meta:
+        indexes = [
+            HnswIndex(
+                name="course_embedding_hnsw",
+                fields=["embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_cosine_ops"],
+            )
+        ]
+
     def __str__(self):
         return str(self.title)
 
@@ -1,12 +1,14 @@
 # mypy: disable-error-code=var-annotated
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
-from pgvector.django import VectorField
+from pgvector.django import HnswIndex, VectorField
 
 
 class UdemyCourse(models.Model):
     id = models.CharField(primary_key=True, max_length=64)
     title = models.TextField()
-    level = models.CharField(max_length=100, blank=True)
+    level = models.CharField(max_length=100, blank=True, db_index=True)
     url = models.URLField(max_length=500)
     instructors = models.TextField(blank=True)
     duration = models.CharField(max_length=100, blank=True)
@@ -14,5 +16,37 @@ class UdemyCourse(models.Model):
     description = models.TextField(blank=True)
     embedding = VectorField(dimensions=1536, null=True, blank=True)
 
+    # Typed copies of duration/price, parsed at ingestion, for SQL filtering
+    duration_hours = models.FloatField(null=True, blank=True, db_index=True)
+    question_count = models.PositiveIntegerField(null=True, blank=True, db_index=True)
+    price_vnd = models.PositiveIntegerField(null=True, blank=True, db_index=True)
+    provider = models.CharField(max_length=50, default="Udemy", db_index=True)
+
+    # LLM-generated enrichment, precomputed by the enrich_courses command
+    highlights = models.JSONField(default=list, blank=True)
+    related_topics = models.JSONField(default=list, blank=True)
+    enrichment_hash = models.CharField(max_length=64, blank=True)
+    enriched_at = models.DateTimeField(null=True, blank=True)
+
+    # Full-text search document, maintained by Postgres (title weighted above description)
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config="english")
+        + SearchVector("description", weight="B", config="english"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            HnswIndex(
+                name="udemycourse_embedding_hnsw",
+                fields=["embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_cosine_ops"],
+            ),
+            GinIndex(name="udemycourse_search_gin", fields=["search_vector"]),
+        ]
+
     def __str__(self):
         return str(self.title)
@@ -7,6 +7,7 @@ from .learningpath_analytic_response_serializer import (  # noqa: F401
     LearningPathAnalyticResponseSerializer,
 )
 from .recommendation_request_serializer import (  # noqa: F401
+    CourseFiltersSerializer,
     RecommendationRequestSerializer,
     RecommendationSerializer,
 )
@@ -1,11 +1,27 @@
 # serializers.py
 from rest_framework import serializers
 
+from api.utils.course_metadata import COURSE_LEVELS
+
 
 class RecommendationSerializer(serializers.Serializer):
     name = serializers.CharField()
     level = serializers.CharField(required=False, default="general")
 
 
+class CourseFiltersSerializer(serializers.Serializer):
+    levels = serializers.ListField(
+        child=serializers.ChoiceField(choices=list(COURSE_LEVELS)),
+        required=False,
+        allow_empty=True,
+    )
+    max_duration_hours = serializers.FloatField(required=False, min_value=0)
+    max_price_vnd = serializers.IntegerField(required=False, min_value=0)
+    provider = serializers.CharField(required=False, allow_blank=True)
+
+
 class RecommendationRequestSerializer(serializers.Serializer):
     skills = RecommendationSerializer(many=True)
+    use_validation = serializers.BooleanField(required=False, default=True)
+    validation_mode = serializers.CharField(required=False, default="comprehensive")
+    filters = CourseFiltersSerializer(required=False)
@@ -14,6 +14,8 @@ class CourseItemSerializer(serializers.Serializer):
     course_description = serializers.CharField()
     course_title = serializers.CharField()
     course_duration = serializers.CharField()
+    course_duration_hours = serializers.FloatField(required=False, allow_null=True)
+    course_question_count = serializers.IntegerField(required=False, allow_null=True)
     course_instructor = serializers.CharField()
     course_price = serializers.CharField()
     course_url = serializers.URLField()
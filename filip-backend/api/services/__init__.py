@@ -1,8 +1,11 @@
 from .akajob import fetch_skills_from_akajob
 from .cv_parser import extract_data_from_cv_text, extract_text_from_file
+from .skill_analysis import build_skill_analysis_response, run_skill_analysis
 
 __all__ = [
     "fetch_skills_from_akajob",
     "extract_data_from_cv_text",
     "extract_text_from_file",
+    "build_skill_analysis_response",
+    "run_skill_analysis",
 ]
@@ -0,0 +1,87 @@
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db.models import QuerySet
+
+from api.models.udemy import UdemyCourse
+from api.utils.course_metadata import estimate_study_hours
+
+logger = logging.getLogger(__name__)
+
+# Orderings exposed by the catalog endpoint; each column has a B-tree index
+COURSE_SORT_FIELDS = [
+    "duration_hours",
+    "-duration_hours",
+    "price_vnd",
+    "-price_vnd",
+    "question_count",
+    "-question_count",
+]
+
+
+def _course_url(course: Dict[str, Any]) -> str:
+    return course.get("url") or course.get("course_url") or ""
+
+
+def get_parsed_durations(urls: Iterable[str]) -> Dict[str, Tuple[Optional[float], Optional[int]]]:
+    """
+    Look up the parsed duration columns of catalog courses.
+
+    Args:
+        urls: Course URLs as sent by the client
+
+    Returns:
+        url -> (duration_hours, question_count) for the URLs found in UdemyCourse
+    """
+    urls = [url for url in set(urls) if url]
+    if not urls:
+        return {}
+    rows = UdemyCourse.objects.filter(url__in=urls).values_list(
+        "url", "duration_hours", "question_count"
+    )
+    return {url: (hours, questions) for url, hours, questions in rows}
+
+
+def estimate_course_hours(courses: List[Dict[str, Any]]) -> List[float]:
+    """
+    Study hours for course dicts from a client request.
+
+    Catalog courses use the duration_hours/question_count columns parsed at
+    ingestion; other courses fall back to parsing their "duration" text.
+
+    Args:
+        courses: Course dicts with "url" (or "course_url") and "duration" keys
+
+    Returns:
+        Estimated hours, in the same order as courses
+    """
+    try:
+        parsed = get_parsed_durations(_course_url(course) for course in courses)
+    except Exception as e:
+        logger.warning(f"Course duration lookup failed, parsing durations instead: {str(e)}")
+        parsed = {}
+
+    hours = []
+    for course in courses:
+        duration_hours, question_count = parsed.get(_course_url(course), (None, None))
+        hours.append(
+            estimate_study_hours(
+                duration_hours,
+                question_count,
+                str(course.get("duration") or course.get("course_duration") or ""),
+            )
+        )
+    return hours
+
+
+def sort_courses(queryset: QuerySet, sort: Optional[str]) -> QuerySet:
+    """
+    Order a UdemyCourse queryset by one of COURSE_SORT_FIELDS.
+
+    Courses without a value for the sort column are left out, so the
+    ordering can be served by the column's index. Unknown values sort by id.
+    """
+    if sort not in COURSE_SORT_FIELDS:
+        return queryset.order_by("id")
+    field = sort.lstrip("-")
+    return queryset.exclude(**{f"{field}__isnull": True}).order_by(sort, "id")
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db.models import Q
+from django.utils import timezone
+from langchain_core.messages import HumanMessage, SystemMessage
+from typing_extensions import TypedDict, cast
+
+from api.models.udemy import UdemyCourse
+from api.utils.llm_clients import get_chat_llm
+
+logger = logging.getLogger(__name__)
+
+# Bump when the prompt changes so every stored enrichment is regenerated
+ENRICHMENT_VERSION = "1"
+
+ENRICHMENT_FIELDS = ["highlights", "related_topics", "enrichment_hash", "enriched_at"]
+
+# Parallel LLM calls when a request has to enrich missing or stale courses
+MAX_CONCURRENT_ENRICHMENTS = 5
+
+
+class CourseEnrichment(TypedDict):
+    highlights: List[str]
+    related_topics: List[str]
+
+
+EMPTY_ENRICHMENT: CourseEnrichment = {"highlights": [], "related_topics": []}
+
+
+def course_content_hash(course: UdemyCourse) -> str:
+    """Hash of the course fields the enrichment is derived from."""
+    content = "\n".join(
+        [ENRICHMENT_VERSION, course.title, course.level, course.url, course.description]
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def needs_enrichment(course: UdemyCourse) -> bool:
+    """True if the course was never enriched or its content changed since."""
+    return course.enrichment_hash != course_content_hash(course)
+
+
+def generate_enrichment(course: UdemyCourse) -> CourseEnrichment:
+    """Ask the LLM for a course's highlights and related topics in one call."""
+    llm = get_chat_llm()
+
+    system_prompt = (
+        "You extract structured information about an online course.\n"
+        "Return a single raw JSON object with exactly 2 fields:\n"
+        "1. highlights (array of strings): 3-5 specific learning outcomes, "
+        "as in a 'What you'll learn' section\n"
+        "2. related_topics (array of strings): broader topics or categories "
+        "this course relates to\n\n"
+        "**Important:** Output ONLY a valid raw JSON object. No markdown, no explanation."
+    )
+    course_text = (
+        f"Course title: {course.title}\n"
+        f"Level: {course.level}\n"
+        f"Link: {course.url}\n"
+        f"Course description: {course.description}"
+    )
+
+    response = llm.invoke(
+        [SystemMessage(content=system_prompt), HumanMessage(content=course_text)]
+    )
+    raw = cast(str, response.content).strip()
+    if raw.startswith("```"):
+        raw = raw.strip("`").removeprefix("json").strip()
+
+    try:
+        parsed = json.loads(raw)
+        return {
+            "highlights": [str(h) for h in parsed.get("highlights", [])][:5],
+            "related_topics": [str(t) for t in parsed.get("related_topics", [])],
+        }
+    except (json.JSONDecodeError, AttributeError) as e:
+        raise ValueError(f"Invalid enrichment JSON for course {course.id}: {e}")
+
+
+def enrich_course(course: UdemyCourse, save: bool = True) -> CourseEnrichment:
+    """Generate and store a course's enrichment."""
+    enrichment = generate_enrichment(course)
+    course.highlights = enrichment["highlights"]
+    course.related_topics = enrichment["related_topics"]
+    course.enrichment_hash = course_content_hash(course)
+    course.enriched_at = timezone.now()
+    if save:
+        course.save(update_fields=ENRICHMENT_FIELDS)
+    return enrichment
+
+
+def _stored_enrichment(course: UdemyCourse) -> CourseEnrichment:
+    return {
+        "highlights": list(course.highlights),
+        "related_topics": list(course.related_topics),
+    }
+
+
+def load_course_enrichments(
+    course_ids: Iterable[str] = (),
+    urls: Iterable[str] = (),
+) -> Tuple[Dict[str, CourseEnrichment], List[UdemyCourse]]:
+    """
+    Look up stored enrichments for retrieved courses, without calling the LLM.
+
+    Courses are matched by id, or by URL for vector-store documents that do
+    not carry a course_id.
+
+    Returns:
+        (enrichments keyed by both course id and course URL, catalogue
+        courses that are missing or stale)
+    """
+    course_ids = [c for c in course_ids if c]
+    urls = [u for u in urls if u]
+    if not course_ids and not urls:
+        return {}, []
+
+    enrichments: Dict[str, CourseEnrichment] = {}
+    stale: List[UdemyCourse] = []
+    for course in UdemyCourse.objects.filter(Q(id__in=course_ids) | Q(url__in=urls)):
+        if needs_enrichment(course):
+            stale.append(course)
+            continue
+        enrichment = _stored_enrichment(course)
+        enrichments[course.id] = enrichment
+        enrichments[course.url] = enrichment
+    return enrichments, stale
+
+
+def get_course_enrichments(
+    course_ids: Iterable[str] = (),
+    urls: Iterable[str] = (),
+    generate_missing: bool = True,
+    max_workers: int = MAX_CONCURRENT_ENRICHMENTS,
+) -> Dict[str, CourseEnrichment]:
+    """
+    Look up stored enrichments for retrieved courses.
+
+    Only courses that are missing or stale are sent to the LLM, concurrently
+    (at most max_workers at once), and the results stored; everything else
+    is served from the DB. Courses whose generation fails are left out.
+
+    Returns:
+        Enrichments keyed by both course id and course URL
+    """
+    enrichments, stale = load_course_enrichments(course_ids, urls)
+    if not generate_missing or not stale:
+        return enrichments
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(stale)))) as executor:
+        futures = {executor.submit(enrich_course, course): course for course in stale}
+        for future in as_completed(futures):
+            course = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Enrichment failed for course {course.id}: {e}")
+                continue
+            enrichment = _stored_enrichment(course)
+            enrichments[course.id] = enrichment
+            enrichments[course.url] = enrichment
+    return enrichments
+
+
+def lookup_enrichment(
+    enrichments: Dict[str, CourseEnrichment],
+    course_id: Optional[str],
+    url: Optional[str],
+) -> CourseEnrichment:
+    """Pick a course's enrichment by id, then URL, or return an empty one."""
+    return (
+        enrichments.get(course_id or "")
+        or enrichments.get(url or "")
+        or EMPTY_ENRICHMENT
+    )
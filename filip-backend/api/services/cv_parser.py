@@ -1,17 +1,33 @@
+import hashlib
 import json
+import logging
 from io import BytesIO
+from typing import Optional
 
 import textract
 from django.core.files.uploadedfile import UploadedFile
 from docx import Document
 from langchain_community.callbacks.manager import get_openai_callback
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import AzureChatOpenAI
 from typing_extensions import Dict, List, TypedDict, cast
 
+from api.models import CVExtractionCache, CVTextCache
 from api.types import Education, Experience, LLMUsage, SkillGap
+from api.utils.llm_clients import get_chat_llm
 from filip import settings
 
+logger = logging.getLogger(__name__)
+
+# Bump when the extraction prompt changes so cached results are not reused
+CV_EXTRACTION_VERSION = "1"
+
+ZERO_USAGE: LLMUsage = {
+    "prompt_tokens": 0,
+    "completion_tokens": 0,
+    "total_tokens": 0,
+    "cost": 0,
+}
+
 
 class CVExtractionResult(TypedDict):
     experience: Experience
@@ -20,31 +36,92 @@ class CVExtractionResult(TypedDict):
     llm_usage: Dict[str, LLMUsage]
 
 
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def cv_text_hash(cv_text: str) -> str:
+    """Cache key for a CV's extraction result."""
+    return _sha256(f"{CV_EXTRACTION_VERSION}\n{cv_text}".encode("utf-8"))
+
+
+def _get_cached_text(file_hash: str) -> Optional[str]:
+    try:
+        return (
+            CVTextCache.objects.filter(file_hash=file_hash)
+            .values_list("text", flat=True)
+            .first()
+        )
+    except Exception as e:
+        logger.warning(f"CV text cache lookup failed: {e}")
+        return None
+
+
+def _store_text(file_hash: str, text: str):
+    try:
+        CVTextCache.objects.update_or_create(file_hash=file_hash, defaults={"text": text})
+    except Exception as e:
+        logger.warning(f"CV text cache write failed: {e}")
+
+
+def _get_cached_extraction(text_hash: str) -> Optional[dict]:
+    try:
+        return (
+            CVExtractionCache.objects.filter(text_hash=text_hash)
+            .values_list("result", flat=True)
+            .first()
+        )
+    except Exception as e:
+        logger.warning(f"CV extraction cache lookup failed: {e}")
+        return None
+
+
+def _store_extraction(text_hash: str, result: dict):
+    try:
+        CVExtractionCache.objects.update_or_create(
+            text_hash=text_hash, defaults={"result": result}
+        )
+    except Exception as e:
+        logger.warning(f"CV extraction cache write failed: {e}")
+
+
 def extract_text_from_file(file: UploadedFile) -> str:
     filename = (file.name or "").lower()
 
     file.seek(0)
     content = file.read()
 
+    # The same file uploaded again skips textract/docx parsing
+    file_hash = _sha256(content)
+    if settings.CV_CACHE_ENABLED:
+        cached = _get_cached_text(file_hash)
+        if cached is not None:
+            return cached
+
     if filename.endswith(".docx"):
         doc = Document(BytesIO(content))
-        return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
+        text = "\n".join(p.text for p in doc.paragraphs if p.text.strip())
     else:
         try:
             text = textract.process(filename, input_data=content).decode("utf-8")
-            return text
         except Exception as e:
             raise RuntimeError(f"Text extraction failed: {str(e)}")
 
+    if settings.CV_CACHE_ENABLED:
+        _store_text(file_hash, text)
+    return text
+
 
 def extract_data_from_cv_text(cv_text: str) -> CVExtractionResult:
-    llm = AzureChatOpenAI(
-        openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-        api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-        model=settings.AZURE_OPENAI_CHAT_MODEL,
-        temperature=0,
-    )
+    # Cached results cost nothing, so they report zero usage
+    text_hash = cv_text_hash(cv_text)
+    if settings.CV_CACHE_ENABLED:
+        cached = _get_cached_extraction(text_hash)
+        if cached is not None:
+            cached["llm_usage"] = {"extract_data_from_cv": dict(ZERO_USAGE)}
+            return cast(CVExtractionResult, cached)
+
+    llm = get_chat_llm()
 
     system_prompt = (
         "You are an AI that extracts structured information from a CV.\n"
@@ -71,7 +148,6 @@ def extract_data_from_cv_text(cv_text: str) -> CVExtractionResult:
             "cost": cb.total_cost,
         }
 
-    response = llm.invoke(messages)
     raw = cast(str, response.content).strip()
 
     try:
@@ -85,6 +161,9 @@ def extract_data_from_cv_text(cv_text: str) -> CVExtractionResult:
         if not required_fields.issubset(parsed):
             raise ValueError("Missing required field: extracted_skills")
 
+        if settings.CV_CACHE_ENABLED:
+            _store_extraction(text_hash, parsed)
+
         parsed["llm_usage"] = {"extract_data_from_cv": usage}
         return cast(CVExtractionResult, parsed)
     except json.JSONDecodeError as e:
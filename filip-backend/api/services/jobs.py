@@ -0,0 +1,236 @@
+"""
+Background analysis jobs.
+
+Long recommendation and skill-analysis requests are stored as AnalysisJob
+rows and run on a bounded in-process thread pool, so the HTTP worker returns
+immediately and clients poll for the result. No external broker is needed.
+Each job records the JOB_BOOT_ID that queued it: at startup cleanup_jobs
+--orphaned fails jobs a previous boot left pending or running, and the pool
+itself runs cleanup_jobs every JOB_CLEANUP_INTERVAL_SECONDS.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from api.models import AnalysisJob
+from filip import settings
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_last_cleanup: Optional[float] = None
+_cleanup_lock = threading.Lock()
+
+
+def _run_recommendations(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from api.services.recommendations import recommend_courses_for_skills
+
+    return recommend_courses_for_skills(
+        payload["skills"],
+        use_validation=payload.get("use_validation", True),
+        validation_mode=payload.get("validation_mode", "comprehensive"),
+        request_id=payload.get("request_id", "unknown"),
+        filters=payload.get("filters"),
+    )
+
+
+def _run_skill_analysis(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from api.services.skill_analysis import run_skill_analysis
+
+    return run_skill_analysis(
+        cv_text=payload.get("cv_text"),
+        user_description=payload.get("user_description", ""),
+        timeline=payload.get("timeline", "6-months"),
+        project_requirements=payload.get("project_requirements", ""),
+        thread_id=payload["thread_id"],
+    )
+
+
+JOB_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    AnalysisJob.KIND_RECOMMENDATIONS: _run_recommendations,
+    AnalysisJob.KIND_SKILL_ANALYSIS: _run_skill_analysis,
+}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.JOB_WORKERS, thread_name_prefix="analysis-job"
+                )
+    return _executor
+
+
+def _log_failure(future: Future):
+    """Done callback: surface exceptions that escaped a pool task"""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Background job task failed: {str(error)}", exc_info=error)
+
+
+def _submit(func: Callable, *args) -> Future:
+    future = _get_executor().submit(func, *args)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def _schedule_cleanup():
+    """Queue cleanup_jobs on the pool at most once per JOB_CLEANUP_INTERVAL_SECONDS"""
+    global _last_cleanup
+    now = time.monotonic()
+    with _cleanup_lock:
+        if _last_cleanup is not None and now - _last_cleanup < settings.JOB_CLEANUP_INTERVAL_SECONDS:
+            return
+        _last_cleanup = now
+    _submit(_run_cleanup)
+
+
+def _run_cleanup():
+    close_old_connections()
+    try:
+        counts = cleanup_jobs()
+        logger.info(
+            f"Job cleanup: deleted {counts['deleted']} expired, failed {counts['failed']} stale"
+        )
+    finally:
+        close_old_connections()
+
+
+def submit_job(kind: str, payload: Dict[str, Any]) -> AnalysisJob:
+    """
+    Store a job and queue it on the worker pool.
+
+    Args:
+        kind: One of AnalysisJob.KIND_* (a key of JOB_HANDLERS)
+        payload: JSON-serializable handler arguments
+
+    Returns:
+        The pending AnalysisJob
+    """
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+
+    job = AnalysisJob.objects.create(
+        kind=kind,
+        payload=payload,
+        expires_at=timezone.now() + timedelta(seconds=settings.JOB_RESULT_TTL_SECONDS),
+        boot_id=settings.JOB_BOOT_ID,
+    )
+    _submit(run_job, job.id)
+    logger.info(f"Queued {kind} job {job.id}")
+    _schedule_cleanup()
+    return job
+
+
+def run_job(job_id: UUID):
+    """Run one job in the current thread and record its result or error."""
+    close_old_connections()
+    try:
+        updated = AnalysisJob.objects.filter(
+            id=job_id, status=AnalysisJob.STATUS_PENDING
+        ).update(status=AnalysisJob.STATUS_RUNNING, started_at=timezone.now())
+        if not updated:
+            return
+
+        job = AnalysisJob.objects.get(id=job_id)
+        try:
+            result = JOB_HANDLERS[job.kind](job.payload)
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {str(e)}", exc_info=True)
+            job.status = AnalysisJob.STATUS_FAILED
+            job.error = str(e)
+        else:
+            job.status = AnalysisJob.STATUS_SUCCEEDED
+            job.result = result
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "result", "error", "finished_at"])
+        logger.info(f"Job {job_id} finished with status {job.status}")
+    finally:
+        close_old_connections()
+
+
+def get_job(job_id: UUID) -> Optional[AnalysisJob]:
+    """Return an unexpired job, or None."""
+    return AnalysisJob.objects.filter(id=job_id, expires_at__gt=timezone.now()).first()
+
+
+def cleanup_jobs() -> Dict[str, int]:
+    """
+    Delete expired jobs and fail ones that never finished.
+
+    Returns:
+        Counts of deleted and failed (stale) jobs
+    """
+    now = timezone.now()
+    deleted, _ = AnalysisJob.objects.filter(expires_at__lte=now).delete()
+
+    stale_before = now - timedelta(seconds=settings.JOB_MAX_RUNTIME_SECONDS)
+    failed = AnalysisJob.objects.filter(
+        Q(status=AnalysisJob.STATUS_PENDING) | Q(status=AnalysisJob.STATUS_RUNNING),
+        created_at__lt=stale_before,
+    ).update(
+        status=AnalysisJob.STATUS_FAILED,
+        error="Job did not finish in time",
+        finished_at=now,
+    )
+    return {"deleted": deleted, "failed": failed}
+
+
+def fail_orphaned_jobs(boot_id: Optional[str] = None) -> int:
+    """
+    Fail pending or running jobs queued by another boot.
+
+    Their worker threads died with that process, so they would otherwise only
+    be failed once they exceed JOB_MAX_RUNTIME_SECONDS. Run before the server
+    starts, with the JOB_BOOT_ID the server will use.
+
+    Args:
+        boot_id: The current boot (default: JOB_BOOT_ID)
+
+    Returns:
+        Number of jobs failed
+    """
+    boot_id = settings.JOB_BOOT_ID if boot_id is None else boot_id
+    return (
+        AnalysisJob.objects.filter(
+            Q(status=AnalysisJob.STATUS_PENDING) | Q(status=AnalysisJob.STATUS_RUNNING)
+        )
+        .exclude(boot_id=boot_id)
+        .update(
+            status=AnalysisJob.STATUS_FAILED,
+            error="Job was interrupted by a server restart",
+            finished_at=timezone.now(),
+        )
+    )
+
+
+def serialize_job(job: AnalysisJob) -> Dict[str, Any]:
+    """Status payload returned to polling clients."""
+    data: Dict[str, Any] = {
+        "job_id": str(job.id),
+        "kind": job.kind,
+        "status": job.status,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "expires_at": job.expires_at.isoformat(),
+    }
+    if job.status == AnalysisJob.STATUS_SUCCEEDED:
+        data["result"] = job.result
+    elif job.status == AnalysisJob.STATUS_FAILED:
+        data["error"] = job.error
+    return data
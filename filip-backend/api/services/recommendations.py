@@ -0,0 +1,70 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from api.ai.course_filters import CourseFilters
+from api.ai.agent_rag_course import (
+    get_recommendations_for_skills,
+    get_validated_recommendations_for_skills,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def recommend_courses_for_skills(
+    skills: List[dict],
+    use_validation: bool = True,
+    validation_mode: str = "comprehensive",
+    request_id: str = "unknown",
+    filters: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Recommend courses for skills, with or without the validation system.
+
+    Args:
+        skills: Skill dictionaries with name/level information
+        use_validation: Use the validated recommendation agent
+        validation_mode: Validation mode name when validation is enabled
+        request_id: Client request id echoed in the response metadata
+        filters: Validated CourseFiltersSerializer data (levels, max_duration_hours,
+            max_price_vnd, provider), applied in SQL before ranking
+
+    Returns:
+        Recommendations, courses, validation results and response_metadata
+    """
+    course_filters = CourseFilters.from_dict(filters)
+
+    if use_validation:
+        validation_config = {
+            "validation_mode": validation_mode,
+            "use_validation": use_validation
+        }
+
+        result = get_validated_recommendations_for_skills(
+            skills=skills,
+            use_enhanced_validation=True,
+            validation_config=validation_config,
+            filters=course_filters,
+        )
+
+        # Log validation results
+        validation = result.get("validation", {})
+        if validation.get("is_valid", False):
+            logger.info(f"Course recommendation validation passed with score: {validation.get('overall_score', 0):.3f}")
+        else:
+            logger.warning(f"Course recommendation validation issues: {validation.get('reasons', [])}")
+    else:
+        # Use legacy system
+        result = get_recommendations_for_skills(skills, course_filters)
+        logger.info("Using legacy recommendation system (validation disabled)")
+
+    # Add response metadata
+    result["response_metadata"] = {
+        "validation_enabled": use_validation,
+        "validation_mode": validation_mode,
+        "enhanced_validation": result.get("enhanced_validation", False),
+        "course_count": len(result.get("courses", [])),
+        "filters": filters or {},
+        "request_id": request_id
+    }
+
+    return result
@@ -0,0 +1,102 @@
+from typing import Any, Optional
+
+from typing_extensions import Dict
+
+from api.ai import run_skill_gap_pipeline
+from api.types import LLMUsage
+
+from .akajob import fetch_skills_from_akajob
+from .cv_parser import CVExtractionResult, extract_data_from_cv_text
+
+
+def compute_total_llm_usage(
+    llm_usage: Dict[str, LLMUsage],
+) -> LLMUsage:
+    total: LLMUsage = {
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+        "cost": 0.0,
+    }
+
+    # Sum values across all tool steps
+    for usage in llm_usage.values():
+        if isinstance(usage, dict):
+            total["prompt_tokens"] += usage.get("prompt_tokens", 0)
+            total["completion_tokens"] += usage.get("completion_tokens", 0)
+            total["total_tokens"] += usage.get("total_tokens", 0)
+            total["cost"] += usage.get("cost", 0.0)
+
+    # Round the cost for readability
+    total["cost"] = round(total["cost"], 6)
+
+    return total
+
+
+def build_skill_analysis_response(
+    cv_result: CVExtractionResult,
+    skill_gap_result: Dict[str, Any],
+    thread_id: str,
+    target_goal: str,
+    timeline: str,
+) -> Dict[str, Any]:
+    """Shape the CV extraction and skill-gap results into the API response."""
+    llm_usage = cv_result.get("llm_usage", {}) | skill_gap_result.get(
+        "llm_usage", {}
+    )
+    llm_usage["total"] = compute_total_llm_usage(llm_usage)
+
+    return {
+        "thread_id": thread_id,
+        "target_goal": target_goal,
+        "timeline": timeline,
+        "education": cv_result.get("education", []),
+        "experience": cv_result.get("experience", {}),
+        "extracted_skills": cv_result.get("extracted_skills", []),
+        "skills_gap": skill_gap_result.get("recommended_skills", []),
+        "overall_score": skill_gap_result.get("overall_score", 0),
+        "llm_usage": llm_usage,
+    }
+
+
+def run_skill_analysis(
+    cv_text: Optional[str],
+    user_description: str,
+    timeline: str,
+    project_requirements: str,
+    thread_id: str,
+) -> Dict[str, Any]:
+    """
+    Run a full skill analysis: CV extraction (or AkaJob skills) then the skill-gap pipeline.
+
+    Args:
+        cv_text: Text of the uploaded CV; None uses the AkaJob profile
+        user_description: Target role or goal
+        timeline: Time available to learn
+        project_requirements: Optional constraints
+        thread_id: LangGraph checkpoint thread
+
+    Returns:
+        The same payload SkillAnalysisView returns
+    """
+    cv_result = (
+        extract_data_from_cv_text(cv_text) if cv_text else fetch_skills_from_akajob()
+    )
+
+    skill_gap_result = run_skill_gap_pipeline(
+        current_skills=[
+            {
+                "name": s.get("name", ""),
+                "level": s.get("level", ""),
+            }
+            for s in cv_result.get("extracted_skills", [])
+        ],
+        target_goal=user_description,
+        timeline=timeline,
+        project_requirements=project_requirements,
+        thread_id=thread_id,
+    )
+
+    return build_skill_analysis_response(
+        cv_result, dict(skill_gap_result), thread_id, user_description, timeline
+    )
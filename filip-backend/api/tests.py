@@ -1,3 +1,667 @@
-from django.test import TestCase
+import asyncio
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from langchain_core.documents import Document
+
+from api.ai.agent_rag_skills import _role_skill_line
+from api.ai.concurrency import bounded_gather, run_detached
+from api.ai.hybrid_search import HYBRID_SQL, RRF_K, HybridCourseStore, hybrid_course_search
+from api.ai.response_validation import ConfidenceLevel, ResponseValidator, ValidationResult
+from api.ai.role_profiles import cluster_job_posts, find_role_profile, skill_frequencies
+from api.ai.skill_canonicalization import _lookup_known, _resolve_unknown
+from api.ai.skill_graph import SkillGraph, top_k_neighbors
+from api.ai.validated_course_agent import ValidatedCourseAgent
+from api.ai.validation_cache import LocalValidationCacheBackend, ValidationCache
+from api.ai.validation_config import ValidationConfigManager
+from api.ai.vector_stores import sync_course_collection
+from api.models import AnalysisJob, UdemyCourse
+from api.services import jobs
+from api.utils.course_metadata import (
+    DEFAULT_STUDY_HOURS,
+    estimate_study_hours,
+    parse_duration_hours,
+    parse_price_vnd,
+    parse_question_count,
+)
+from api.utils.embedding import EmbeddingBatcher
+from api.utils.skill_names import normalize_skill_name
+from api.utils.vector_search import VECTOR_TABLES, effective_ef_search
+from filip import settings
+
+
+class CourseMetadataParserTests(SimpleTestCase):
+    def test_duration_hours(self):
+        self.assertEqual(parse_duration_hours("2.5 total hours"), 2.5)
+        self.assertEqual(parse_duration_hours("1 total hour"), 1.0)
+        self.assertEqual(parse_duration_hours("33 total mins"), 0.55)
+        self.assertEqual(parse_duration_hours("3"), 3.0)
+        self.assertIsNone(parse_duration_hours("191 questions"))
+        self.assertIsNone(parse_duration_hours(""))
+        self.assertIsNone(parse_duration_hours(None))
+
+    def test_question_count(self):
+        self.assertEqual(parse_question_count("191 questions"), 191)
+        self.assertEqual(parse_question_count("1,491 questions"), 1491)
+        self.assertEqual(parse_question_count("1 question"), 1)
+        self.assertIsNone(parse_question_count("2.5 total hours"))
+        self.assertIsNone(parse_question_count(None))
+
+    def test_price_vnd(self):
+        self.assertEqual(parse_price_vnd("1,150,000"), 1150000)
+        self.assertEqual(parse_price_vnd("1.150.000"), 1150000)
+        self.assertEqual(parse_price_vnd("499000.00"), 499000)
+        self.assertEqual(parse_price_vnd("Free"), 0)
+        self.assertIsNone(parse_price_vnd(""))
+        self.assertIsNone(parse_price_vnd(None))
+
+    def test_estimate_prefers_parsed_columns(self):
+        self.assertEqual(estimate_study_hours(4.0, None, "ignored text"), 4.0)
+        self.assertEqual(estimate_study_hours(None, 90), 3.0)
+
+    def test_estimate_falls_back_to_text(self):
+        self.assertEqual(estimate_study_hours(duration_text="12.5 total hours"), 12.5)
+        self.assertEqual(estimate_study_hours(duration_text="60 questions"), 2.0)
+        self.assertEqual(estimate_study_hours(duration_text="3 weeks"), 15)
+        self.assertEqual(estimate_study_hours(duration_text="1-3 months"), 40)
+        self.assertEqual(estimate_study_hours(duration_text="self paced"), DEFAULT_STUDY_HOURS)
+
+
+class SkillNameNormalizationTests(SimpleTestCase):
+    def test_spelling_variants_share_a_key(self):
+        self.assertEqual(normalize_skill_name(" Node.JS "), "node.js")
+        self.assertEqual(normalize_skill_name("Machine-Learning"), "machine learning")
+        self.assertEqual(normalize_skill_name("ＰＹＴＨＯＮ"), "python")
+
+    def test_symbols_are_kept(self):
+        self.assertEqual(normalize_skill_name("C++"), "c++")
+        self.assertEqual(normalize_skill_name("C#"), "c#")
+        self.assertEqual(normalize_skill_name(".NET"), ".net")
+        self.assertEqual(normalize_skill_name("CI/CD"), "ci/cd")
+        self.assertEqual(normalize_skill_name(None), "")
+
+
+class FakeEmbeddingsAPI:
+    """Embeddings client returning [len(text)] per input, optionally dropping some"""
+
+    def __init__(self, drop: int = 0, block: threading.Event = None):
+        self.calls = []
+        self.drop = drop
+        self.block = block
+        self.embeddings = self
+
+    def create(self, model, input):
+        if self.block is not None:
+            self.block.wait(5)
+        self.calls.append(list(input))
+        data = [SimpleNamespace(index=i, embedding=[float(len(t))]) for i, t in enumerate(input)]
+        # Out of order, as the API allows
+        return SimpleNamespace(data=list(reversed(data[: len(data) - self.drop])))
+
+
+class EmbeddingBatcherTests(SimpleTestCase):
+    def _batcher(self, api, max_inputs=256, max_tokens=200000):
+        batcher = EmbeddingBatcher("test")
+        batcher.window = 0.05
+        batcher.max_inputs = max_inputs
+        batcher.max_tokens = max_tokens
+        patcher = mock.patch("api.utils.embedding.get_embedding_api_client", return_value=api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return batcher
+
+    def test_concurrent_submits_merge_into_one_call(self):
+        api = FakeEmbeddingsAPI()
+        batcher = self._batcher(api)
+        first = batcher.submit(["a", "bb"])
+        second = batcher.submit(["ccc"])
+        self.assertEqual([f.result(5) for f in first + second], [[1.0], [2.0], [3.0]])
+        self.assertEqual(api.calls, [["a", "bb", "ccc"]])
+
+    def test_batches_split_at_max_inputs(self):
+        api = FakeEmbeddingsAPI()
+        batcher = self._batcher(api, max_inputs=2)
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+        self.assertEqual(batcher.embed(texts, timeout=5), [[float(len(t))] for t in texts])
+        self.assertEqual(sorted(len(call) for call in api.calls), [1, 2, 2])
+
+    def test_short_response_fails_every_input(self):
+        batcher = self._batcher(FakeEmbeddingsAPI(drop=1))
+        with self.assertRaises(RuntimeError):
+            batcher.embed(["a", "bb"], timeout=5)
+
+    def test_embed_times_out_and_cancels(self):
+        release = threading.Event()
+        batcher = self._batcher(FakeEmbeddingsAPI(block=release))
+        futures = batcher.submit(["a"])
+        with self.assertRaises(FutureTimeoutError):
+            batcher.embed(["bb"], timeout=0.1)
+        release.set()
+        self.assertEqual(futures[0].result(5), [1.0])
+
+
+def _validation_result(score: float) -> ValidationResult:
+    return ValidationResult(score >= 0.6, score, ConfidenceLevel.MEDIUM, [], [])
+
+
+class ResponseValidatorTimeoutTests(SimpleTestCase):
+    def _validator(self, timeout_seconds=None) -> ResponseValidator:
+        # Orchestration only; the validators themselves are not used
+        validator = ResponseValidator.__new__(ResponseValidator)
+        validator.timeout_seconds = timeout_seconds
+        validator.parallel = True
+        validator.use_rubric = False
+        validator.logger = mock.Mock()
+        return validator
+
+    def test_timed_out_validator_weight_is_renormalized(self):
+        validator = self._validator(timeout_seconds=1)
+        results = {
+            "semantic": _validation_result(0.8),
+            "contextual": validator._timed_out_result("contextual"),
+            "domain": _validation_result(0.4),
+        }
+        weights = {"semantic": 0.25, "contextual": 0.30, "domain": 0.25}
+        aggregated = validator._aggregate_results(results, "q", "r", "courses", weights, time.time())
+        self.assertAlmostEqual(aggregated["overall_score"], 0.6)
+        self.assertEqual(aggregated["timed_out_validations"], ["contextual"])
+        self.assertNotIn("contextual", aggregated["failed_validations"])
+        self.assertTrue(aggregated["validation_metadata"]["partial"])
+
+    def test_incomplete_custom_weights(self):
+        validator = self._validator()
+        results = {"semantic": _validation_result(0.9), "quality": _validation_result(0.1)}
+        aggregated = validator._aggregate_results(
+            results, "q", "r", "courses", {"semantic": 1.0}, time.time()
+        )
+        self.assertAlmostEqual(aggregated["overall_score"], 0.9)
+
+    def test_timeout_does_not_wait_for_blocking_call(self):
+        validator = self._validator(timeout_seconds=0.05)
+
+        async def slow_validation():
+            await run_detached(time.sleep, 1.0)
+            return _validation_result(1.0)
+
+        start = time.monotonic()
+        result = asyncio.run(validator._run_with_timeout("quality", slow_validation()))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertTrue(result.metadata["timed_out"])
+
+
+class ValidationCacheTests(SimpleTestCase):
+    def test_key_covers_every_input(self):
+        base = ("query", "response", "courses", {"semantic": 0.5, "quality": 0.5}, "default:multi_call")
+        key = ValidationCache.make_key(*base)
+        self.assertTrue(key.startswith(ValidationCache.KEY_PREFIX))
+        # Weight order does not matter
+        self.assertEqual(
+            key,
+            ValidationCache.make_key(
+                "query", "response", "courses", {"quality": 0.5, "semantic": 0.5}, "default:multi_call"
+            ),
+        )
+        for index, changed in enumerate(
+            ["other", "other", "skills", {"semantic": 1.0}, "default:rubric"]
+        ):
+            args = list(base)
+            args[index] = changed
+            self.assertNotEqual(key, ValidationCache.make_key(*args))
+
+    def test_results_are_copied_in_and_out(self):
+        cache = ValidationCache(LocalValidationCacheBackend(max_entries=10))
+        result = {"overall_score": 0.8, "validation_metadata": {"cache_hit": False}}
+        cache.set("k", result, ttl_seconds=60)
+        result["validation_metadata"]["cache_hit"] = True
+
+        cached = cache.get("k")
+        self.assertFalse(cached["validation_metadata"]["cache_hit"])
+        cached["overall_score"] = 0.0
+        self.assertEqual(cache.get("k")["overall_score"], 0.8)
+
+    def _validate(self, results):
+        validator = ResponseValidator.__new__(ResponseValidator)
+        validator.timeout_seconds = None
+        validator.parallel = True
+        validator.use_rubric = False
+        validator.cache_ttl_seconds = 60
+        validator.validation_mode = "default"
+        validator.logger = mock.Mock()
+        cache = ValidationCache(LocalValidationCacheBackend(max_entries=10))
+
+        async def run_validators(*args):
+            return results
+
+        with mock.patch("api.ai.response_validation.validation_cache", cache), mock.patch.object(
+            validator, "_run_validators", side_effect=run_validators
+        ):
+            asyncio.run(validator.validate_response("q", "r", weights={"semantic": 0.5, "quality": 0.5}))
+            key = ValidationCache.make_key(
+                "q", "r", "courses", {"semantic": 0.5, "quality": 0.5}, validator._cache_mode()
+            )
+        return cache.get(key)
+
+    def test_complete_results_are_stored(self):
+        cached = self._validate({"semantic": _validation_result(0.8), "quality": _validation_result(0.7)})
+        self.assertAlmostEqual(cached["overall_score"], 0.75)
+
+    def test_failed_validator_results_are_not_stored(self):
+        failed = ValidationResult(
+            False, 0.0, ConfidenceLevel.FAILED, ["Quality validation failed"], [],
+            metadata={"error": "Error code: 429"},
+        )
+        self.assertIsNone(self._validate({"semantic": _validation_result(0.8), "quality": failed}))
+
+    def test_local_backend_expiry_and_eviction(self):
+        backend = LocalValidationCacheBackend(max_entries=2)
+        backend.set("old", {"v": 1}, ttl_seconds=-1)
+        self.assertIsNone(backend.get("old"))
+        backend.set("a", {"v": 1}, ttl_seconds=60)
+        backend.set("b", {"v": 2}, ttl_seconds=60)
+        backend.get("a")
+        backend.set("c", {"v": 3}, ttl_seconds=60)
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.get("a"), {"v": 1})
+
+
+class BoundedGatherTests(SimpleTestCase):
+    def test_results_keep_input_order_under_the_cap(self):
+        running = 0
+        peak = 0
+
+        async def work(index):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 * (5 - index))
+            running -= 1
+            return index
+
+        results = asyncio.run(
+            bounded_gather([lambda i=i: work(i) for i in range(5)], limit=2)
+        )
+        self.assertEqual(results, [0, 1, 2, 3, 4])
+        self.assertEqual(peak, 2)
+
+    def test_fallback_replaces_failed_items(self):
+        async def work(index):
+            if index == 1:
+                raise ValueError("boom")
+            return index
+
+        factories = [lambda i=i: work(i) for i in range(3)]
+        results = asyncio.run(bounded_gather(factories, fallback=lambda i, e: f"fallback {i}"))
+        self.assertEqual(results, [0, "fallback 1", 2])
+        with self.assertRaises(ValueError):
+            asyncio.run(bounded_gather(factories))
+
+
+class CourseEnrichmentFanOutTests(SimpleTestCase):
+    def test_stale_courses_are_enriched_concurrently(self):
+        agent = ValidatedCourseAgent.__new__(ValidatedCourseAgent)
+        agent.config = ValidationConfigManager.get_default_config()
+        courses = [UdemyCourse(id=str(i), url=f"https://example.com/{i}") for i in range(3)]
+        docs = [
+            Document(page_content=f"Course {c.id}", metadata={"course_id": c.id, "url": c.url})
+            for c in courses
+        ]
+
+        def enrich(course):
+            time.sleep(0.2)
+            return {"highlights": [f"Learn {course.id}"], "related_topics": []}
+
+        with mock.patch(
+            "api.ai.validated_course_agent.load_course_enrichments", return_value=({}, courses)
+        ), mock.patch(
+            "api.ai.validated_course_agent.enrich_course", side_effect=enrich
+        ) as enrich_course, mock.patch("api.ai.validated_course_agent.skill_graph") as graph:
+            graph.equivalent_names.return_value = []
+            start = time.monotonic()
+            result = asyncio.run(agent._extract_course_information(docs, ["Python"], 3))
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(enrich_course.call_count, 3)
+        self.assertEqual(
+            [course["course_highlights"] for course in result],
+            [["Learn 0"], ["Learn 1"], ["Learn 2"]],
+        )
+
+
+class AnalysisJobStateTests(SimpleTestCase):
+    def _run(self, job, updated=1, handler=None):
+        handler = handler or mock.Mock(return_value={"ok": True})
+        with mock.patch.object(AnalysisJob, "objects") as objects, mock.patch(
+            "api.services.jobs.close_old_connections"
+        ), mock.patch.dict(jobs.JOB_HANDLERS, {AnalysisJob.KIND_RECOMMENDATIONS: handler}):
+            objects.filter.return_value.update.return_value = updated
+            objects.get.return_value = job
+            jobs.run_job(job.id)
+        return objects, handler
+
+    def _job(self):
+        return AnalysisJob(kind=AnalysisJob.KIND_RECOMMENDATIONS, payload={"skills": ["Python"]})
+
+    def test_pending_job_runs_to_success(self):
+        job = self._job()
+        with mock.patch.object(job, "save") as save:
+            objects, handler = self._run(job)
+        objects.filter.assert_called_once_with(id=job.id, status=AnalysisJob.STATUS_PENDING)
+        self.assertEqual(
+            objects.filter.return_value.update.call_args.kwargs["status"],
+            AnalysisJob.STATUS_RUNNING,
+        )
+        handler.assert_called_once_with({"skills": ["Python"]})
+        self.assertEqual(job.status, AnalysisJob.STATUS_SUCCEEDED)
+        self.assertEqual(job.result, {"ok": True})
+        self.assertIsNotNone(job.finished_at)
+        save.assert_called_once()
+
+    def test_handler_error_fails_the_job(self):
+        job = self._job()
+        with mock.patch.object(job, "save"):
+            self._run(job, handler=mock.Mock(side_effect=ValueError("boom")))
+        self.assertEqual(job.status, AnalysisJob.STATUS_FAILED)
+        self.assertEqual(job.error, "boom")
+
+    def test_job_claimed_elsewhere_is_not_run(self):
+        job = self._job()
+        _, handler = self._run(job, updated=0)
+        handler.assert_not_called()
+        self.assertEqual(job.status, AnalysisJob.STATUS_PENDING)
+
+    def test_orphans_are_jobs_of_other_boots(self):
+        with mock.patch.object(AnalysisJob, "objects") as objects:
+            objects.filter.return_value.exclude.return_value.update.return_value = 2
+            self.assertEqual(jobs.fail_orphaned_jobs("boot-2"), 2)
+        objects.filter.return_value.exclude.assert_called_once_with(boot_id="boot-2")
+        update = objects.filter.return_value.exclude.return_value.update.call_args.kwargs
+        self.assertEqual(update["status"], AnalysisJob.STATUS_FAILED)
+
+    def test_cleanup_is_scheduled_once_per_interval(self):
+        with mock.patch.object(jobs, "_last_cleanup", None), mock.patch.object(
+            jobs, "_submit"
+        ) as submit:
+            jobs._schedule_cleanup()
+            jobs._schedule_cleanup()
+        submit.assert_called_once_with(jobs._run_cleanup)
+
+    def test_task_exceptions_are_logged(self):
+        future = jobs.Future()
+        future.set_exception(RuntimeError("lost"))
+        with self.assertLogs("api.services.jobs", level="ERROR") as logs:
+            jobs._log_failure(future)
+        self.assertIn("lost", logs.output[0])
+
+
+class HybridSearchFusionTests(SimpleTestCase):
+    def _row(self, course_id, vector_rank, lexical_rank):
+        course = UdemyCourse(id=course_id, title=f"Course {course_id}", url=f"https://example.com/{course_id}")
+        course.vector_rank, course.lexical_rank = vector_rank, lexical_rank
+        course.rrf_score = sum(1.0 / (RRF_K + rank) for rank in (vector_rank, lexical_rank) if rank)
+        return course
+
+    def test_sql_sums_reciprocal_ranks_best_first(self):
+        sql = " ".join(HYBRID_SQL.split())
+        self.assertIn(
+            "COALESCE(1.0 / (%(rrf_k)s + v.rank), 0) + COALESCE(1.0 / (%(rrf_k)s + l.rank), 0) AS rrf_score",
+            sql,
+        )
+        self.assertIn("FULL OUTER JOIN lexical_hits", sql)
+        self.assertTrue(sql.endswith("ORDER BY rrf_score DESC LIMIT %(k)s"))
+
+    def test_results_keep_fused_order_and_ranks(self):
+        # Second in both rankings beats first in only one of them
+        rows = [self._row("both", 2, 2), self._row("vector", 1, None), self._row("lexical", None, 1)]
+        self.assertGreater(rows[0].rrf_score, rows[1].rrf_score)
+
+        with mock.patch.object(UdemyCourse, "objects") as objects, mock.patch(
+            "api.ai.hybrid_search.hnsw_ef_search"
+        ) as ef_search:
+            objects.raw.return_value = rows
+            results = hybrid_course_search("terraform", k=3, query_vector=[0.1, 0.2], candidates=2)
+
+        params = objects.raw.call_args.args[1]
+        self.assertEqual((params["candidates"], params["rrf_k"], params["k"]), (3, RRF_K, 3))
+        ef_search.assert_called_once_with(k=3, filtered=False)
+        self.assertEqual([doc.metadata["course_id"] for doc, _ in results], ["both", "vector", "lexical"])
+        self.assertEqual(
+            [(doc.metadata["vector_rank"], doc.metadata["lexical_rank"]) for doc, _ in results],
+            [(2, 2), (1, None), (None, 1)],
+        )
+        self.assertAlmostEqual(results[0][1], 2 / (RRF_K + 2))
+
+    def test_store_rejects_metadata_filters(self):
+        store = HybridCourseStore(embeddings=mock.Mock())
+        with mock.patch("api.ai.hybrid_search.hybrid_course_search", return_value=[]) as search:
+            for call in (
+                lambda: store.similarity_search("q", 3, filter={"level": "Beginner Level"}),
+                lambda: store.hybrid_search("q", 3, query_vector=[0.1], filter={"level": "x"}),
+                lambda: store.similarity_search_by_vector([0.1], 3, filter={"level": "x"}),
+            ):
+                with self.assertRaises(ValueError):
+                    call()
+            search.assert_not_called()
+
+            # Unknown keyword arguments are not forwarded to the search
+            store.similarity_search("q", 3, fetch_k=20)
+            self.assertNotIn("fetch_k", search.call_args.kwargs)
+
+
+class EfSearchTests(SimpleTestCase):
+    def test_limit_raises_ef_search(self):
+        with mock.patch.object(settings, "PGVECTOR_HNSW_EF_SEARCH", 40):
+            self.assertEqual(effective_ef_search(k=10), 40)
+            self.assertEqual(effective_ef_search(k=100), 100)
+            self.assertEqual(effective_ef_search(80, k=10), 80)
+
+    def test_filtered_queries_get_a_floor(self):
+        with mock.patch.object(settings, "PGVECTOR_HNSW_EF_SEARCH", 40), mock.patch.object(
+            settings, "PGVECTOR_HNSW_FILTERED_EF_SEARCH", 400
+        ):
+            self.assertEqual(effective_ef_search(k=5, filtered=True), 400)
+            self.assertEqual(effective_ef_search(k=200, filtered=True), 800)
+
+
+class RoleProfileTests(SimpleTestCase):
+    def test_title_variants_seed_one_cluster(self):
+        posts = [
+            ("IT", "Backend Developer"),
+            ("IT", "backend developer!"),
+            ("IT", "Back-end Developer"),
+            ("Design", "Graphic Designer"),
+        ]
+        embeddings = np.array([[1, 0], [1, 0], [0.8, 0.6], [0, 1]], dtype=np.float32)
+        self.assertEqual(cluster_job_posts(posts, embeddings), [[0, 1], [2], [3]])
+        # A looser threshold merges the similar seed into the largest cluster
+        self.assertEqual(cluster_job_posts(posts, embeddings, threshold=0.75), [[0, 1, 2], [3]])
+
+    def test_skill_support_counts_posts_not_mentions(self):
+        frequencies = skill_frequencies([
+            ["Python", "python", "Docker"],
+            ["Python", " Docker "],
+            ["PYTHON", "SQL", ""],
+        ])
+        self.assertEqual(frequencies, [("Python", 3), ("Docker", 2), ("SQL", 1)])
+
+    def _find(self, distance):
+        profile = mock.Mock(title="Backend Developer", distance=distance)
+        profile.skills.order_by.return_value = ["Python", "Docker"]
+        embeddings = mock.Mock()
+        embeddings.embed_query.return_value = [0.1, 0.2]
+        with mock.patch("api.ai.role_profiles.RoleProfile.objects") as objects, mock.patch(
+            "api.ai.role_profiles.hnsw_ef_search"
+        ):
+            objects.annotate.return_value.order_by.return_value.first.return_value = profile
+            return find_role_profile("backend engineer", embeddings, min_similarity=0.6)
+
+    def test_distant_profile_is_not_used(self):
+        self.assertIsNone(self._find(distance=0.5))
+        profile, skills = self._find(distance=0.3)
+        self.assertAlmostEqual(profile.similarity, 0.7)
+        self.assertEqual(skills, ["Python", "Docker"])
+
+    def test_share_and_support_reach_the_prompt(self):
+        self.assertEqual(
+            _role_skill_line({"name": "Docker", "share": 0.625, "support": 120}),
+            "- Docker (in 62% of the role's job posts, 120 posts)",
+        )
+        self.assertEqual(_role_skill_line({"name": "Docker"}), "- Docker")
+        self.assertEqual(_role_skill_line("Docker"), "- Docker")
+
+
+class SkillCanonicalizationTests(SimpleTestCase):
+    def test_nearest_match_keeps_the_names_own_vector(self):
+        nearest = mock.Mock(id="skill-1", distance=0.05, embedding=[1.0, 0.0])
+        nearest.name = "Node.js"
+        with mock.patch("api.ai.skill_canonicalization._nearest_skill", return_value=nearest), \
+                mock.patch("api.ai.skill_canonicalization.SkillAlias.objects") as aliases:
+            result = _resolve_unknown("NodeJS", "nodejs", [0.9, 0.1], threshold=0.9)
+
+        self.assertEqual((result.match, result.skill_id, result.canonical_name), ("nearest", "skill-1", "Node.js"))
+        self.assertEqual(result.embedding, [0.9, 0.1])
+        self.assertAlmostEqual(result.similarity, 0.95)
+        self.assertEqual(aliases.get_or_create.call_args.kwargs["defaults"]["embedding"], [0.9, 0.1])
+
+    def test_alias_hits_use_the_alias_embedding(self):
+        skill = SimpleNamespace(name="Node.js", embedding=[1.0, 0.0])
+        stored = SimpleNamespace(
+            normalized_name="nodejs", name="NodeJS", skill_id="skill-1", skill=skill,
+            similarity=0.95, embedding=[0.9, 0.1],
+        )
+        legacy = SimpleNamespace(
+            normalized_name="node", name="Node", skill_id="skill-1", skill=skill,
+            similarity=0.92, embedding=None,
+        )
+        with mock.patch("api.ai.skill_canonicalization.Skill.objects") as skills, \
+                mock.patch("api.ai.skill_canonicalization.SkillAlias.objects") as aliases:
+            skills.filter.return_value.exclude.return_value = []
+            aliases.filter.return_value.exclude.return_value.select_related.return_value = [stored, legacy]
+            known = _lookup_known(["nodejs", "node"])
+
+        self.assertEqual(known["nodejs"].embedding, [0.9, 0.1])
+        self.assertEqual(known["node"].embedding, [1.0, 0.0])
+        self.assertEqual(known["nodejs"].match, "alias")
+
+
+class SkillGraphTests(SimpleTestCase):
+    def test_top_k_matches_a_full_similarity_sort(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(50, 8)).astype(np.float32)
+        # block_size < n exercises the self-exclusion offset of later blocks
+        indices, similarities = top_k_neighbors(vectors, k=5, block_size=16)
+
+        unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        full = unit @ unit.T
+        np.fill_diagonal(full, -np.inf)
+        expected = np.argsort(-full, axis=1)[:, :5]
+        np.testing.assert_array_equal(indices, expected)
+        np.testing.assert_allclose(similarities, np.take_along_axis(full, expected, axis=1), rtol=1e-5)
+
+    def test_k_is_capped_and_zero_vectors_are_safe(self):
+        vectors = np.array([[1.0, 0.0], [0.0, 0.0], [0.6, 0.8]], dtype=np.float32)
+        indices, similarities = top_k_neighbors(vectors, k=10)
+        self.assertEqual(indices.shape, (3, 2))
+        self.assertFalse(np.isnan(similarities).any())
+        self.assertEqual(top_k_neighbors(vectors[:1], k=3)[0].shape, (1, 0))
+
+    def _graph(self):
+        graph = SkillGraph(ttl_seconds=10**9)
+        graph._neighbors = {
+            "python": {"django": 0.8, "flask": 0.7},
+            "django": {"python": 0.8, "flask": 0.75},
+            "flask": {"django": 0.75, "python": 0.7},
+            "cobol": {"fortran": 0.6},
+            "fortran": {"cobol": 0.6},
+        }
+        graph._loaded_at = time.monotonic()
+        return graph
+
+    def test_best_match_among_stored_neighbours(self):
+        graph = self._graph()
+        self.assertEqual(graph.best_match("python", ["flask", "django"]), (1, 0.8))
+        self.assertEqual(graph.best_match("python", ["cobol", "python"]), (1, 1.0))
+
+    def test_best_match_defers_when_not_exact(self):
+        graph = self._graph()
+        # Candidates outside the target's top-k are only known to be less similar
+        self.assertIsNone(graph.best_match("python", ["cobol", "fortran"]))
+        # Skills missing from the graph need embeddings
+        self.assertIsNone(graph.best_match("python", ["django", "rust"]))
+        self.assertIsNone(graph.best_match("python", ["django", None]))
+        self.assertIsNone(graph.best_match("rust", ["django"]))
+        self.assertIsNone(graph.best_match("python", []))
+
+
+class CourseCollectionSyncTests(SimpleTestCase):
+    def _sync(self, written, **kwargs):
+        from langchain_postgres.vectorstores import _get_embedding_collection_store
+
+        store = mock.MagicMock()
+        store.EmbeddingStore, _ = _get_embedding_collection_store(2)
+        session = store._make_sync_session.return_value.__enter__.return_value
+        session.execute.return_value.rowcount = 3
+        with mock.patch("api.ai.vector_stores.get_vector_store", return_value=store), mock.patch(
+            "api.ai.vector_stores.upsert_course_vectors", return_value=written
+        ), mock.patch("api.models.UdemyCourse.objects") as objects:
+            objects.filter.return_value.order_by.return_value.iterator.return_value = []
+            result = sync_course_collection(**kwargs)
+        return result, session
+
+    def test_prune_is_opt_in(self):
+        (written, deleted), session = self._sync(["1", "2"])
+        self.assertEqual((written, deleted), (2, 0))
+        session.execute.assert_not_called()
+
+    def test_prune_only_touches_course_rows(self):
+        from sqlalchemy.dialects import postgresql
+
+        (written, deleted), session = self._sync(["1", "2"], prune=True)
+        self.assertEqual((written, deleted), (2, 3))
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("langchain_pg_embedding.cmetadata ? ", sql)
+        self.assertIn("langchain_pg_embedding.id NOT IN", sql)
+
+    def test_nothing_is_pruned_without_written_courses(self):
+        (written, deleted), session = self._sync([], prune=True)
+        self.assertEqual((written, deleted), (0, 0))
+        session.execute.assert_not_called()
+
+
+class HalfvecBenchmarkTests(SimpleTestCase):
+    def _run(self, column_type):
+        from api.management.commands.benchmark_halfvec import Command
+
+        with mock.patch(
+            "api.management.commands.benchmark_halfvec.embedding_column_type", return_value=column_type
+        ), mock.patch.object(Command, "_benchmark") as benchmark, mock.patch.object(
+            Command, "_drop_copies"
+        ), mock.patch("sys.stderr"), mock.patch("sys.stdout"):
+            call_command("benchmark_halfvec", tables=["api_skill"])
+        return benchmark
+
+    def test_float32_tables_are_benchmarked(self):
+        self._run("vector(1536)").assert_called_once()
+        self._run("vector").assert_called_once()
+
+    def test_converted_tables_have_no_float32_baseline(self):
+        self._run("halfvec(1536)").assert_not_called()
+
+
+class VectorIndexReportTests(SimpleTestCase):
+    def test_report_covers_every_vector_table(self):
+        from io import StringIO
+
+        from api.management.commands.vector_index_report import Command
+
+        out = StringIO()
+        with mock.patch.object(Command, "_exists", return_value=False):
+            call_command("vector_index_report", stdout=out)
+        for label, table, _ in VECTOR_TABLES:
+            self.assertIn(f"{label}: table {table} not found", out.getvalue())
+        self.assertIn("api_roleprofile", out.getvalue())
@@ -5,7 +5,10 @@ from rest_framework.routers import DefaultRouter
 from api.views import (
     LearningPathAnalysisView,
     LearningPathViewSet,
+    SkillAnalysisStreamView,
     SkillAnalysisView,
+    courses,
+    jobs,
     recommendations,
     validation_metrics,
 )
@@ -26,8 +29,27 @@ urlpatterns = [
         LearningPathAnalysisView.as_view(),
         name="learning_paths_analytics",
     ),
+    path("courses/", courses.list_courses, name="courses"),
     path("schema/", SpectacularAPIView.as_view(), name="schema"),
     path("skill-analysis/", SkillAnalysisView.as_view(), name="skill-analysis"),
+    path(
+        "skill-analysis/stream",
+        SkillAnalysisStreamView.as_view(),
+        name="skill-analysis-stream",
+    ),
+    
+    # Background job endpoints
+    path(
+        "jobs/recommendations",
+        jobs.create_recommendation_job,
+        name="jobs_recommendations",
+    ),
+    path(
+        "jobs/skill-analysis",
+        jobs.create_skill_analysis_job,
+        name="jobs_skill_analysis",
+    ),
+    path("jobs/<uuid:job_id>", jobs.job_status, name="job_status"),
     
     # Validation endpoints
     path(
@@ -0,0 +1,113 @@
+import re
+from typing import Optional
+
+# Request level names -> UdemyCourse.level values
+COURSE_LEVELS = {
+    "all": "All Levels",
+    "beginner": "Beginner Level",
+    "intermediate": "Intermediate Level",
+    "expert": "Expert Level",
+}
+
+# Udemy exports durations as "2.5 total hours", "1 total hour" or "33 total mins";
+# practice tests are listed by size instead, e.g. "191 questions"
+_DURATION_RE = re.compile(r"([\d.]+)\s*(?:total\s+)?(hours?|hrs?|h\b|mins?|minutes?)", re.IGNORECASE)
+_QUESTIONS_RE = re.compile(r"(\d[\d,]*)\s*(?:practice\s+)?questions?", re.IGNORECASE)
+_NUMBER_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*$")
+
+# Study time assumed per practice-test question
+MINUTES_PER_QUESTION = 2
+# Fallback when a duration says nothing usable
+DEFAULT_STUDY_HOURS = 20
+
+
+def parse_duration_hours(duration: Optional[str]) -> Optional[float]:
+    """
+    Parse a course duration string into hours.
+
+    Args:
+        duration: e.g. "2.5 total hours", "33 total mins" or a bare number of hours
+
+    Returns:
+        Duration in hours, or None when the string is not a time
+        (e.g. practice tests listed as "191 questions")
+    """
+    text = duration or ""
+    bare = _NUMBER_RE.match(text)
+    if bare:
+        return round(float(bare.group(1)), 2)
+    match = _DURATION_RE.search(text)
+    if not match:
+        return None
+    try:
+        value = float(match.group(1))
+    except ValueError:
+        return None
+    if match.group(2).lower().startswith("m"):
+        value /= 60
+    return round(value, 2)
+
+
+def parse_question_count(duration: Optional[str]) -> Optional[int]:
+    """
+    Parse the size of a practice test, e.g. "191 questions" -> 191.
+
+    Returns:
+        Number of questions, or None when the string is not a question count
+    """
+    match = _QUESTIONS_RE.search(duration or "")
+    return int(match.group(1).replace(",", "")) if match else None
+
+
+def parse_price_vnd(price: Optional[str]) -> Optional[int]:
+    """
+    Parse a price string such as "1,150,000" into whole VND.
+
+    Returns:
+        The price, 0 for "Free", or None when no amount is present
+    """
+    text = (price or "").strip()
+    if text.lower() == "free":
+        return 0
+    # Drop a decimal fraction ("499000.00"); other separators group thousands
+    text = re.sub(r"[.,]\d{1,2}$", "", text)
+    digits = re.sub(r"[^\d]", "", text)
+    return int(digits) if digits else None
+
+
+def estimate_study_hours(
+    duration_hours: Optional[float] = None,
+    question_count: Optional[int] = None,
+    duration_text: str = "",
+) -> float:
+    """
+    Hours a learner needs for a course.
+
+    Uses the parsed columns when known and only falls back to reading the
+    free-text duration (including Coursera-style "3 weeks" / "1-3 months").
+
+    Args:
+        duration_hours: UdemyCourse.duration_hours
+        question_count: UdemyCourse.question_count
+        duration_text: Raw duration string
+
+    Returns:
+        Estimated study hours
+    """
+    if duration_hours is None and question_count is None and duration_text:
+        duration_hours = parse_duration_hours(duration_text)
+        question_count = parse_question_count(duration_text)
+    if duration_hours is not None:
+        return duration_hours
+    if question_count is not None:
+        return round(question_count * MINUTES_PER_QUESTION / 60, 2)
+
+    text = duration_text.strip().lower()
+    numbers = [int(x) for x in re.findall(r"(\d+)", text)]
+    if "less than" in text:
+        return 2
+    if "week" in text:
+        return (numbers[0] if numbers else 4) * 5
+    if "month" in text:
+        return (sum(numbers) / len(numbers) if numbers else 4) * 20
+    return DEFAULT_STUDY_HOURS
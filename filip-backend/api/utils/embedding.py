@@ -1,26 +1,498 @@
+import asyncio
+import hashlib
 import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
 
-from openai import AzureOpenAI
+import tiktoken
+from langchain_core.embeddings import Embeddings
 
+from api.utils.llm_clients import get_embedding_api_client, get_embeddings
 from filip import settings
 
-# Configure Azure OpenAI client
-client = AzureOpenAI(
-    api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-    api_version=settings.AZURE_OPENAI_API_VERSION,
-    azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
+logger = logging.getLogger(__name__)
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+_encoding = None
+_encoding_lock = threading.Lock()
+
+
+def _get_encoding():
+    """Load the cl100k_base tokenizer once; None if it is unavailable."""
+    global _encoding
+    if _encoding is None:
+        with _encoding_lock:
+            if _encoding is None:
+                try:
+                    _encoding = tiktoken.get_encoding("cl100k_base")
+                except Exception as e:
+                    logger.warning(f"tiktoken unavailable, estimating token counts: {e}")
+                    _encoding = False
+    return _encoding or None
+
+
+def _prepare_input(text: str) -> tuple[str, int]:
+    """Truncate a text to the model's input limit and return it with its token count."""
+    encoding = _get_encoding()
+    if encoding is None:
+        max_chars = settings.EMBEDDING_MAX_INPUT_TOKENS * 4
+        text = text[:max_chars]
+        return text, max(1, len(text) // 4)
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) > settings.EMBEDDING_MAX_INPUT_TOKENS:
+        tokens = tokens[: settings.EMBEDDING_MAX_INPUT_TOKENS]
+        text = encoding.decode(tokens)
+    return text, max(1, len(tokens))
+
+
+@dataclass
+class _PendingInput:
+    text: str
+    tokens: int
+    future: Future = field(default_factory=Future)
+
+
+class EmbeddingBatcher:
+    """
+    Cross-request micro-batcher for one embedding deployment.
+
+    Callers from any thread submit texts; a collector thread waits up to
+    EMBEDDING_BATCH_WINDOW_MS for more work to arrive and sends everything it
+    gathered as a single multi-input embeddings call, capped by
+    EMBEDDING_BATCH_MAX_INPUTS and EMBEDDING_BATCH_MAX_TOKENS. Batches are
+    dispatched on a small worker pool so collection never blocks on the API.
+    """
+
+    def __init__(self, deployment: str):
+        self.deployment = deployment
+        self.window = settings.EMBEDDING_BATCH_WINDOW_MS / 1000.0
+        self.max_inputs = settings.EMBEDDING_BATCH_MAX_INPUTS
+        self.max_tokens = settings.EMBEDDING_BATCH_MAX_TOKENS
+        self._queue: "queue.Queue[_PendingInput]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.EMBEDDING_BATCH_WORKERS,
+            thread_name_prefix=f"embed-{deployment}",
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "inputs": 0, "api_calls": 0}
+
+    def submit(self, texts: List[str]) -> List[Future]:
+        """Queue texts for embedding; each future resolves to one vector."""
+        self._ensure_started()
+        pending = []
+        for text in texts:
+            prepared, tokens = _prepare_input(text)
+            item = _PendingInput(prepared, tokens)
+            self._queue.put(item)
+            pending.append(item.future)
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["inputs"] += len(texts)
+        return pending
+
+    def embed(self, texts: List[str], timeout: Optional[float] = None) -> List[List[float]]:
+        """
+        Blocking helper: submit texts and wait for all their vectors.
+
+        Raises concurrent.futures.TimeoutError if they are not all back within
+        `timeout` seconds (default EMBEDDING_RESULT_TIMEOUT_SECONDS); the
+        unfinished inputs are cancelled.
+        """
+        futures = self.submit(texts)
+        deadline = time.monotonic() + (
+            settings.EMBEDDING_RESULT_TIMEOUT_SECONDS if timeout is None else timeout
+        )
+        try:
+            return [f.result(timeout=max(0.0, deadline - time.monotonic())) for f in futures]
+        except FutureTimeoutError:
+            for f in futures:
+                f.cancel()
+            raise
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["avg_batch_size"] = (
+            stats["inputs"] / stats["api_calls"] if stats["api_calls"] else 0.0
+        )
+        return stats
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._collect_loop,
+                    name=f"embed-batcher-{self.deployment}",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _collect_loop(self):
+        carry: Optional[_PendingInput] = None
+        while True:
+            first = carry or self._queue.get()
+            carry = None
+            batch = [first]
+            tokens = first.tokens
+            deadline = time.monotonic() + self.window
+
+            while len(batch) < self.max_inputs:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if tokens + item.tokens > self.max_tokens:
+                    carry = item
+                    break
+                batch.append(item)
+                tokens += item.tokens
+
+            try:
+                self._executor.submit(self._dispatch, batch)
+            except Exception as e:
+                logger.error(f"Could not dispatch embedding batch of {len(batch)} inputs: {e}")
+                self._fail(batch, e)
+
+    def _dispatch(self, batch: List[_PendingInput]):
+        try:
+            response = get_embedding_api_client().embeddings.create(
+                model=self.deployment,
+                input=[item.text for item in batch],
+            )
+            vectors = [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
+            if len(vectors) != len(batch):
+                raise RuntimeError(
+                    f"Embeddings API returned {len(vectors)} vectors for {len(batch)} inputs"
+                )
+            for item, vector in zip(batch, vectors):
+                # Skips inputs whose caller timed out and cancelled them
+                if not item.future.done():
+                    item.future.set_result(vector)
+        except Exception as e:
+            logger.error(f"Embedding batch of {len(batch)} inputs failed: {e}")
+            self._fail(batch, e)
+        finally:
+            with self._lock:
+                self._stats["api_calls"] += 1
+
+    @staticmethod
+    def _fail(batch: List[_PendingInput], error: Exception):
+        for item in batch:
+            if not item.future.done():
+                item.future.set_exception(error)
+
+
+_batchers: Dict[str, EmbeddingBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_batcher(deployment: str) -> EmbeddingBatcher:
+    """Get the shared micro-batcher for an embedding deployment."""
+    batcher = _batchers.get(deployment)
+    if batcher is None:
+        with _batchers_lock:
+            batcher = _batchers.setdefault(deployment, EmbeddingBatcher(deployment))
+    return batcher
+
+
+class BatchedEmbeddings(Embeddings):
+    """LangChain embeddings that send every request through the micro-batcher."""
+
+    def __init__(self, deployment: str):
+        self.deployment = deployment
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return get_batcher(self.deployment).embed(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        futures = get_batcher(self.deployment).submit(texts)
+        # On timeout wait_for cancels the gather, which cancels the queued inputs
+        return list(await asyncio.wait_for(
+            asyncio.gather(*(asyncio.wrap_future(f) for f in futures)),
+            timeout=settings.EMBEDDING_RESULT_TIMEOUT_SECONDS,
+        ))
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache: an in-process LRU in front of the
+    EmbeddingCacheEntry table, keyed by (model, sha256(text)).
+    """
+
+    def __init__(self, max_size: int, persist: bool = True):
+        self.max_size = max_size
+        self.persist = persist
+        self._lru: "OrderedDict[tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"lru_hits": 0, "db_hits": 0, "misses": 0, "db_errors": 0}
+
+    def get_many(self, model: str, hashes: List[str]) -> Dict[str, List[float]]:
+        """Look up vectors for the given hashes, LRU first, then Postgres."""
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for h in hashes:
+                vector = self._lru.get((model, h))
+                if vector is not None:
+                    self._lru.move_to_end((model, h))
+                    found[h] = vector
+            self._stats["lru_hits"] += len(found)
+
+        remaining = [h for h in hashes if h not in found]
+        if remaining and self.persist:
+            db_found = self._db_get_many(model, remaining)
+            found.update(db_found)
+            self._put_lru(model, db_found)
+            with self._lock:
+                self._stats["db_hits"] += len(db_found)
+
+        with self._lock:
+            self._stats["misses"] += len(set(hashes) - set(found))
+        return found
+
+    def set_many(self, model: str, vectors: Dict[str, List[float]]):
+        """Store freshly computed vectors in both tiers."""
+        self._put_lru(model, vectors)
+        if self.persist:
+            self._db_set_many(model, vectors)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["lru_size"] = len(self._lru)
+        lookups = stats["lru_hits"] + stats["db_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            (stats["lru_hits"] + stats["db_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    def _put_lru(self, model: str, vectors: Dict[str, List[float]]):
+        with self._lock:
+            for h, vector in vectors.items():
+                self._lru[(model, h)] = vector
+                self._lru.move_to_end((model, h))
+            while len(self._lru) > self.max_size:
+                self._lru.popitem(last=False)
+
+    def _db_get_many(self, model: str, hashes: List[str]) -> Dict[str, List[float]]:
+        from api.models import EmbeddingCacheEntry
+
+        try:
+            rows = EmbeddingCacheEntry.objects.filter(
+                model=model, text_hash__in=hashes
+            ).values_list("text_hash", "embedding")
+            return {h: [float(x) for x in vector] for h, vector in rows}
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            with self._lock:
+                self._stats["db_errors"] += 1
+            return {}
+
+    def _db_set_many(self, model: str, vectors: Dict[str, List[float]]):
+        from api.models import EmbeddingCacheEntry
+
+        try:
+            EmbeddingCacheEntry.objects.bulk_create(
+                [
+                    EmbeddingCacheEntry(model=model, text_hash=h, embedding=vector)
+                    for h, vector in vectors.items()
+                ],
+                batch_size=500,
+                ignore_conflicts=True,
+            )
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+            with self._lock:
+                self._stats["db_errors"] += 1
+
+
+embedding_cache = EmbeddingCache(
+    max_size=settings.EMBEDDING_CACHE_LRU_SIZE,
+    persist=settings.EMBEDDING_CACHE_PERSIST,
 )
 
-logger = logging.getLogger(__name__)
+
+class CachedEmbeddings(Embeddings):
+    """Drop-in LangChain embeddings wrapper that goes through embedding_cache."""
+
+    def __init__(self, embeddings: Embeddings, model: str):
+        self.embeddings = embeddings
+        self.model = model
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        hashes = [_text_hash(t) for t in texts]
+        found = embedding_cache.get_many(self.model, list(dict.fromkeys(hashes)))
+
+        missing: Dict[str, str] = {}
+        for text, h in zip(texts, hashes):
+            if h not in found:
+                missing[h] = text
+
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            embedding_cache.set_many(self.model, computed)
+            found.update(computed)
+
+        return [found[h] for h in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await asyncio.to_thread(self.embed_documents, texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await asyncio.to_thread(self.embed_query, text)
+
+
+class EmbeddingMemo(Embeddings):
+    """
+    Request-scoped text -> vector memo.
+
+    Every distinct string is embedded at most once for the lifetime of the
+    memo, so the same query can be used for retrieval, semantic validation
+    and skill matching without another lookup or API call.
+    """
+
+    def __init__(self, embeddings: Optional[Embeddings] = None):
+        self.embeddings = embeddings or get_embeddings()
+        self._vectors: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        with self._lock:
+            missing = [t for t in dict.fromkeys(texts) if t not in self._vectors]
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            vectors = self.embeddings.embed_documents(missing)
+            with self._lock:
+                self._vectors.update(zip(missing, vectors))
+
+        return [self._vectors[t] for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await asyncio.to_thread(self.embed_documents, texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await asyncio.to_thread(self.embed_query, text)
+
+    def stats(self) -> Dict[str, int]:
+        return {"texts": len(self._vectors), "hits": self.hits, "misses": self.misses}
+
+
+_current_memo: ContextVar[Optional[EmbeddingMemo]] = ContextVar(
+    "embedding_memo", default=None
+)
+
+
+@contextmanager
+def embedding_memo(embeddings: Optional[Embeddings] = None) -> Iterator[EmbeddingMemo]:
+    """
+    Open a request scope in which get_request_embeddings() shares one memo.
+
+    Nested scopes reuse the outer memo. The memo follows the context into
+    asyncio tasks, asyncio.to_thread and LangGraph node executors.
+    """
+    memo = _current_memo.get()
+    if memo is not None:
+        yield memo
+        return
+
+    memo = EmbeddingMemo(embeddings)
+    token = _current_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _current_memo.reset(token)
+
+
+def get_request_embeddings(deployment: Optional[str] = None) -> Embeddings:
+    """The active request memo, or the shared cached embeddings outside one."""
+    memo = _current_memo.get()
+    if memo is not None and deployment in (None, settings.AZURE_OPENAI_EMBEDDING_MODEL):
+        return memo
+    return get_embeddings(deployment)
+
+
+def embedding_cache_stats() -> Dict[str, float]:
+    """Hit/miss counters for the embedding cache."""
+    return embedding_cache.stats()
+
+
+def embedding_batcher_stats() -> Dict[str, Dict[str, float]]:
+    """Request/API-call counters for each deployment's micro-batcher."""
+    return {name: batcher.stats() for name, batcher in list(_batchers.items())}
+
+
+def embed_texts(texts: List[str], deployment: Optional[str] = None) -> List[List[float]]:
+    """
+    Embed many texts at once.
+
+    Cached vectors are returned directly; the rest are sent through the
+    micro-batcher, so concurrent callers share multi-input API calls.
+
+    Args:
+        texts: Texts to embed, in order
+        deployment: Azure embedding deployment, defaults to AZURE_OPENAI_EMBEDDING_MODEL
+
+    Returns:
+        One vector per input text, in the same order
+    """
+    return get_embeddings(deployment).embed_documents(texts)
+
+
+async def aembed_texts(
+    texts: List[str], deployment: Optional[str] = None
+) -> List[List[float]]:
+    """Async counterpart of embed_texts."""
+    return await get_embeddings(deployment).aembed_documents(texts)
 
 
 def embed_text(text: str) -> list[float] | None:
     try:
-        response = client.embeddings.create(
-            model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-            input=text,
-        )
-        return response.data[0].embedding
+        return get_embeddings().embed_query(text)
     except Exception as e:
         logger.error("Embedding failed for: %s\n%s", text[:100], e)
         return None
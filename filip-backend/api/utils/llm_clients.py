@@ -0,0 +1,127 @@
+"""
+Process-wide Azure OpenAI client registry.
+
+Chat and embedding clients are created once per (deployment, temperature) and
+share a single keep-alive HTTP connection pool, so every LLM hop reuses warm
+TLS connections instead of building a new client per call.
+"""
+
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+from langchain_core.embeddings import Embeddings
+from langchain_openai import AzureChatOpenAI
+from openai import AzureOpenAI
+
+from filip import settings
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_http_client: Optional[httpx.Client] = None
+_chat_clients: Dict[Tuple[str, float], AzureChatOpenAI] = {}
+_embedding_clients: Dict[str, Embeddings] = {}
+_embedding_api_client: Optional[AzureOpenAI] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared keep-alive HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        with _lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=settings.AZURE_OPENAI_MAX_CONNECTIONS,
+                        max_keepalive_connections=settings.AZURE_OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=settings.AZURE_OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+                    ),
+                    timeout=httpx.Timeout(settings.AZURE_OPENAI_TIMEOUT_SECONDS),
+                )
+    return _http_client
+
+
+def get_chat_llm(
+    temperature: float = 0.0, deployment: Optional[str] = None
+) -> AzureChatOpenAI:
+    """
+    Get the shared chat client for a deployment and temperature.
+
+    Args:
+        temperature: Sampling temperature
+        deployment: Azure chat deployment, defaults to AZURE_OPENAI_CHAT_MODEL
+
+    Returns:
+        A long-lived AzureChatOpenAI instance
+    """
+    deployment = deployment or settings.AZURE_OPENAI_CHAT_MODEL
+    key = (deployment, float(temperature))
+
+    llm = _chat_clients.get(key)
+    if llm is not None:
+        return llm
+
+    http_client = _get_http_client()
+    with _lock:
+        if key not in _chat_clients:
+            logger.debug(f"Creating chat client for {deployment} (temperature={temperature})")
+            _chat_clients[key] = AzureChatOpenAI(
+                model=deployment,
+                openai_api_version=settings.AZURE_OPENAI_API_VERSION,
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
+                api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
+                temperature=temperature,
+                http_client=http_client,
+            )
+        return _chat_clients[key]
+
+
+def get_embeddings(deployment: Optional[str] = None) -> Embeddings:
+    """
+    Get the shared LangChain embeddings client for a deployment.
+
+    Requests are served from the embedding cache where possible; misses go
+    through the deployment's micro-batcher, which merges concurrent callers
+    into multi-input API calls.
+
+    Args:
+        deployment: Azure embedding deployment, defaults to AZURE_OPENAI_EMBEDDING_MODEL
+
+    Returns:
+        A long-lived, cache-backed embeddings instance
+    """
+    from api.utils.embedding import BatchedEmbeddings, CachedEmbeddings
+
+    deployment = deployment or settings.AZURE_OPENAI_EMBEDDING_MODEL
+
+    embeddings = _embedding_clients.get(deployment)
+    if embeddings is not None:
+        return embeddings
+
+    with _lock:
+        if deployment not in _embedding_clients:
+            logger.debug(f"Creating embeddings client for {deployment}")
+            _embedding_clients[deployment] = CachedEmbeddings(
+                BatchedEmbeddings(deployment), model=deployment
+            )
+        return _embedding_clients[deployment]
+
+
+def get_embedding_api_client() -> AzureOpenAI:
+    """Get the shared raw OpenAI SDK client used for embedding calls."""
+    global _embedding_api_client
+    if _embedding_api_client is not None:
+        return _embedding_api_client
+
+    http_client = _get_http_client()
+    with _lock:
+        if _embedding_api_client is None:
+            _embedding_api_client = AzureOpenAI(
+                api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
+                api_version=settings.AZURE_OPENAI_API_VERSION,
+                azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
+                http_client=http_client,
+            )
+        return _embedding_api_client
@@ -0,0 +1,17 @@
+import re
+import unicodedata
+
+# Characters that carry meaning in skill names ("C++", "C#", ".NET", "Node.js", "CI/CD")
+_SEPARATORS_RE = re.compile(r"[^\w+#./]+")
+
+
+def normalize_skill_name(name: str) -> str:
+    """
+    Canonical lookup key for a skill name.
+
+    Case, accents, surrounding punctuation and whitespace differences are
+    ignored, so "Node.JS ", "node.js" and "Node.js" share one key.
+    """
+    text = unicodedata.normalize("NFKC", name or "").lower()
+    text = _SEPARATORS_RE.sub(" ", text)
+    return " ".join(text.split()).rstrip(".")
@@ -0,0 +1,145 @@
+import logging
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from django.db import connection, transaction
+
+from filip import settings
+
+logger = logging.getLogger(__name__)
+
+VECTOR_STORAGE_TYPES = ("vector", "halfvec")
+
+# (label, table, HNSW index) for every searched embedding column; all use
+# m=16, ef_construction=64 and cosine distance. Shared by convert_vector_storage,
+# benchmark_halfvec and vector_index_report.
+VECTOR_TABLES = [
+    ("UdemyCourse", "api_udemycourse", "udemycourse_embedding_hnsw"),
+    ("JobPost", "api_jobpost", "jobpost_embedding_hnsw"),
+    ("Skill", "api_skill", "skill_embedding_hnsw"),
+    ("Course", "api_course", "course_embedding_hnsw"),
+    ("RoleProfile", "api_roleprofile", "roleprofile_embedding_hnsw"),
+    ("LangChain", "langchain_pg_embedding", "langchain_pg_embedding_hnsw"),
+]
+
+
+def vector_type(storage: Optional[str] = None) -> str:
+    """Column type for embeddings, e.g. "halfvec(1536)", defaults to VECTOR_STORAGE"""
+    return f"{storage or settings.VECTOR_STORAGE}({settings.EMBEDDING_DIMENSIONS})"
+
+
+def vector_opclass(storage: Optional[str] = None) -> str:
+    """HNSW operator class for cosine distance on the given storage type"""
+    return f"{storage or settings.VECTOR_STORAGE}_cosine_ops"
+
+
+def hnsw_index_sql(table: str, index: str, storage: Optional[str] = None) -> str:
+    return (
+        f"CREATE INDEX IF NOT EXISTS {index} ON {table} "
+        f"USING hnsw (embedding {vector_opclass(storage)}) "
+        f"WITH (m = 16, ef_construction = 64)"
+    )
+
+
+# Typed column + HNSW index for LangChain's embedding table (see migration 0024)
+LANGCHAIN_HNSW_SQL = f"""
+ALTER TABLE langchain_pg_embedding
+    ALTER COLUMN embedding TYPE {vector_type()};
+{hnsw_index_sql("langchain_pg_embedding", "langchain_pg_embedding_hnsw")};
+"""
+
+
+def embedding_column_type(table: str, cursor=None) -> Optional[str]:
+    """Current type of table.embedding, e.g. "vector(1536)", or None if the table is missing"""
+    sql = (
+        "SELECT format_type(atttypid, atttypmod) FROM pg_attribute "
+        "WHERE attrelid = to_regclass(%s) AND attname = 'embedding' AND NOT attisdropped"
+    )
+    if cursor is None:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [table])
+            row = cursor.fetchone()
+    else:
+        cursor.execute(sql, [table])
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def convert_vector_storage(storage: Optional[str] = None, cursor=None) -> List[str]:
+    """
+    Rewrite every embedding column and its HNSW index to the given storage type.
+
+    Each table is converted in place with ALTER COLUMN ... USING, which
+    rewrites all rows (vector <-> halfvec casts are exact up to float16
+    rounding), and its HNSW index is rebuilt with the matching operator
+    class. Tables already in the target type or not created yet are skipped.
+
+    Args:
+        storage: "vector" (float32) or "halfvec" (float16), defaults to VECTOR_STORAGE
+        cursor: Database cursor to use inside the caller's transaction
+
+    Returns:
+        Names of the tables converted
+    """
+    storage = storage or settings.VECTOR_STORAGE
+    if storage not in VECTOR_STORAGE_TYPES:
+        raise ValueError(f"Unknown vector storage '{storage}', expected one of {VECTOR_STORAGE_TYPES}")
+    if cursor is None:
+        with transaction.atomic(), connection.cursor() as cursor:
+            return convert_vector_storage(storage, cursor)
+
+    converted = []
+    target = vector_type(storage)
+    for _, table, index in VECTOR_TABLES:
+        current = embedding_column_type(table, cursor)
+        if current is None or current == target:
+            continue
+        cursor.execute(f"DROP INDEX IF EXISTS {index}")
+        cursor.execute(
+            f"ALTER TABLE {table} ALTER COLUMN embedding TYPE {target} USING embedding::{target}"
+        )
+        cursor.execute(hnsw_index_sql(table, index, storage))
+        logger.info(f"Converted {table}.embedding from {current} to {target}")
+        converted.append(table)
+    return converted
+
+
+def effective_ef_search(
+    ef_search: Optional[int] = None, k: Optional[int] = None, filtered: bool = False
+) -> int:
+    """
+    HNSW ef_search for one query.
+
+    An HNSW scan returns at most ef_search rows, so it is raised to at least
+    the number of rows requested. Filtered queries lose the non-matching rows
+    after the scan and are raised to at least 4 * k and
+    PGVECTOR_HNSW_FILTERED_EF_SEARCH.
+    """
+    value = max(ef_search or settings.PGVECTOR_HNSW_EF_SEARCH, k or 0)
+    if filtered:
+        value = max(value, 4 * (k or 0), settings.PGVECTOR_HNSW_FILTERED_EF_SEARCH)
+    return value
+
+
+@contextmanager
+def hnsw_ef_search(
+    ef_search: Optional[int] = None, k: Optional[int] = None, filtered: bool = False
+) -> Iterator[None]:
+    """
+    Run the Django queries inside the block with a per-query hnsw.ef_search.
+
+    Uses SET LOCAL in a transaction, so the value never leaks to other
+    requests sharing the connection. Querysets must be evaluated inside
+    the block.
+
+    Args:
+        ef_search: Candidate list size, defaults to PGVECTOR_HNSW_EF_SEARCH
+        k: Number of rows the query returns (LIMIT)
+        filtered: The query has WHERE conditions besides the vector order
+    """
+    value = effective_ef_search(ef_search, k, filtered)
+    with transaction.atomic():
+        if value != settings.PGVECTOR_HNSW_EF_SEARCH:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT set_config('hnsw.ef_search', %s, true)", [str(value)])
+        yield
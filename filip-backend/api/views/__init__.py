@@ -8,6 +8,7 @@ from .learning_paths_list import LearningPathsListView
 from .learning_timeline import LearningTimelineView
 from .simple_learning_paths import SimpleLearningPathsView
 from .skill_analysis import SkillAnalysisView
+from .skill_analysis_stream import SkillAnalysisStreamView
 
 __all__ = [
     "GeneratePathView",
@@ -20,4 +21,5 @@ __all__ = [
     "LearningTimelineView",
     "SimpleLearningPathsView",
     "SkillAnalysisView",
+    "SkillAnalysisStreamView",
 ]
@@ -0,0 +1,68 @@
+import logging
+
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from api.ai.course_filters import CourseFilters
+from api.models.udemy import UdemyCourse
+from api.serializers.recommendation_request_serializer import CourseFiltersSerializer
+from api.services.course_catalog import COURSE_SORT_FIELDS, sort_courses
+
+logger = logging.getLogger(__name__)
+
+MAX_PAGE_SIZE = 100
+
+
+@extend_schema(
+    summary="List catalog courses",
+    description=(
+        "Filters Udemy courses by level, duration, price and provider and sorts them "
+        "by the parsed duration, price or question count columns."
+    ),
+    parameters=[
+        OpenApiParameter("levels", str, many=True, description="beginner, intermediate, expert or all"),
+        OpenApiParameter("max_duration_hours", float),
+        OpenApiParameter("max_price_vnd", int),
+        OpenApiParameter("provider", str),
+        OpenApiParameter("sort", str, enum=COURSE_SORT_FIELDS),
+        OpenApiParameter("limit", int, description=f"Page size, at most {MAX_PAGE_SIZE}"),
+        OpenApiParameter("offset", int),
+    ],
+)
+@api_view(["GET"])
+def list_courses(request):
+    params = request.query_params
+    filters_serializer = CourseFiltersSerializer(
+        data={
+            **{key: params[key] for key in ("max_duration_hours", "max_price_vnd", "provider") if key in params},
+            "levels": params.getlist("levels"),
+        }
+    )
+    if not filters_serializer.is_valid():
+        return Response({"error": "Invalid filters", "details": filters_serializer.errors}, status=400)
+
+    try:
+        limit = min(max(int(params.get("limit", 20)), 1), MAX_PAGE_SIZE)
+        offset = max(int(params.get("offset", 0)), 0)
+    except ValueError:
+        return Response({"error": "limit and offset must be integers"}, status=400)
+
+    queryset = UdemyCourse.objects.all()
+    filters = CourseFilters.from_dict(filters_serializer.validated_data)
+    if filters:
+        queryset = filters.apply(queryset)
+    queryset = sort_courses(queryset, params.get("sort"))
+
+    courses = queryset.values(
+        "id", "title", "level", "url", "instructors", "duration", "duration_hours",
+        "question_count", "price", "price_vnd", "provider",
+    )[offset:offset + limit]
+
+    logger.info(f"Course catalog query - filters: {filters}, sort: {params.get('sort')}, offset: {offset}")
+    return Response({
+        "count": queryset.count(),
+        "limit": limit,
+        "offset": offset,
+        "results": list(courses),
+    })
@@ -7,6 +7,7 @@ from rest_framework.views import APIView
 
 from api.models import Course, Skill
 from api.utils.embedding import embed_text
+from api.utils.vector_search import hnsw_ef_search
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +26,17 @@ def retrieve_courses_for_query(skills):
 
     # Optionally enforce that at least 1 matching skill is tagged
     matching_skills = Skill.objects.filter(name__in=skills)
-    if matching_skills.exists():
+    filtered = matching_skills.exists()
+    if filtered:
         queryset = queryset.filter(skills__in=matching_skills)
 
-    return queryset.annotate(
-        similarity=CosineDistance("embedding", user_vector)
-    ).order_by("similarity")[:5]
+    # Evaluated under the per-query ef_search so the HNSW scan returns enough rows
+    with hnsw_ef_search(k=5, filtered=filtered):
+        return list(
+            queryset.annotate(
+                similarity=CosineDistance("embedding", user_vector)
+            ).order_by("similarity")[:5]
+        )
 
 
 class GeneratePathView(APIView):
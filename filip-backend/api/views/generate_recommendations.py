@@ -7,6 +7,7 @@ from rest_framework.views import APIView
 
 from api.models import UdemyCourse
 from api.utils.embedding import embed_text
+from api.utils.vector_search import hnsw_ef_search
 from filip import settings
 
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
@@ -35,13 +36,14 @@ class GenerateRecommendationsView(APIView):
 
         # Step 2: Vector search with Django ORM
         logger.debug("Performing vector search in database")
-        courses = (
-            UdemyCourse.objects.annotate(
-                similarity=CosineDistance("embedding", embedding)
+        with hnsw_ef_search(k=30):
+            courses = list(
+                UdemyCourse.objects.annotate(
+                    similarity=CosineDistance("embedding", embedding)
+                )
+                .order_by("similarity")[:30]
+                .values_list("title", "description", "level", "url", "duration")
             )
-            .order_by("similarity")[:30]
-            .values_list("title", "description", "level", "url", "duration")
-        )
 
         logger.info(f"Found {len(courses)} relevant courses from vector search")
 
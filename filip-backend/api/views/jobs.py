@@ -0,0 +1,97 @@
+import logging
+from uuid import UUID, uuid4
+
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.decorators import api_view, parser_classes
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.response import Response
+
+from api.models import AnalysisJob
+from api.services import extract_text_from_file
+from api.serializers.recommendation_request_serializer import CourseFiltersSerializer
+from api.services.jobs import get_job, serialize_job, submit_job
+
+logger = logging.getLogger(__name__)
+
+
+@extend_schema(
+    summary="Queue a course recommendation job",
+    description="Accepts the same body as /learning-paths/recommendations and returns a job id to poll at /jobs/<id>.",
+)
+@api_view(["POST"])
+def create_recommendation_job(request):
+    skills = request.data.get("skills", [])
+    if not skills:
+        logger.warning("Recommendation job rejected: No skills provided")
+        return Response({"error": "No skills provided"}, status=400)
+
+    filters_serializer = CourseFiltersSerializer(data=request.data.get("filters") or {})
+    if not filters_serializer.is_valid():
+        logger.warning(f"Recommendation job rejected: Invalid filters {filters_serializer.errors}")
+        return Response({"error": "Invalid filters", "details": filters_serializer.errors}, status=400)
+
+    job = submit_job(
+        AnalysisJob.KIND_RECOMMENDATIONS,
+        {
+            "skills": skills,
+            "use_validation": request.data.get("use_validation", True),
+            "validation_mode": request.data.get("validation_mode", "comprehensive"),
+            "request_id": request.META.get("HTTP_X_REQUEST_ID", "unknown"),
+            "filters": filters_serializer.validated_data,
+        },
+    )
+    return Response(serialize_job(job), status=status.HTTP_202_ACCEPTED)
+
+
+@extend_schema(
+    summary="Queue a skill analysis job",
+    description="Accepts the same form as /skill-analysis/ and returns a job id to poll at /jobs/<id>.",
+)
+@api_view(["POST"])
+@parser_classes([MultiPartParser, FormParser, JSONParser])
+def create_skill_analysis_job(request):
+    provider = request.data.get("provider", "cv")
+
+    # The CV is read up front: uploaded files do not outlive the request
+    cv_text = None
+    if provider == "cv":
+        cv_file = request.FILES.get("cv_file")
+        if not cv_file:
+            logger.warning("Skill analysis job rejected: Missing CV file")
+            return Response(
+                {"error": "Missing 'cv_file' for CV provider."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            cv_text = extract_text_from_file(cv_file)
+        except Exception as e:
+            logger.error(f"CV text extraction failed: {str(e)}", exc_info=True)
+            return Response(
+                {"error": f"Failed to read CV file: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    job = submit_job(
+        AnalysisJob.KIND_SKILL_ANALYSIS,
+        {
+            "cv_text": cv_text,
+            "user_description": request.data.get("user_description", ""),
+            "timeline": request.data.get("timeline", "6-months"),
+            "project_requirements": request.data.get("project_requirements", ""),
+            "thread_id": request.data.get("thread_id", str(uuid4())),
+        },
+    )
+    return Response(serialize_job(job), status=status.HTTP_202_ACCEPTED)
+
+
+@extend_schema(
+    summary="Get a background job's status and result",
+    description="Returns status (pending, running, succeeded, failed) and, once finished, the result or error.",
+)
+@api_view(["GET"])
+def job_status(request, job_id: UUID):
+    job = get_job(job_id)
+    if job is None:
+        return Response({"error": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+    return Response(serialize_job(job))
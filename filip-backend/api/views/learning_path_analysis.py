@@ -1,12 +1,10 @@
 import json
 import logging
-import re
 from datetime import datetime, timedelta
 
 from drf_spectacular.utils import extend_schema
 from langchain.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_openai import AzureChatOpenAI
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -16,17 +14,12 @@ from api.serializers.learningpath_analytic_request_serializer import (
 from api.serializers.learningpath_analytic_response_serializer import (
     LearningPathAnalyticResponseSerializer,
 )
-from filip import settings
+from api.services.course_catalog import estimate_course_hours
+from api.utils.llm_clients import get_chat_llm
 
 logger = logging.getLogger(__name__)
 
-llm = AzureChatOpenAI(
-    openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-    azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-    api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-    model=settings.AZURE_OPENAI_CHAT_MODEL,
-    temperature=0.4,
-)
+llm = get_chat_llm(temperature=0.4)
 output_parser = StrOutputParser()
 prompt_template = ChatPromptTemplate.from_messages(
     [
@@ -39,24 +32,6 @@ prompt_template = ChatPromptTemplate.from_messages(
 )
 
 
-def estimate_hours(duration_str):
-    duration_str = duration_str.strip().lower()
-    match = re.findall(r"(\d+)", duration_str)
-    if "less than" in duration_str:
-        return 2
-    elif "hour" in duration_str:
-        return int(match[0]) if match else 2
-    elif "week" in duration_str:
-        weeks = int(match[0]) if match else 4
-        return weeks * 5
-    elif "month" in duration_str:
-        months = [int(x) for x in match]
-        avg_months = sum(months) / len(months) if months else 4
-        return avg_months * 20
-    else:
-        return 20
-
-
 def generate_feedback(input_summary):
     chain = prompt_template | llm | output_parser
     return chain.invoke({"input": input_summary})
@@ -90,10 +65,12 @@ class LearningPathAnalysisView(APIView):
             evaluated_courses = []
             total_required_hours = 0
 
-            for course in courses:
+            # Parsed duration columns for catalog courses, text parsing otherwise
+            course_hours = estimate_course_hours(courses)
+
+            for course, estimated_hours in zip(courses, course_hours):
                 title = course.get("title", "Untitled")
                 duration_str = course.get("duration", "")
-                estimated_hours = estimate_hours(duration_str)
 
                 evaluated_courses.append(
                     {
@@ -5,6 +5,8 @@ from rest_framework import status
 from uuid import uuid4
 import datetime
 
+from api.services.course_catalog import estimate_course_hours
+
 logger = logging.getLogger(__name__)
 
 class LearningPathInfoView(APIView):
@@ -21,7 +23,7 @@ class LearningPathInfoView(APIView):
             learning_path_id = str(uuid4())
             start_date = data.get("start_date")
             end_date = data.get("end_date")
-            estimated_hours = sum([float(c.get("duration", 0)) for c in courses])
+            estimated_hours = sum(estimate_course_hours(courses))
             completed_hours = sum([float(c.get("progress", 0)) for c in courses])
 
             logger.info(f"[LearningPathInfoView] Generated learning path ID: {learning_path_id}, estimated_hours: {estimated_hours}, completed_hours: {completed_hours}")
@@ -5,13 +5,14 @@ from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
-from api.ai.agent_rag_course import get_recommendations_for_skills, get_validated_recommendations_for_skills
 from api.serializers.recommendation_request_serializer import (
+    CourseFiltersSerializer,
     RecommendationRequestSerializer,
 )
 from api.serializers.recommendation_response_serializer import (
     RecommendationResponseSerializer,
 )
+from api.services.recommendations import recommend_courses_for_skills
 
 logger = logging.getLogger(__name__)
 
@@ -35,41 +36,21 @@ def recommend_courses(request):
         logger.warning("Course recommendation request failed: No skills provided")
         return Response({"error": "No skills provided"}, status=400)
 
+    filters_serializer = CourseFiltersSerializer(data=request.data.get("filters") or {})
+    if not filters_serializer.is_valid():
+        logger.warning(f"Course recommendation request failed: Invalid filters {filters_serializer.errors}")
+        return Response({"error": "Invalid filters", "details": filters_serializer.errors}, status=400)
+
     logger.info(f"Processing course recommendations for {len(skills)} skills (validation: {use_validation})")
     
     try:
-        # Use enhanced validation system if requested
-        if use_validation:
-            validation_config = {
-                "validation_mode": validation_mode,
-                "use_validation": use_validation
-            }
-            
-            result = get_validated_recommendations_for_skills(
-                skills=skills, 
-                use_enhanced_validation=True,
-                validation_config=validation_config
-            )
-            
-            # Log validation results
-            validation = result.get("validation", {})
-            if validation.get("is_valid", False):
-                logger.info(f"Course recommendation validation passed with score: {validation.get('overall_score', 0):.3f}")
-            else:
-                logger.warning(f"Course recommendation validation issues: {validation.get('reasons', [])}")
-        else:
-            # Use legacy system
-            result = get_recommendations_for_skills(skills)
-            logger.info("Using legacy recommendation system (validation disabled)")
-        
-        # Add response metadata
-        result["response_metadata"] = {
-            "validation_enabled": use_validation,
-            "validation_mode": validation_mode,
-            "enhanced_validation": result.get("enhanced_validation", False),
-            "course_count": len(result.get("courses", [])),
-            "request_id": request.META.get("HTTP_X_REQUEST_ID", "unknown")
-        }
+        result = recommend_courses_for_skills(
+            skills,
+            use_validation=use_validation,
+            validation_mode=validation_mode,
+            request_id=request.META.get("HTTP_X_REQUEST_ID", "unknown"),
+            filters=filters_serializer.validated_data,
+        )
         
         logger.info(f"Course recommendation completed successfully - returned {len(result.get('courses', []))} recommendations")
         return Response(result)
@@ -7,15 +7,15 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.request import MultiValueDict, Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from typing_extensions import Dict, TypedDict, cast
+from typing_extensions import TypedDict, cast
 
 from api.ai import run_skill_gap_pipeline
 from api.services import (
+    build_skill_analysis_response,
     extract_data_from_cv_text,
     extract_text_from_file,
     fetch_skills_from_akajob,
 )
-from api.types import LLMUsage
 
 logger = logging.getLogger(__name__)
 
@@ -30,30 +30,6 @@ class SkillAnalysisRequest(TypedDict):
     thread_id: str
 
 
-def _compute_total_llm_usage(
-    llm_usage: Dict[str, LLMUsage],
-) -> LLMUsage:
-    total: LLMUsage = {
-        "prompt_tokens": 0,
-        "completion_tokens": 0,
-        "total_tokens": 0,
-        "cost": 0.0,
-    }
-
-    # Sum values across all tool steps
-    for usage in llm_usage.values():
-        if isinstance(usage, dict):
-            total["prompt_tokens"] += usage.get("prompt_tokens", 0)
-            total["completion_tokens"] += usage.get("completion_tokens", 0)
-            total["total_tokens"] += usage.get("total_tokens", 0)
-            total["cost"] += usage.get("cost", 0.0)
-
-    # Round the cost for readability
-    total["cost"] = round(total["cost"], 6)
-
-    return total
-
-
 class SkillAnalysisView(APIView):
     parser_classes = [MultiPartParser, FormParser]
 
@@ -131,25 +107,11 @@ class SkillAnalysisView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        llm_usage = cv_result.get("llm_usage", {}) | skill_gap_result.get(
-            "llm_usage", {}
+        result = build_skill_analysis_response(
+            cv_result, dict(skill_gap_result), thread_id, user_description, timeline
         )
-
-        llm_usage["total"] = _compute_total_llm_usage(llm_usage)
         
         logger.info(f"Skill analysis request completed successfully - Thread ID: {thread_id}")
-        logger.debug(f"Total LLM usage: {llm_usage.get('total', {})}")
-
-        return Response(
-            {
-                "thread_id": thread_id,
-                "target_goal": user_description,
-                "timeline": timeline,
-                "education": cv_result.get("education", []),
-                "experience": cv_result.get("experience", {}),
-                "extracted_skills": cv_result.get("extracted_skills", []),
-                "skills_gap": skill_gap_result.get("recommended_skills", []),
-                "overall_score": skill_gap_result.get("overall_score", 0),
-                "llm_usage": llm_usage,
-            }
-        )
+        logger.debug(f"Total LLM usage: {result['llm_usage'].get('total', {})}")
+
+        return Response(result)
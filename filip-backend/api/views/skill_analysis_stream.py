@@ -0,0 +1,148 @@
+import json
+import logging
+import time
+from typing import Any, Dict, Iterator, Optional
+from uuid import uuid4
+
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.request import MultiValueDict, Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from typing_extensions import cast
+
+from api.ai import stream_skill_gap_pipeline
+from api.services import (
+    build_skill_analysis_response,
+    extract_data_from_cv_text,
+    extract_text_from_file,
+    fetch_skills_from_akajob,
+)
+
+from .skill_analysis import SkillAnalysisRequest
+
+logger = logging.getLogger(__name__)
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class SkillAnalysisStreamView(APIView):
+    """
+    Streaming variant of SkillAnalysisView.
+
+    Emits server-sent events as each stage finishes: "cv" once skills are
+    extracted, one event per skill-gap node (fetch_skills, enrich_skills,
+    compute_missing, recommend_skills) with its output, LLM usage and timing,
+    then "result" with the same payload SkillAnalysisView returns, or "error".
+    """
+
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request: Request):
+        logger.info(f"Streaming skill analysis request started - IP: {request.META.get('REMOTE_ADDR')}")
+
+        data = cast(SkillAnalysisRequest, request.data)
+        user_description = data.get("user_description", "")
+        timeline = data.get("timeline", "6-months")
+        provider = data.get("provider", "cv")
+        project_requirements = data.get("project_requirements", "")
+        thread_id = data.get("thread_id", str(uuid4()))
+
+        # The upload is read before streaming starts; the LLM extraction runs in the stream
+        cv_text = None
+        if provider == "cv":
+            cv_file = cast(MultiValueDict, request.FILES).get("cv_file")
+            if not cv_file:
+                logger.warning("Streaming skill analysis request failed: Missing CV file")
+                return Response(
+                    {"error": "Missing 'cv_file' for CV provider."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            try:
+                cv_text = extract_text_from_file(cv_file)
+            except Exception as e:
+                logger.error(f"CV text extraction failed: {str(e)}", exc_info=True)
+                return Response(
+                    {"error": f"Failed to read CV file: {str(e)}"},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                )
+
+        response = StreamingHttpResponse(
+            self._events(cv_text, user_description, timeline, project_requirements, thread_id),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def _events(
+        self,
+        cv_text: Optional[str],
+        user_description: str,
+        timeline: str,
+        project_requirements: str,
+        thread_id: str,
+    ) -> Iterator[str]:
+        try:
+            started = time.time()
+            cv_result = (
+                extract_data_from_cv_text(cv_text) if cv_text else fetch_skills_from_akajob()
+            )
+            yield _sse(
+                "cv",
+                {
+                    "thread_id": thread_id,
+                    "extracted_skills": cv_result.get("extracted_skills", []),
+                    "education": cv_result.get("education", []),
+                    "experience": cv_result.get("experience", {}),
+                    "llm_usage": cv_result.get("llm_usage", {}),
+                    "duration_seconds": time.time() - started,
+                },
+            )
+
+            final_state: Dict[str, Any] = {}
+            reported_steps: set = set()
+            for node, update, duration in stream_skill_gap_pipeline(
+                current_skills=[
+                    {
+                        "name": s.get("name", ""),
+                        "level": s.get("level", ""),
+                    }
+                    for s in cv_result.get("extracted_skills", [])
+                ],
+                target_goal=user_description,
+                timeline=timeline,
+                project_requirements=project_requirements,
+                thread_id=thread_id,
+            ):
+                final_state.update(update)
+
+                # llm_usage accumulates across nodes; report only this node's steps
+                usage = update.get("llm_usage") or {}
+                node_usage = {k: v for k, v in usage.items() if k not in reported_steps}
+                reported_steps.update(node_usage)
+
+                yield _sse(
+                    node,
+                    {
+                        "node": node,
+                        "output": {k: v for k, v in update.items() if k != "llm_usage"},
+                        "llm_usage": node_usage,
+                        "duration_seconds": duration,
+                    },
+                )
+
+            result = build_skill_analysis_response(
+                cv_result, final_state, thread_id, user_description, timeline
+            )
+            result["duration_seconds"] = time.time() - started
+            logger.info(f"Streaming skill analysis completed - Thread ID: {thread_id}")
+            yield _sse("result", result)
+
+        except Exception as e:
+            logger.error(f"Streaming skill analysis failed: {str(e)}", exc_info=True)
+            yield _sse("error", {"error": f"Skill analysis failed: {str(e)}"})
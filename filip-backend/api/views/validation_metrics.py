@@ -24,8 +24,9 @@ try:
         get_validation_config_for_request
     )
     from api.ai.agent_rag_course import get_validated_recommendations_for_skills
-    from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
-    from langchain_postgres.vectorstores import PGVector
+    from api.ai.vector_stores import get_course_store
+    from api.utils.embedding import embedding_batcher_stats, embedding_cache_stats
+    from api.utils.llm_clients import get_chat_llm, get_embeddings
     VALIDATION_AVAILABLE = True
 except ImportError as e:
     VALIDATION_AVAILABLE = False
@@ -92,7 +93,10 @@ def get_validation_metrics(request):
             "supported_modes": [mode.value for mode in ValidationMode],
             "default_mode": ValidationConfigManager.get_default_config().mode.value,
             "azure_openai_configured": _check_azure_config(),
-            "vector_store_configured": _check_vector_store_config()
+            "vector_store_configured": _check_vector_store_config(),
+            "embedding_cache": embedding_cache_stats(),
+            "embedding_batcher": embedding_batcher_stats(),
+            "validation_cache_backend": settings.VALIDATION_CACHE_BACKEND
         }
         
         return Response({
@@ -281,29 +285,22 @@ def test_validation(request):
         config = ValidationConfigManager.get_config(ValidationMode(validation_mode.lower()))
         
         # Initialize validation components
-        embeddings = AzureOpenAIEmbeddings(
-            openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-            model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-        )
-        
-        llm = AzureChatOpenAI(
-            model=settings.AZURE_OPENAI_CHAT_MODEL,
-            openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-            temperature=0,
-        )
+        embeddings = get_embeddings()
+        llm = get_chat_llm()
         
-        vectorstore = PGVector.from_existing_index(
-            embedding=embeddings,
-            connection=settings.PGVECTOR_CONNECTION,
-            collection_name="course",
-        )
+        vectorstore = get_course_store()
         
         # Create validator and run test
-        validator = ResponseValidator(embeddings, llm, vectorstore)
+        validator = ResponseValidator(
+            embeddings, llm, vectorstore,
+            timeout_seconds=config.validation_timeout_seconds,
+            parallel=config.enable_parallel_validation,
+            use_rubric=config.use_rubric_validator,
+            cache_ttl_seconds=(
+                config.cache_ttl_seconds if config.enable_validation_caching else None
+            ),
+            validation_mode=config.mode.value
+        )
         
         # Run validation asynchronously
         import asyncio
@@ -372,12 +369,7 @@ def _check_azure_openai_health() -> Dict[str, Any]:
             }
         
         # Test embeddings
-        embeddings = AzureOpenAIEmbeddings(
-            openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-            model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-        )
+        embeddings = get_embeddings()
         
         # Test with simple query
         test_embedding = embeddings.embed_query("test")
@@ -388,14 +380,7 @@ def _check_azure_openai_health() -> Dict[str, Any]:
             }
         
         # Test LLM
-        llm = AzureChatOpenAI(
-            model=settings.AZURE_OPENAI_CHAT_MODEL,
-            openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-            temperature=0,
-        )
-        
+        llm = get_chat_llm()
         test_response = llm.invoke("Say 'OK' if you can respond")
         if not test_response or not test_response.content:
             return {
@@ -426,18 +411,7 @@ def _check_vector_store_health() -> Dict[str, Any]:
                 "error": "Vector store not properly configured"
             }
         
-        embeddings = AzureOpenAIEmbeddings(
-            openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-            model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-        )
-        
-        vectorstore = PGVector.from_existing_index(
-            embedding=embeddings,
-            connection=settings.PGVECTOR_CONNECTION,
-            collection_name="course",
-        )
+        vectorstore = get_course_store()
         
         # Test search
         test_results = vectorstore.similarity_search("test query", k=1)
@@ -462,26 +436,10 @@ def _test_validation_core() -> Dict[str, Any]:
         test_query = "I want to learn Python programming"
         test_response = "Here are some Python courses for beginners"
         
-        embeddings = AzureOpenAIEmbeddings(
-            openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_EMBEDDING_API_KEY,
-            model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-        )
-        
-        llm = AzureChatOpenAI(
-            model=settings.AZURE_OPENAI_CHAT_MODEL,
-            openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_CHAT_API_KEY,
-            temperature=0,
-        )
+        embeddings = get_embeddings()
+        llm = get_chat_llm()
         
-        vectorstore = PGVector.from_existing_index(
-            embedding=embeddings,
-            connection=settings.PGVECTOR_CONNECTION,
-            collection_name="course",
-        )
+        vectorstore = get_course_store()
         
         validator = ResponseValidator(embeddings, llm, vectorstore)
         
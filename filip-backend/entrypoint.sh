@@ -5,6 +5,14 @@ set -e
 echo ">>> Running Django migrations..."
 poetry run python manage.py migrate
 
+echo ">>> Creating cache tables..."
+poetry run python manage.py createcachetable
+
+echo ">>> Cleaning up background jobs..."
+# Jobs queued under an earlier boot id lost their worker threads
+export JOB_BOOT_ID="$(cat /proc/sys/kernel/random/uuid)"
+poetry run python manage.py cleanup_jobs --orphaned
+
 echo ">>> Collect static files..."
 poetry run python manage.py collectstatic --noinput
 
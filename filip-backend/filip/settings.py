@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 import os
 from pathlib import Path
 from urllib.parse import quote_plus
+from uuid import uuid4
 
 import environ
 
@@ -42,6 +43,43 @@ AZURE_OPENAI_API_VERSION: str = env("AZURE_OPENAI_API_VERSION", default="2024-02
 AZURE_OPENAI_CHAT_MODEL: str = env("AZURE_OPENAI_CHAT_MODEL", default="")
 AZURE_OPENAI_EMBEDDING_MODEL: str = env("AZURE_OPENAI_EMBEDDING_MODEL", default="")
 
+# Shared HTTP connection pool used by every Azure OpenAI client (see api/utils/llm_clients.py)
+AZURE_OPENAI_MAX_CONNECTIONS: int = env.int("AZURE_OPENAI_MAX_CONNECTIONS", default=50)
+AZURE_OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = env.int(
+    "AZURE_OPENAI_MAX_KEEPALIVE_CONNECTIONS", default=20
+)
+AZURE_OPENAI_KEEPALIVE_EXPIRY_SECONDS: float = env.float(
+    "AZURE_OPENAI_KEEPALIVE_EXPIRY_SECONDS", default=60.0
+)
+AZURE_OPENAI_TIMEOUT_SECONDS: float = env.float("AZURE_OPENAI_TIMEOUT_SECONDS", default=60.0)
+
+# Embedding cache: in-process LRU in front of the api_embeddingcacheentry table
+EMBEDDING_CACHE_LRU_SIZE: int = env.int("EMBEDDING_CACHE_LRU_SIZE", default=20000)
+EMBEDDING_CACHE_PERSIST: bool = env.bool("EMBEDDING_CACHE_PERSIST", default=True)
+
+# Embedding micro-batcher: concurrent embedding requests are merged into one API call
+EMBEDDING_BATCH_WINDOW_MS: float = env.float("EMBEDDING_BATCH_WINDOW_MS", default=5.0)
+EMBEDDING_BATCH_MAX_INPUTS: int = env.int("EMBEDDING_BATCH_MAX_INPUTS", default=256)
+EMBEDDING_BATCH_MAX_TOKENS: int = env.int("EMBEDDING_BATCH_MAX_TOKENS", default=200000)
+EMBEDDING_BATCH_WORKERS: int = env.int("EMBEDDING_BATCH_WORKERS", default=4)
+EMBEDDING_MAX_INPUT_TOKENS: int = env.int("EMBEDDING_MAX_INPUT_TOKENS", default=8191)
+# Longest a caller waits for its vectors (the API call plus the client's retries)
+EMBEDDING_RESULT_TIMEOUT_SECONDS: float = env.float(
+    "EMBEDDING_RESULT_TIMEOUT_SECONDS", default=4 * AZURE_OPENAI_TIMEOUT_SECONDS
+)
+
+# CV cache: extracted text keyed by sha256(file bytes), LLM extraction by sha256(text)
+CV_CACHE_ENABLED: bool = env.bool("CV_CACHE_ENABLED", default=True)
+
+# Background jobs: in-process worker pool, results kept in api_analysisjob
+JOB_WORKERS: int = env.int("JOB_WORKERS", default=4)
+JOB_RESULT_TTL_SECONDS: int = env.int("JOB_RESULT_TTL_SECONDS", default=86400)
+JOB_MAX_RUNTIME_SECONDS: int = env.int("JOB_MAX_RUNTIME_SECONDS", default=600)
+JOB_CLEANUP_INTERVAL_SECONDS: int = env.int("JOB_CLEANUP_INTERVAL_SECONDS", default=3600)
+# Jobs left pending/running by an earlier boot are failed at startup (entrypoint.sh
+# exports a fresh id per container start; the default is unique per process)
+JOB_BOOT_ID: str = env.str("JOB_BOOT_ID", default=uuid4().hex)
+
 ALLOWED_HOSTS = [
     "127.0.0.1",
     "34.50.85.140",
@@ -111,6 +149,35 @@ POSTGRES_PASSWORD: str = env("POSTGRES_PASSWORD", default="postgres")  # type: i
 POSTGRES_HOST: str = env("POSTGRES_HOST", default="localhost")  # type: ignore
 POSTGRES_PORT: str = env("POSTGRES_PORT", default="5432")  # type: ignore
 
+# HNSW search breadth (pgvector default 40); higher = better recall, slower queries.
+# hnsw_ef_search() raises it per query, e.g. to at least the LIMIT.
+PGVECTOR_HNSW_EF_SEARCH: int = env.int("PGVECTOR_HNSW_EF_SEARCH", default=40)
+# Floor for queries with WHERE filters: HNSW drops non-matching rows after the
+# graph scan, so a selective filter needs many more candidates to fill the LIMIT
+PGVECTOR_HNSW_FILTERED_EF_SEARCH: int = env.int("PGVECTOR_HNSW_FILTERED_EF_SEARCH", default=400)
+EMBEDDING_DIMENSIONS: int = env.int("EMBEDDING_DIMENSIONS", default=1536)
+# Embedding column type: "vector" (float32) or "halfvec" (float16, half the table
+# and HNSW index size). Must match the columns; change it together with
+# `manage.py convert_vector_storage`, migrations never convert them.
+VECTOR_STORAGE: str = env("VECTOR_STORAGE", default="vector")
+
+# Course retrieval backend: "pgvector" (langchain_pg_embedding), "memory"
+# (memory-mapped numpy index built by build_course_index, shared by all workers)
+# or "hybrid" (full-text + vector search on api_udemycourse fused by RRF)
+COURSE_INDEX_BACKEND: str = env("COURSE_INDEX_BACKEND", default="pgvector")
+COURSE_INDEX_DIR: str = env("COURSE_INDEX_DIR", default=str(BASE_DIR / "var" / "course_index"))
+# Rows taken from each of the lexical and vector rankings before fusion
+HYBRID_SEARCH_CANDIDATES: int = env.int("HYBRID_SEARCH_CANDIDATES", default=50)
+
+# Skill canonicalisation: unknown skill names at least this similar to a Skill
+# are stored as its alias; less similar names become new Skill rows
+SKILL_ALIAS_THRESHOLD: float = env.float("SKILL_ALIAS_THRESHOLD", default=0.9)
+# Seconds before a process reloads the precomputed skill neighbour graph
+SKILL_GRAPH_TTL_SECONDS: int = env.int("SKILL_GRAPH_TTL_SECONDS", default=600)
+# A goal uses the nearest role profile only when it is at least this similar to
+# the profile's centroid; less similar goals fall back to the job post lookup
+ROLE_PROFILE_MIN_SIMILARITY: float = env.float("ROLE_PROFILE_MIN_SIMILARITY", default=0.5)
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -119,10 +186,37 @@ DATABASES = {
         "PASSWORD": POSTGRES_PASSWORD,
         "HOST": POSTGRES_HOST,
         "PORT": POSTGRES_PORT,
+        # Default HNSW candidate list size for every vector query on this connection
+        "OPTIONS": {"options": f"-c hnsw.ef_search={PGVECTOR_HNSW_EF_SEARCH}"},
     }
 }
 
 PGVECTOR_CONNECTION = f"postgresql+psycopg2://{POSTGRES_USER}:{quote_plus(POSTGRES_PASSWORD)}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+PGVECTOR_ASYNC_CONNECTION = f"postgresql+psycopg://{POSTGRES_USER}:{quote_plus(POSTGRES_PASSWORD)}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+PGVECTOR_POOL_SIZE: int = env.int("PGVECTOR_POOL_SIZE", default=5)
+PGVECTOR_MAX_OVERFLOW: int = env.int("PGVECTOR_MAX_OVERFLOW", default=10)
+PGVECTOR_POOL_RECYCLE_SECONDS: int = env.int("PGVECTOR_POOL_RECYCLE_SECONDS", default=1800)
+
+# Response validation: score the LLM rubrics in one structured-output call
+VALIDATION_USE_RUBRIC: bool = env.bool("VALIDATION_USE_RUBRIC", default=False)
+# Threads for blocking validator calls; a timed-out call keeps its thread until it returns
+DETACHED_CALL_WORKERS: int = env.int("DETACHED_CALL_WORKERS", default=32)
+
+# Validation result cache: "local" (per process) or "shared" (CACHES[VALIDATION_CACHE_ALIAS])
+VALIDATION_CACHE_BACKEND: str = env("VALIDATION_CACHE_BACKEND", default="local")
+VALIDATION_CACHE_ALIAS: str = "validation"
+VALIDATION_CACHE_MAX_ENTRIES: int = env.int("VALIDATION_CACHE_MAX_ENTRIES", default=1000)
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "validation": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "filip_validation_cache",
+        "OPTIONS": {"MAX_ENTRIES": VALIDATION_CACHE_MAX_ENTRIES * 10},
+    },
+}
 
 
 # Password validation